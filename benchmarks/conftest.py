@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import pytest
+
+from benchmarks.utils import BACKENDS
+
+pytest.importorskip("pytest_benchmark", reason="benchmarks require pytest-benchmark")
+
+
+def pytest_addoption(parser: pytest.Parser):
+    parser.addoption(
+        "--bench-cells",
+        default="10000",
+        help=(
+            "Comma-separated sizes (in cells) of the synthetic tables to benchmark "
+            "(e.g., 10000,100000,1000000)."
+        ),
+    )
+    parser.addoption(
+        "--bench-backends",
+        default=",".join(BACKENDS),
+        help="Comma-separated DataFrame backends to benchmark.",
+    )
+
+
+def pytest_configure(config: pytest.Config):
+    config.addinivalue_line(
+        "filterwarnings", "ignore:PyArrow Table support is currently experimental"
+    )
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc):
+    config = metafunc.config
+
+    if "backend" in metafunc.fixturenames:
+        backends = config.getoption("--bench-backends").split(",")
+        metafunc.parametrize("backend", backends)
+
+    if "n_cells" in metafunc.fixturenames:
+        sizes = [int(x) for x in config.getoption("--bench-cells").split(",")]
+        metafunc.parametrize("n_cells", sizes)
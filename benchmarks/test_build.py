@@ -0,0 +1,116 @@
+"""Benchmarks of building tables: creating them, and the work done by formatting and styling."""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+import pytest
+
+from benchmarks.utils import synthetic_frame
+from great_tables import GT, loc, style, vals
+
+# Each formatter, with the synthetic column it formats and its arguments
+FORMATTERS: dict[str, tuple[str, str, dict[str, Any]]] = {
+    "fmt": ("fmt", "str", {"fns": lambda x: f"<{x}>"}),
+    "fmt_number": ("fmt_number", "float", {"decimals": 2}),
+    "fmt_integer": ("fmt_integer", "int", {}),
+    "fmt_scientific": ("fmt_scientific", "float", {}),
+    "fmt_engineering": ("fmt_engineering", "float", {}),
+    "fmt_percent": ("fmt_percent", "pct", {}),
+    "fmt_partsper": ("fmt_partsper", "pct", {}),
+    "fmt_currency": ("fmt_currency", "float", {"currency": "EUR"}),
+    "fmt_roman": ("fmt_roman", "int", {}),
+    "fmt_bytes": ("fmt_bytes", "int", {}),
+    "fmt_duration": ("fmt_duration", "float", {"input_units": "seconds"}),
+    "fmt_date": ("fmt_date", "date", {"date_style": "wday_month_day_year"}),
+    "fmt_time": ("fmt_time", "time", {"time_style": "h_m_s_p"}),
+    "fmt_datetime": ("fmt_datetime", "datetime", {}),
+    "fmt_tf": ("fmt_tf", "bool", {"tf_style": "yes-no"}),
+    "fmt_markdown": ("fmt_markdown", "markdown", {}),
+    "fmt_units": ("fmt_units", "units", {}),
+    "fmt_image": ("fmt_image", "image", {}),
+    "fmt_icon": ("fmt_icon", "icon", {}),
+    "fmt_flag": ("fmt_flag", "flag", {}),
+    "fmt_nanoplot": ("fmt_nanoplot", "nanoplot", {}),
+    "sub_missing": ("sub_missing", "float", {}),
+    "sub_zero": ("sub_zero", "float", {}),
+    "sub_small_vals": ("sub_small_vals", "pct", {"threshold": 0.1}),
+}
+
+
+def test_gt_init(benchmark, backend: str, n_cells: int):
+    frame = synthetic_frame(backend, n_cells)
+
+    benchmark(GT, frame, rowname_col="row", groupname_col="group")
+
+
+@pytest.mark.parametrize("name", FORMATTERS)
+def test_formatter(benchmark, backend: str, n_cells: int, name: str):
+    method, column, kwargs = FORMATTERS[name]
+    gt = getattr(GT(synthetic_frame(backend, n_cells)), method)(columns=column, **kwargs)
+
+    benchmark(gt._build_data, "html")
+
+
+def test_formatter_all_columns(benchmark, backend: str, n_cells: int):
+    gt = GT(synthetic_frame(backend, n_cells))
+    for method, column, kwargs in FORMATTERS.values():
+        gt = getattr(gt, method)(columns=column, **kwargs)
+
+    benchmark(gt._build_data, "html")
+
+
+def test_data_color(benchmark, backend: str, n_cells: int):
+    gt = GT(synthetic_frame(backend, n_cells))
+
+    benchmark(gt.data_color, columns=["int", "float", "pct"], palette="viridis")
+
+
+def test_data_color_categorical(benchmark, backend: str, n_cells: int):
+    gt = GT(synthetic_frame(backend, n_cells))
+
+    benchmark(gt.data_color, columns="flag", palette="Set1")
+
+
+def test_tab_style_body(benchmark, backend: str, n_cells: int):
+    gt = GT(synthetic_frame(backend, n_cells))
+
+    benchmark(gt.tab_style, style.fill("lightblue"), loc.body())
+
+
+def test_tab_style_repeated(benchmark, backend: str, n_cells: int):
+    gt = GT(synthetic_frame(backend, n_cells))
+    rows = range(0, min(n_cells // 10, 1000))
+
+    def style_each_row() -> GT:
+        new_gt = gt
+        for row in rows:
+            new_gt = new_gt.tab_style(style.text(weight="bold"), loc.body(rows=[row]))
+        return new_gt
+
+    benchmark(style_each_row)
+
+
+def test_summary_rows(benchmark, backend: str, n_cells: int):
+    frame = synthetic_frame(backend, n_cells)
+    gt = GT(frame, rowname_col="row", groupname_col="group").cols_hide(["str", "markdown"])
+
+    fns: dict[str, Callable[..., Any]]
+    if backend == "pandas":
+        fns = {"Min": lambda df: df.min(numeric_only=True)}
+    elif backend == "polars":
+        import polars as pl
+
+        fns = {"Min": pl.col("int", "float", "pct").min()}
+    else:
+        pytest.skip(f"summary_rows() is not supported for {backend}")
+
+    benchmark(gt.summary_rows, fns=fns, fmt=vals.fmt_number)
+
+
+def test_cols_merge(benchmark, backend: str, n_cells: int):
+    gt = GT(synthetic_frame(backend, n_cells)).cols_merge(
+        ["str", "int", "float"], pattern="{0} ({1}, {2})"
+    )
+
+    benchmark(gt._build_data, "html")
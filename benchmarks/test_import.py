@@ -0,0 +1,37 @@
+"""Benchmarks of importing great_tables, in a fresh interpreter each time."""
+
+from __future__ import annotations
+
+import os
+
+from tests.test_import_time import _import_time_us, _run_python
+
+# Budget (in milliseconds) for the cumulative time of `import great_tables`, as reported by
+# `python -X importtime`. It can be raised on slow machines through an environment variable.
+IMPORT_TIME_BUDGET_MS = float(os.environ.get("GT_IMPORT_TIME_BUDGET_MS", 500))
+
+
+def test_import_great_tables(benchmark):
+    def import_time_ms() -> float:
+        proc = _run_python("import great_tables", "-X", "importtime")
+        return _import_time_us(proc.stderr, "great_tables") / 1000
+
+    times = []
+    benchmark.pedantic(lambda: times.append(import_time_ms()), rounds=10, iterations=1)
+
+    # the wall time includes starting the interpreter, so also report the time to import alone
+    benchmark.extra_info["import_time_ms"] = min(times)
+
+
+def test_import_time_budget():
+    # import once beforehand, so that the timed run uses compiled bytecode where possible
+    _run_python("import great_tables")
+
+    timings = [
+        _import_time_us(
+            _run_python("import great_tables", "-X", "importtime").stderr, "great_tables"
+        )
+        for _ in range(3)
+    ]
+
+    assert min(timings) / 1000 < IMPORT_TIME_BUDGET_MS
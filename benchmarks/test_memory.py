@@ -0,0 +1,76 @@
+"""Benchmarks of the memory allocated while building and rendering tables.
+
+Allocations are traced with `tracemalloc`, so the timings of these benchmarks are not comparable
+to the others. The peak and retained memory of each phase are stored in the `extra_info` of each
+benchmark (in bytes), and so end up in the saved JSON results.
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+from typing import Any, Callable
+
+import pytest
+
+from benchmarks.test_render import _formatted_gt
+from benchmarks.utils import synthetic_frame
+from great_tables import GT, loc, profile_memory, style
+from great_tables._tbl_data import cast_frame_to_string
+
+
+def _traced(fn: Callable[[], Any]) -> dict[str, int]:
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        res = fn()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del res
+
+    return {"peak_bytes": peak - start, "retained_bytes": current - start}
+
+
+@pytest.mark.parametrize("output", ["html", "latex"])
+def test_memory_render(benchmark, backend: str, n_cells: int, output: str):
+    gt = _formatted_gt(backend, n_cells)
+    if output == "latex":
+        gt = gt.cols_hide(["markdown", "units", "flag", "icon", "image", "nanoplot"])
+
+    # render once beforehand, so lazily imported modules don't count towards the first phase
+    profile_memory(gt, output)
+
+    profile = benchmark.pedantic(profile_memory, args=(gt, output), rounds=1, iterations=1)
+
+    benchmark.extra_info["peak_bytes"] = profile.peak_bytes
+    benchmark.extra_info["retained_bytes"] = profile.retained_bytes
+    benchmark.extra_info["phases"] = {
+        phase.path: {"peak_bytes": phase.peak_bytes, "retained_bytes": phase.retained_bytes}
+        for phase in profile.phases()
+    }
+
+
+def test_memory_cast_frame_to_string(benchmark, backend: str, n_cells: int):
+    frame = synthetic_frame(backend, n_cells)
+
+    res = benchmark.pedantic(
+        _traced, args=(lambda: cast_frame_to_string(frame),), rounds=1, iterations=1
+    )
+
+    benchmark.extra_info.update(res)
+
+
+def test_memory_tab_style_repeated(benchmark, backend: str, n_cells: int):
+    gt = GT(synthetic_frame(backend, n_cells))
+    rows = range(0, min(n_cells // 10, 1000))
+
+    def style_each_row() -> GT:
+        new_gt = gt
+        for row in rows:
+            new_gt = new_gt.tab_style(style.text(weight="bold"), loc.body(rows=[row]))
+        return new_gt
+
+    res = benchmark.pedantic(_traced, args=(style_each_row,), rounds=1, iterations=1)
+
+    benchmark.extra_info.update(res)
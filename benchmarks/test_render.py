@@ -0,0 +1,62 @@
+"""Benchmarks of rendering tables to HTML and LaTeX."""
+
+from __future__ import annotations
+
+import pytest
+
+from benchmarks.utils import DATASETS, dataset_frame, synthetic_frame
+from great_tables import GT, exibble, loc, style
+from great_tables._scss import compile_scss
+
+
+def _formatted_gt(backend: str, n_cells: int) -> GT:
+    return (
+        GT(synthetic_frame(backend, n_cells), rowname_col="row", groupname_col="group", id="bench")
+        .tab_header(title="Benchmark", subtitle="A synthetic table")
+        .tab_spanner("Numbers", columns=["int", "float", "pct"])
+        .fmt_integer(columns="int")
+        .fmt_number(columns="float", decimals=1)
+        .fmt_percent(columns="pct")
+        .fmt_date(columns="date")
+        .tab_style(style.text(weight="bold"), loc.body(columns="str"))
+        .tab_source_note("Source: synthetic data")
+    )
+
+
+def test_as_raw_html(benchmark, backend: str, n_cells: int):
+    gt = _formatted_gt(backend, n_cells)
+
+    benchmark(gt.as_raw_html)
+
+
+def test_as_raw_html_inline_css(benchmark, backend: str, n_cells: int):
+    pytest.importorskip("css_inline")
+    gt = _formatted_gt(backend, n_cells)
+
+    benchmark(gt.as_raw_html, inline_css=True)
+
+
+def test_as_latex(benchmark, backend: str, n_cells: int):
+    gt = (
+        GT(synthetic_frame(backend, n_cells))
+        .cols_hide(["markdown", "units", "flag", "icon", "image", "nanoplot"])
+        .fmt_integer(columns="int")
+        .fmt_number(columns="float", decimals=1)
+        .fmt_percent(columns="pct")
+        .fmt_date(columns="date")
+    )
+
+    benchmark(gt.as_latex)
+
+
+@pytest.mark.parametrize("dataset", DATASETS)
+def test_dataset_as_raw_html(benchmark, backend: str, dataset: str):
+    gt = GT(dataset_frame(backend, dataset), id="bench")
+
+    benchmark(gt.as_raw_html)
+
+
+def test_compile_scss(benchmark):
+    gt = GT(exibble)
+
+    benchmark(compile_scss, gt, id="bench", compress=False)
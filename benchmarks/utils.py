@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import datetime
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from great_tables._tbl_data import DataFrameLike
+
+BACKENDS = ["pandas", "polars", "pyarrow"]
+
+# Bundled datasets that are rendered as-is, across backends
+DATASETS = ["exibble", "gtcars", "sp500", "countrypops", "towny"]
+
+# The columns of the synthetic frames, with a column for each kind of value the formatters handle
+N_GROUPS = 10
+
+
+def _synthetic_columns(n_rows: int) -> dict[str, Any]:
+    rng = np.random.default_rng(42)
+    idx = np.arange(n_rows)
+
+    start = datetime.datetime(2020, 1, 1)
+    datetimes = [start + datetime.timedelta(minutes=int(x)) for x in rng.integers(0, 10**6, n_rows)]
+
+    return {
+        "group": [f"grp_{i % N_GROUPS}" for i in idx],
+        "row": [f"row_{i}" for i in idx],
+        "int": rng.integers(1, 3999, n_rows),
+        "float": rng.normal(0, 10_000, n_rows),
+        "pct": rng.uniform(0, 1, n_rows),
+        "str": [f"item {i}" for i in idx],
+        "bool": [
+            None if i % 10 == 0 else bool(x > 0.5) for i, x in zip(idx, rng.uniform(0, 1, n_rows))
+        ],
+        "date": [x.date() for x in datetimes],
+        "time": [x.time() for x in datetimes],
+        "datetime": datetimes,
+        "markdown": [f"**bold** and *italic* {i}" for i in idx],
+        "units": ["m^2 s^-1" for _ in idx],
+        "flag": [["US", "GB", "FR", "JP"][i % 4] for i in idx],
+        "icon": [["star", "circle", "check"][i % 3] for i in idx],
+        "image": [f"https://example.com/image_{i % 10}.png" for i in idx],
+        "nanoplot": [" ".join(str(x) for x in rng.integers(0, 100, 8)) for _ in idx],
+    }
+
+
+N_COLUMNS = len(_synthetic_columns(1))
+
+
+def convert(df: pd.DataFrame, backend: str) -> DataFrameLike:
+    """Convert a pandas DataFrame to the given backend."""
+
+    if backend == "pandas":
+        return df
+
+    if backend == "polars":
+        import polars as pl
+
+        return pl.from_pandas(df)
+
+    if backend == "pyarrow":
+        import pyarrow as pa
+
+        return pa.Table.from_pandas(df, preserve_index=False)
+
+    raise ValueError(f"Unknown backend: {backend}")
+
+
+@lru_cache(maxsize=None)
+def synthetic_frame(backend: str, n_cells: int) -> DataFrameLike:
+    """Return a frame of about `n_cells` cells, with a column for each kind of value."""
+
+    n_rows = max(n_cells // N_COLUMNS, 1)
+    df = pd.DataFrame(_synthetic_columns(n_rows))
+
+    return convert(df, backend)
+
+
+@lru_cache(maxsize=None)
+def dataset_frame(backend: str, name: str) -> DataFrameLike:
+    """Return one of the bundled datasets, converted to the given backend."""
+
+    from great_tables import data
+
+    return convert(getattr(data, name), backend)
@@ -1,15 +1,13 @@
-# Set version ----
-from importlib_metadata import version as _v
-
-__version__ = _v("great_tables")
-
-del _v
+from typing import TYPE_CHECKING
 
 # Main gt imports ----
 
 from .gt import GT
 from . import vals, loc, style
 from ._styles import FromColumn as from_column
+from ._spec import GTSpec
+from ._render_cache import RenderCache
+from ._profile import profile_memory, profile_render
 from ._helpers import (
     letters,
     LETTERS,
@@ -24,9 +22,21 @@ from ._helpers import (
     nanoplot_options,
 )
 
+if TYPE_CHECKING:
+    # resolved lazily through __getattr__ below
+    from ._export_session import ExportSession, gtsave_many
+
+    __version__: str
+
 
 __all__ = (
     "GT",
+    "GTSpec",
+    "RenderCache",
+    "profile_render",
+    "profile_memory",
+    "ExportSession",
+    "gtsave_many",
     "exibble",
     "letters",
     "LETTERS",
@@ -47,6 +57,20 @@ __all__ = (
 
 
 def __getattr__(k: str):
+    # resolving the installed version requires importlib_metadata, which is slow to import,
+    # so the version is looked up on first access and cached on the module
+    if k == "__version__":
+        from importlib_metadata import version
+
+        globals()["__version__"] = __version__ = version("great_tables")
+        return __version__
+
+    # batch export is only needed when saving images, and pulls in threading and queue machinery
+    if k in ("ExportSession", "gtsave_many"):
+        from . import _export_session
+
+        return getattr(_export_session, k)
+
     # exibble dataset available on top-level module, but is a pandas DataFrame.
     # Since pandas is an optional dependency, we import exibble dynamically.
     if k == "exibble":
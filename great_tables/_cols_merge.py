@@ -4,7 +4,7 @@ import re
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
-from ._tbl_data import Agnostic, _get_cell, _set_cell, is_na
+from ._tbl_data import Agnostic, ColumnValues, _set_cell, is_na
 
 if TYPE_CHECKING:
     from ._gt_data import Body, GTData
@@ -270,7 +270,7 @@ def merge_pattern(pattern: str, *values: Any) -> str:
     return info.merge(*normalized)
 
 
-def perform_col_merge(data: GTData) -> GTData:
+def perform_col_merge(data: GTData, source: ColumnValues | None = None) -> GTData:
     """Perform all column merge operations on the table data.
 
     This function processes all column merge operations registered on the GT object,
@@ -280,6 +280,9 @@ def perform_col_merge(data: GTData) -> GTData:
     ----------
     data
         The GTData object containing the table data and merge operations.
+    source
+        The cells of the table data, which may be shared with other build steps. By default,
+        they are pulled from `data._tbl_data` as needed.
 
     Returns
     -------
@@ -291,11 +294,15 @@ def perform_col_merge(data: GTData) -> GTData:
 
     new_body = data._body.copy()
 
+    if source is None:
+        source = ColumnValues(data._tbl_data)
+
     for col_merge in data._col_merge:
         new_body = _apply_single_col_merge(
             col_merge=col_merge,
             body=new_body,
             tbl_data=data._tbl_data,
+            source=source,
         )
 
     return data._replace(_body=new_body)
@@ -305,6 +312,7 @@ def _apply_single_col_merge(
     col_merge: ColMergeInfo,
     body: Body,
     tbl_data: TblData,
+    source: ColumnValues,
 ) -> Body:
     """Apply a single column merge operation to the body.
 
@@ -316,6 +324,8 @@ def _apply_single_col_merge(
         The body data to modify.
     tbl_data
         The original table data (for checking missing values).
+    source
+        The cells of `tbl_data`.
 
     Returns
     -------
@@ -334,6 +344,9 @@ def _apply_single_col_merge(
 
     target_column = col_merge.vars[0]
 
+    # only the target column is written to, and a row is read before it is written
+    formatted = ColumnValues(body.body)
+
     for row_idx in col_merge.rows:
         # For each column, get the display value and determine if it's truly missing.
         # A value is only considered missing if BOTH the body AND original are NA.
@@ -342,8 +355,8 @@ def _apply_single_col_merge(
         values: list[Any] = []
 
         for col_name in col_merge.vars:
-            formatted_value = _get_cell(body.body, row_idx, col_name)
-            original_value = _get_cell(tbl_data, row_idx, col_name)
+            formatted_value = formatted.get(row_idx, col_name)
+            original_value = source.get(row_idx, col_name)
 
             original_na = ColMergeInfo.replace_na(original_value, tbl_data=tbl_data)
             formatted_na = ColMergeInfo.replace_na(formatted_value, tbl_data=body.body)
@@ -366,7 +379,7 @@ def _apply_single_col_merge(
         elif col_merge.type == "merge_range":
             merged_value = _merge_range(values, col_merge.sep)
         elif col_merge.type == "merge_n_pct":
-            merged_value = _merge_n_pct(values, tbl_data, col_merge.vars, row_idx)
+            merged_value = _merge_n_pct(values, source, col_merge.vars, row_idx)
         else:
             merged_value = col_merge.merge(*values)
 
@@ -440,7 +453,7 @@ def _merge_range(values: list[Any], sep: str) -> str:
         return f"{col_begin}{sep}{col_end}"
 
 
-def _merge_n_pct(values: list[Any], tbl_data: TblData, vars: list[str], row_idx: int) -> str:
+def _merge_n_pct(values: list[Any], source: ColumnValues, vars: list[str], row_idx: int) -> str:
     """Apply count-and-percentage merge semantics.
 
     NA handling:
@@ -457,7 +470,7 @@ def _merge_n_pct(values: list[Any], tbl_data: TblData, vars: list[str], row_idx:
         return ""
 
     # Check if the original value of col_n is zero
-    original_n = _get_cell(tbl_data, row_idx, vars[0])
+    original_n = source.get(row_idx, vars[0])
     try:
         if float(original_n) == 0:
             return str(col_n)
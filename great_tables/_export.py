@@ -3,32 +3,29 @@ from __future__ import annotations
 import tempfile
 import time
 import warnings
-import webbrowser
 from functools import partial
-from http.server import HTTPServer, SimpleHTTPRequestHandler
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal
+from typing import IO, TYPE_CHECKING, Callable, Iterable, Iterator, Literal, cast, overload
 
 from typing_extensions import TypeAlias
 
 from ._helpers import random_id
+from ._profile import span
 from ._scss import compile_scss
 from ._utils import _try_import
-from ._utils_render_latex import _render_as_latex
 
 if TYPE_CHECKING:
     # Note that as_raw_html uses methods on the GT class, not just data
+    from http.server import HTTPServer
+
     from IPython.core.interactiveshell import InteractiveShell
     from selenium import webdriver
 
+    from ._render_cache import RenderCache
     from ._types import GTSelf
     from .gt import GT
 
 
-class PatchedHTTPRequestHandler(SimpleHTTPRequestHandler):
-    """Patched handler, which does not log requests to stderr"""
-
-
 class MISSING:
     """Represent a missing argument (where None has a special meaning)."""
 
@@ -36,6 +33,12 @@ class MISSING:
 def _create_temp_file_server(fname: Path) -> HTTPServer:
     """Return a HTTPServer, so we can serve a single request (to show the table)."""
 
+    # http.server is only needed by GT.show(), and is slow to import
+    from http.server import HTTPServer, SimpleHTTPRequestHandler
+
+    class PatchedHTTPRequestHandler(SimpleHTTPRequestHandler):
+        """Patched handler, which does not log requests to stderr"""
+
     Handler = partial(PatchedHTTPRequestHandler, directory=str(fname.parent))
     server = HTTPServer(("127.0.0.1", 0), Handler)
 
@@ -113,6 +116,8 @@ def show(
             html, raw=True, metadata={"text/html": {"isolated": True}}
         )
     elif target == "browser":
+        import webbrowser
+
         html = self.as_raw_html(make_page=True)
         with tempfile.TemporaryDirectory() as tmp_dir:
             f_path = Path(tmp_dir) / "index.html"
@@ -126,12 +131,46 @@ def show(
         raise Exception(f"Unknown target display: {target}")
 
 
+HtmlCompression: TypeAlias = Literal["gzip", "zstd", "br"]
+
+
+@overload
 def as_raw_html(
     self: GT,
-    inline_css: bool = False,
+    inline_css: bool | Literal["native"] = False,
     make_page: bool = False,
     all_important: bool = False,
-) -> str:
+    intern_styles: bool = False,
+    prune_css: bool = False,
+    compression: None = None,
+    cache: RenderCache | None = None,
+) -> str: ...
+
+
+@overload
+def as_raw_html(
+    self: GT,
+    inline_css: bool | Literal["native"] = False,
+    make_page: bool = False,
+    all_important: bool = False,
+    intern_styles: bool = False,
+    prune_css: bool = False,
+    *,
+    compression: HtmlCompression,
+    cache: RenderCache | None = None,
+) -> bytes: ...
+
+
+def as_raw_html(
+    self: GT,
+    inline_css: bool | Literal["native"] = False,
+    make_page: bool = False,
+    all_important: bool = False,
+    intern_styles: bool = False,
+    prune_css: bool = False,
+    compression: HtmlCompression | None = None,
+    cache: RenderCache | None = None,
+) -> str | bytes:
     """
     Get the HTML content of a GT object.
 
@@ -151,7 +190,13 @@ def as_raw_html(
     inline_css
         If `True`, all CSS styles are inlined into the HTML elements as `style` attributes.
         This is essential for email clients, which often strip out `<style>` blocks but preserve
-        inline styles.
+        inline styles. By default, inlining is performed by the `css-inline` package. Using
+        `"native"` instead writes the styles to the elements as the table is rendered, which is
+        faster (and doesn't require `css-inline` to be installed). Note that native inlining only
+        applies rules to the elements that Great Tables creates (and not, e.g., to the `<p>`
+        elements of formatted Markdown), and that CSS rules in `tab_options(table_additional_css=)`
+        with selectors other than tag names, classes, the table id, `:first-child`, and
+        `:last-child` (joined by descendant or child combinators) are skipped.
     make_page
         If `True`, the table will be wrapped in a complete HTML page with proper `<html>`, `<head>`,
         and `<body>` tags. This is useful when you want to display the table in a web browser or
@@ -159,12 +204,36 @@ def as_raw_html(
     all_important
         If `True`, all CSS declarations are marked with `!important` to ensure they take precedence
         over other styles that might be present in the document.
+    intern_styles
+        If `True`, inline `style` attributes on the cells of the table body (including the stub
+        and summary rows) are replaced by generated CSS classes, with one class per distinct set
+        of style declarations. For tables where many cells share
+        the same styling (e.g., after `tab_style()` or `data_color()` on large tables), this can
+        considerably reduce the size of the HTML output. This option is ignored when
+        `inline_css=True`, since that output requires styles to be placed on the elements.
+    prune_css
+        If `True`, the CSS in the `<style>` block only contains the rules that can apply to the
+        elements and classes present in the table. Rules for table parts that weren't used (e.g.,
+        summary rows, footnotes, or spanners) are left out, which makes the output of simple tables
+        much smaller. Any CSS supplied through `tab_options(table_additional_css=)` is always kept.
+    compression
+        If provided, the HTML is encoded as UTF-8 and compressed, and the method returns `bytes`
+        instead of a string. Use `"gzip"` for gzip compression (available in the standard library),
+        `"zstd"` for Zstandard compression (this requires Python 3.14 or the `zstandard` package),
+        or `"br"` for Brotli compression (this requires the `brotli` package). The compressor is fed
+        as the table is rendered, so the complete uncompressed HTML is not held in memory (except
+        when using any of the `inline_css=`, `intern_styles=`, or `prune_css=` options, which need
+        the entire table to do their work).
+    cache
+        A [`RenderCache`](`great_tables.RenderCache`) to look up the rendered HTML in, and store it
+        to. When the same table (with the same data) was already rendered with the same options,
+        the stored HTML is returned without rendering the table again.
 
     Returns
     -------
-    str
+    str | bytes
         An HTML string containing the table. The format depends on the parameters passed to the
-        method.
+        method. If `compression=` is used, the compressed HTML is returned as `bytes`.
 
     Examples:
     ------
@@ -226,38 +295,138 @@ def as_raw_html(
     ```
     """
 
+    if isinstance(inline_css, str) and inline_css != "native":
+        raise ValueError(f'`inline_css=` must be a boolean or `"native"`, not {inline_css!r}.')
+
+    render_args = dict(
+        inline_css=inline_css,
+        make_page=make_page,
+        all_important=all_important,
+        intern_styles=intern_styles,
+        prune_css=prune_css,
+    )
+
+    if cache is not None:
+        html = cache._get_or_render(
+            self, "html", lambda: "".join(_iter_raw_html_chunks(self, **render_args)), **render_args
+        )
+        chunks: Iterable[str] = [html]
+    else:
+        chunks = _iter_raw_html_chunks(self, **render_args)
+
+    if compression is None:
+        return "".join(chunks)
+
+    return b"".join(_compress_chunks((chunk.encode("utf-8") for chunk in chunks), compression))
+
+
+def _iter_raw_html_chunks(
+    self: GT,
+    inline_css: bool | Literal["native"] = False,
+    make_page: bool = False,
+    all_important: bool = False,
+    intern_styles: bool = False,
+    prune_css: bool = False,
+) -> Iterator[str]:
     built_table = self._build_data(context="html")
 
-    table_html = built_table._render_as_html(
+    table_chunks = built_table._iter_html_chunks(
         make_page=make_page,
         all_important=all_important,
+        intern_styles=intern_styles and not inline_css,
+        prune_css=prune_css,
+        inline_css=inline_css == "native",
     )
 
-    if inline_css:
-        _try_import(name="css_inline", pip_install_line="pip install css-inline")
-        from css_inline import inline, inline_fragment
+    if not inline_css or inline_css == "native":
+        yield from table_chunks
+        return
+
+    table_html = "".join(table_chunks)
 
-        if make_page:
-            return inline(html=table_html)
+    _try_import(name="css_inline", pip_install_line="pip install css-inline")
+    from css_inline import inline, inline_fragment
 
+    if make_page:
+        with span("inline_css"):
+            inlined = inline(html=table_html)
+
+        yield inlined
+
+    else:
+        # Obtain the `table_id` value from the Options (might be set, might be None)
+        table_id = self._options.table_id.value
+
+        if table_id is None:
+            id = random_id()
         else:
-            # Obtain the `table_id` value from the Options (might be set, might be None)
-            table_id = self._options.table_id.value
+            id = table_id
+
+        # Compile the SCSS as CSS
+        table_css = compile_scss(self, id=id, compress=False, all_important=all_important)
+
+        with span("inline_css"):
+            inlined = inline_fragment(html=table_html, css=table_css)
+
+        yield inlined
+
+
+def _get_compressor(
+    compression: HtmlCompression,
+) -> tuple[Callable[[bytes], bytes], Callable[[], bytes]]:
+    """Return `compress` and `flush` functions for an incremental compressor."""
+
+    if compression == "gzip":
+        import zlib
+
+        # Using `wbits=31` produces output with a gzip header and trailer
+        compressor = zlib.compressobj(wbits=31)
+        return compressor.compress, compressor.flush
+
+    if compression == "zstd":
+        try:
+            # Python 3.14+ includes Zstandard compression in the standard library
+            from compression import zstd  # type: ignore[import-not-found]
 
-            if table_id is None:
-                id = random_id()
-            else:
-                id = table_id
+            compressor = zstd.ZstdCompressor()
+        except ImportError:
+            zstandard = _try_import(name="zstandard", pip_install_line="pip install zstandard")
+            compressor = zstandard.ZstdCompressor().compressobj()
 
-            # Compile the SCSS as CSS
-            table_css = compile_scss(self, id=id, compress=False, all_important=all_important)
+        return compressor.compress, compressor.flush
 
-            return inline_fragment(html=table_html, css=table_css)
+    if compression == "br":
+        brotli = _try_import(name="brotli", pip_install_line="pip install brotli")
 
-    return table_html
+        compressor = brotli.Compressor()
+        return compressor.process, compressor.finish
 
+    raise ValueError(f'`compression=` must be one of "gzip", "zstd", or "br", not {compression!r}.')
 
-def as_latex(self: GT, use_longtable: bool = False, tbl_pos: str | None = None) -> str:
+
+def _compress_chunks(chunks: Iterable[bytes], compression: HtmlCompression) -> Iterator[bytes]:
+    """Compress a stream of bytes incrementally, yielding the compressed output as it's produced."""
+
+    # Set up the compressor eagerly so that an invalid `compression=` value is raised right away
+    compress, flush = _get_compressor(compression)
+
+    def _compressed() -> Iterator[bytes]:
+        for chunk in chunks:
+            compressed = compress(chunk)
+            if compressed:
+                yield compressed
+
+        yield flush()
+
+    return _compressed()
+
+
+def as_latex(
+    self: GT,
+    use_longtable: bool = False,
+    tbl_pos: str | None = None,
+    cache: RenderCache | None = None,
+) -> str:
     """
     Output a GT object as LaTeX
 
@@ -282,6 +451,9 @@ def as_latex(self: GT, use_longtable: bool = False, tbl_pos: str | None = None)
         table will be placed at the top of the page; if in the Quarto render then the table
         positioning option will be ignored in favor of any setting within the Quarto rendering
         environment.
+    cache
+        A [`RenderCache`](`great_tables.RenderCache`) to look up the rendered LaTeX in, and store
+        it to.
 
     Returns
     -------
@@ -343,11 +515,20 @@ def as_latex(self: GT, use_longtable: bool = False, tbl_pos: str | None = None)
     The LaTeX string contains the code just for the table (it's not a complete LaTeX document).
     This output can be useful for embedding a GT table in an existing LaTeX document.
     """
-    built_table = self._build_data(context="latex")
+    from ._utils_render_latex import _render_as_latex
 
-    latex_table = _render_as_latex(data=built_table, use_longtable=use_longtable, tbl_pos=tbl_pos)
+    def render() -> str:
+        built_table = self._build_data(context="latex")
+
+        with span("render_latex"):
+            return _render_as_latex(data=built_table, use_longtable=use_longtable, tbl_pos=tbl_pos)
+
+    if cache is not None:
+        return cache._get_or_render(
+            self, "latex", render, use_longtable=use_longtable, tbl_pos=tbl_pos
+        )
 
-    return latex_table
+    return render()
 
 
 # Create a list of all selenium webdrivers
@@ -584,12 +765,15 @@ def _dump_debug_screenshot(driver, path):
 
 def write_raw_html(
     gt: GT,
-    filename: str | Path,
+    filename: str | Path | IO[bytes],
     encoding: str = "utf-8",
-    inline_css: bool = False,
+    inline_css: bool | Literal["native"] = False,
     newline: str | None = None,
     make_page: bool = False,
     all_important: bool = False,
+    intern_styles: bool = False,
+    prune_css: bool = False,
+    compression: HtmlCompression | None = None,
 ) -> None:
     """
     Write the table to an HTML file.
@@ -602,15 +786,33 @@ def write_raw_html(
     gt
         A GT object.
     filename
-        The name of the file to save the HTML. Can be a string or a `pathlib.Path` object.
+        The name of the file to save the HTML. Can be a string or a `pathlib.Path` object. A binary
+        file-like object (e.g., an open file or an `io.BytesIO` buffer) can also be used, in which
+        case the encoded HTML is written to it.
     encoding
         The encoding used when writing the file. Defaults to 'utf-8'.
     inline_css
         An option to supply styles to table elements as inlined CSS styles. This is useful when
         including the table HTML as part of an HTML email message body, since inlined styles are
-        largely supported in email clients over using CSS in a `<style>` block.
+        largely supported in email clients over using CSS in a `<style>` block. Use `"native"` for
+        the built-in inliner (see `GT.as_raw_html()` for details).
     newline
         The newline character to use when writing the file. Defaults to `os.linesep`.
+    make_page
+        If `True`, the table will be wrapped in a complete HTML page.
+    all_important
+        If `True`, all CSS declarations are marked with `!important`.
+    intern_styles
+        If `True`, inline `style` attributes on body cells are replaced by generated CSS classes.
+        See `GT.as_raw_html()` for details.
+    prune_css
+        If `True`, CSS rules that can't apply to any element in the table are left out. See
+        `GT.as_raw_html()` for details.
+    compression
+        The compression to apply to the written HTML: either `"gzip"`, `"zstd"`, or `"br"`. The HTML
+        is compressed as it is rendered, so the complete uncompressed HTML is not held in memory.
+        See `GT.as_raw_html()` for the requirements of each compression method.
+
     Returns
     -------
     None
@@ -618,14 +820,60 @@ def write_raw_html(
     """
     import os
 
-    html_content = as_raw_html(
-        gt, inline_css=inline_css, make_page=make_page, all_important=all_important
+    chunks = _iter_raw_html_chunks(
+        gt,
+        inline_css=inline_css,
+        make_page=make_page,
+        all_important=all_important,
+        intern_styles=intern_styles,
+        prune_css=prune_css,
     )
 
     newline = newline if newline is not None else os.linesep
 
-    with open(filename, "w", encoding=encoding, newline=newline) as f:
-        f.write(html_content)
+    is_file_obj = hasattr(filename, "write")
+
+    if compression is None and not is_file_obj:
+        with open(filename, "w", encoding=encoding, newline=newline) as f:
+            f.writelines(chunks)
+
+        return
+
+    # Translate newlines in the same way that writing to a text file would
+    if newline not in ("", "\n"):
+        chunks = (chunk.replace("\n", newline) for chunk in chunks)
+
+    byte_chunks = (chunk.encode(encoding) for chunk in chunks)
+
+    if compression is not None:
+        byte_chunks = _compress_chunks(byte_chunks, compression)
+
+    if is_file_obj:
+        cast("IO[bytes]", filename).writelines(byte_chunks)
+    else:
+        with open(cast("str | Path", filename), "wb") as f:
+            f.writelines(byte_chunks)
+
+
+GTSAVE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp", ".pdf")
+
+
+def _resolve_gtsave_path(file: Path | str) -> Path:
+    """Return the output path for `gtsave()`, defaulting to `.png` and validating the extension."""
+
+    # If there is no file extension, default to .png
+    out_path = Path(file)
+    if out_path.suffix == "":
+        out_path = out_path.with_suffix(".png")
+
+    # Validate file extension
+    if out_path.suffix.lower() not in GTSAVE_EXTENSIONS:
+        raise ValueError(
+            f"Unsupported file extension: '{out_path.suffix}'. "
+            f"Supported formats: {', '.join(sorted(GTSAVE_EXTENSIONS))}"
+        )
+
+    return out_path
 
 
 def gtsave(
@@ -724,18 +972,7 @@ def gtsave(
     """
     import nokap
 
-    # If there is no file extension, default to .png
-    out_path = Path(file)
-    if out_path.suffix == "":
-        out_path = out_path.with_suffix(".png")
-
-    # Validate file extension
-    allowed_extensions = {".png", ".jpg", ".jpeg", ".webp", ".pdf"}
-    if out_path.suffix.lower() not in allowed_extensions:
-        raise ValueError(
-            f"Unsupported file extension: '{out_path.suffix}'. "
-            f"Supported formats: {', '.join(sorted(allowed_extensions))}"
-        )
+    out_path = _resolve_gtsave_path(file)
 
     # Get the HTML content of the table
     html_content = as_raw_html(self)
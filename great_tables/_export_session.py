@@ -0,0 +1,606 @@
+from __future__ import annotations
+
+import json
+import queue
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+
+from ._export import _resolve_gtsave_path, as_raw_html
+from ._utils import _try_import
+
+# Reusing browsers and tabs needs parts of nokap that aren't in its public API (which only has
+# one-shot captures, like `nokap.from_html()`): `nokap._cdp.SyncCDP` to connect a `Session` to a
+# browser, and the capture functions in `nokap._screenshot` and `nokap._pdf` that run on a given
+# `Session`. The `export` extra pins nokap to the versions these were tested with, so check them
+# when updating it.
+_EXPORT_INSTALL_LINE = "pip install great_tables[export]"
+
+if TYPE_CHECKING:
+    from nokap import Chrome, Session
+    from nokap._cdp import SyncCDP
+
+    from .gt import GT
+
+
+__all__ = ["ExportSession", "ExportResult", "gtsave_many"]
+
+
+@dataclass(frozen=True)
+class ExportResult:
+    """The outcome of exporting a single table with `gtsave_many()`.
+
+    Attributes
+    ----------
+    file
+        The path of the file that was (or would have been) written.
+    error
+        The exception raised while exporting the table, or `None` if the export succeeded.
+    """
+
+    file: Path
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class _BrowserWorker:
+    """A headless Chrome browser with a single tab that is reused across exports.
+
+    Each worker has its own browser process and CDP connection. Page load events are delivered for
+    a whole connection, so sharing a connection between tabs that navigate at the same time isn't
+    safe.
+    """
+
+    def __init__(self, chrome_path: str | None = None):
+        self._chrome_path = chrome_path
+        self._chrome: Chrome | None = None
+        self._cdp: SyncCDP | None = None
+        self._session: Session | None = None
+
+    def _get_session(self, vwidth: int, vheight: int) -> Session:
+        from nokap import Chrome, Session
+        from nokap._cdp import SyncCDP
+
+        # (Re)start the browser if it hasn't been started yet or if it has died
+        if self._chrome is None or not self._chrome.is_alive():
+            self.close()
+            self._chrome = Chrome(path=self._chrome_path)
+            self._cdp = SyncCDP(self._chrome.ws_url)
+            self._cdp.connect()
+
+        if self._session is None:
+            self._session = Session(self._cdp, width=vwidth, height=vheight)
+        else:
+            # A previous capture may have changed the viewport size or the zoom level
+            self._session.set_viewport(vwidth, vheight)
+
+        return self._session
+
+    def capture(
+        self,
+        html: str,
+        file: Path,
+        selector: str,
+        expand: int | tuple[int, int, int, int],
+        zoom: float,
+        delay: float,
+        vwidth: int,
+        vheight: int,
+    ) -> Path:
+        from nokap._pdf import capture_element_pdf, capture_pdf
+        from nokap._screenshot import capture_screenshot
+
+        session = self._get_session(vwidth=vwidth, vheight=vheight)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            html_file = Path(tmp_dir, "table.html")
+            html_file.write_text(f'<meta charset="utf-8">\n{html}', encoding="utf-8")
+
+            session.navigate(html_file.resolve().as_uri())
+
+            if delay > 0:
+                time.sleep(delay)
+
+            out_file = file.resolve()
+
+            if out_file.suffix.lower() != ".pdf":
+                return capture_screenshot(
+                    session, out_file, selector=selector, expand=expand, zoom=zoom
+                )
+
+            if selector != "html":
+                return capture_element_pdf(
+                    session, out_file, selector=selector, expand=expand, print_background=False
+                )
+
+            return capture_pdf(session, out_file, print_background=False)
+
+    def capture_single_page(
+        self,
+        htmls: list[str],
+        files: list[Path],
+        selector: str,
+        expand: int | tuple[int, int, int, int],
+        zoom: float,
+        delay: float,
+        vwidth: int,
+        vheight: int,
+    ) -> list[Path | Exception]:
+        """Capture several tables by laying them out on one page and cropping a single screenshot.
+
+        Returns the path of each written file, or the exception for any table that couldn't be
+        captured (e.g., if `selector` didn't match anything in that table).
+        """
+
+        from nokap import SelectorError
+        from nokap._screenshot import capture_screenshot
+
+        _try_import(name="PIL", pip_install_line=_EXPORT_INSTALL_LINE)
+        from PIL import Image
+
+        session = self._get_session(vwidth=vwidth, vheight=vheight)
+        top, right, bottom, left = (expand,) * 4 if isinstance(expand, int) else expand
+
+        # Space the tables far enough apart that the expanded crops don't overlap
+        gap = 2 * max(top, right, bottom, left) + 10
+
+        items = "\n".join(
+            f'<div class="gt_batch_item" style="width:max-content;padding:{gap}px;">\n{html}\n</div>'
+            for html in htmls
+        )
+        page = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8"/>
+</head>
+<body style="margin:0;">
+{items}
+</body>
+</html>
+"""
+
+        # Measure all tables (and the full page) with a single script evaluation
+        measure_js = f"""
+        (() => {{
+            const items = document.querySelectorAll("body > .gt_batch_item");
+            const rects = Array.from(items, (item) => {{
+                const el = item.querySelector({json.dumps(selector)});
+                if (!el) return null;
+                const rect = el.getBoundingClientRect();
+                return {{
+                    x: rect.x + window.scrollX,
+                    y: rect.y + window.scrollY,
+                    width: rect.width,
+                    height: rect.height
+                }};
+            }});
+            const root = document.documentElement;
+            return {{ rects: rects, width: root.scrollWidth, height: root.scrollHeight }};
+        }})()
+        """
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            html_file = Path(tmp_dir, "tables.html")
+            html_file.write_text(page, encoding="utf-8")
+
+            session.set_viewport(vwidth, vheight, device_scale_factor=zoom)
+            session.navigate(html_file.resolve().as_uri())
+
+            if delay > 0:
+                time.sleep(delay)
+
+            layout = session.evaluate(measure_js)
+
+            # The zoom was already applied to the viewport (so that the page is only laid out once)
+            capture_file = capture_screenshot(
+                session,
+                Path(tmp_dir, "tables.png"),
+                cliprect=(0, 0, layout["width"], layout["height"]),
+            )
+
+            capture = Image.open(capture_file)
+            capture.load()
+
+        out_files: list[Path | Exception] = []
+
+        for rect, file in zip(layout["rects"], files):
+            if rect is None:
+                out_files.append(SelectorError(selector))
+                continue
+
+            box = (
+                round((rect["x"] - left) * zoom),
+                round((rect["y"] - top) * zoom),
+                round((rect["x"] + rect["width"] + right) * zoom),
+                round((rect["y"] + rect["height"] + bottom) * zoom),
+            )
+
+            image = capture.crop(box)
+
+            out_file = file.resolve()
+            out_file.parent.mkdir(parents=True, exist_ok=True)
+
+            # JPEG doesn't support an alpha channel
+            if out_file.suffix.lower() in (".jpg", ".jpeg"):
+                image = image.convert("RGB")
+
+            image.save(out_file)
+            out_files.append(out_file)
+
+        return out_files
+
+    def reset(self) -> None:
+        """Close the tab, so that the next export starts with a fresh one."""
+
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def close(self) -> None:
+        self.reset()
+
+        if self._cdp is not None:
+            try:
+                self._cdp.close()
+            except Exception:
+                pass
+            self._cdp = None
+
+        if self._chrome is not None:
+            try:
+                self._chrome.close()
+            except Exception:
+                pass
+            self._chrome = None
+
+
+class ExportSession:
+    """
+    Keep headless browsers running for exporting many tables to image or PDF files.
+
+    Each call of `GT.gtsave()` starts up a headless Chrome browser and shuts it down again after the
+    file is written. An `ExportSession` instead keeps one or more browsers running (each with a
+    single tab that is reused), which makes exporting a large number of tables much faster. It's
+    best used as a context manager, so that the browsers are shut down when the work is done.
+
+    Chrome or Chromium must be installed on the system for this to work, along with the `export`
+    extra of this package (`pip install great_tables[export]`), which installs versions of the
+    `nokap` and `Pillow` packages that are known to work with it.
+
+    Parameters
+    ----------
+    workers
+        The number of browsers to use. Each browser exports one table at a time, so this is the
+        number of tables that `gtsave_many()` exports concurrently. Browsers are only started once
+        they are needed. Defaults to `1`.
+    chrome_path
+        The path to the Chrome executable. If not provided, Chrome is located automatically.
+
+    Examples
+    --------
+    Let's export a table for each manufacturer in the `gtcars` dataset, reusing a pair of browsers
+    for all of the exports.
+
+    ```python
+    from great_tables import GT, ExportSession
+    from great_tables.data import gtcars
+
+    tables = {
+        mfr: GT(df[["model", "year", "msrp"]]).tab_header(title=mfr).fmt_currency(columns="msrp")
+        for mfr, df in gtcars.groupby("mfr")
+    }
+
+    with ExportSession(workers=2) as session:
+        results = session.gtsave_many(tables.values(), [f"{mfr}.png" for mfr in tables])
+
+    failed = [result for result in results if not result.ok]
+    ```
+    """
+
+    def __init__(self, workers: int = 1, chrome_path: str | None = None):
+        if workers < 1:
+            raise ValueError(f"`workers=` must be at least 1, not {workers}.")
+
+        _check_nokap_internals()
+
+        self._workers = [_BrowserWorker(chrome_path=chrome_path) for _ in range(workers)]
+        self._available: queue.LifoQueue[_BrowserWorker] = queue.LifoQueue()
+        self._closed = False
+
+        for worker in self._workers:
+            self._available.put(worker)
+
+    def __enter__(self) -> ExportSession:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down all of the browsers in the session."""
+
+        self._closed = True
+
+        for worker in self._workers:
+            worker.close()
+
+    def gtsave(
+        self,
+        gt: GT,
+        file: Path | str,
+        selector: str = "table",
+        expand: int | tuple[int, int, int, int] = 5,
+        zoom: float = 2.0,
+        delay: float = 0.2,
+        vwidth: int = 992,
+        vheight: int = 744,
+    ) -> Path:
+        """
+        Save a table to a file using one of the session's browsers.
+
+        This works just like `GT.gtsave()` (and takes the same arguments) but uses a browser that
+        is already running. If all browsers are busy, this waits for one to become available.
+
+        Returns
+        -------
+        Path
+            The path of the file that was written.
+        """
+
+        out_path = _resolve_gtsave_path(file)
+
+        if self._closed:
+            raise RuntimeError("This ExportSession has been closed.")
+
+        html = as_raw_html(gt)
+
+        with self._acquire_worker() as worker:
+            return worker.capture(
+                html,
+                out_path,
+                selector=selector,
+                expand=expand,
+                zoom=zoom,
+                delay=delay,
+                vwidth=vwidth,
+                vheight=vheight,
+            )
+
+    @contextmanager
+    def _acquire_worker(self) -> Iterator[_BrowserWorker]:
+        """Wait for an available worker and hand it back to the pool once it's done."""
+
+        if self._closed:
+            raise RuntimeError("This ExportSession has been closed.")
+
+        worker = self._available.get()
+
+        try:
+            yield worker
+
+        except Exception:
+            # The tab may be left in a bad state, so start over with a new one
+            worker.reset()
+            raise
+
+        finally:
+            self._available.put(worker)
+
+    def gtsave_many(
+        self,
+        tables: Iterable[GT],
+        files: Iterable[Path | str],
+        selector: str = "table",
+        expand: int | tuple[int, int, int, int] = 5,
+        zoom: float = 2.0,
+        delay: float = 0.2,
+        vwidth: int = 992,
+        vheight: int = 744,
+        single_page: bool = False,
+        batch_size: int = 25,
+    ) -> list[ExportResult]:
+        """
+        Save many tables to files, using all of the session's browsers.
+
+        The tables are exported concurrently, with each of the session's browsers handling one
+        table (or one batch of tables, with `single_page=True`) at a time. An error while exporting
+        one table doesn't stop the others from being exported; instead, any error is recorded in the
+        result for that table.
+
+        With `single_page=True`, the tables are laid out together on a single page (in batches of
+        `batch_size=` tables). All of the tables in a batch are measured at once and captured in a
+        single screenshot, which is then cropped into the individual image files. This needs far
+        fewer round-trips to the browser than capturing each table separately, which is useful when
+        exporting large numbers of small tables (e.g., thumbnails). This mode only supports image
+        files (not PDF) and requires the `Pillow` package. Since the tables share a page, tables
+        with the same `id=` should also have the same table options.
+
+        Returns
+        -------
+        list[ExportResult]
+            One result per table (in the same order as `tables=`), with the path of the file and
+            any error raised while exporting it.
+        """
+
+        tables = list(tables)
+        out_paths = _resolve_gtsave_paths(files, n=len(tables))
+
+        options = dict(
+            selector=selector, expand=expand, zoom=zoom, delay=delay, vwidth=vwidth, vheight=vheight
+        )
+
+        if single_page:
+            if batch_size < 1:
+                raise ValueError(f"`batch_size=` must be at least 1, not {batch_size}.")
+
+            if any(out_path.suffix.lower() == ".pdf" for out_path in out_paths):
+                raise ValueError("Saving to PDF files isn't supported with `single_page=True`.")
+
+            batches = [
+                (tables[i : i + batch_size], out_paths[i : i + batch_size])
+                for i in range(0, len(tables), batch_size)
+            ]
+
+            def _save_batch(batch: tuple[list[GT], list[Path]]) -> list[ExportResult]:
+                return self._gtsave_single_page(*batch, **options)
+
+            with ThreadPoolExecutor(max_workers=len(self._workers)) as pool:
+                return [result for results in pool.map(_save_batch, batches) for result in results]
+
+        def _save(gt: GT, out_path: Path) -> ExportResult:
+            try:
+                self.gtsave(gt, out_path, **options)
+            except Exception as e:
+                return ExportResult(file=out_path, error=e)
+
+            return ExportResult(file=out_path)
+
+        with ThreadPoolExecutor(max_workers=len(self._workers)) as pool:
+            return list(pool.map(_save, tables, out_paths))
+
+    def _gtsave_single_page(
+        self, tables: list[GT], out_paths: list[Path], **options: Any
+    ) -> list[ExportResult]:
+        results: dict[int, ExportResult] = {}
+        htmls: dict[int, str] = {}
+
+        # A table that fails to render is left off the page, without affecting the others
+        for i, (gt, out_path) in enumerate(zip(tables, out_paths)):
+            try:
+                htmls[i] = as_raw_html(gt)
+            except Exception as e:
+                results[i] = ExportResult(file=out_path, error=e)
+
+        if htmls:
+            try:
+                with self._acquire_worker() as worker:
+                    captured = worker.capture_single_page(
+                        list(htmls.values()), [out_paths[i] for i in htmls], **options
+                    )
+
+                for i, res in zip(htmls, captured):
+                    error = res if isinstance(res, Exception) else None
+                    results[i] = ExportResult(file=out_paths[i], error=error)
+
+            except Exception as e:
+                for i in htmls:
+                    results[i] = ExportResult(file=out_paths[i], error=e)
+
+        return [results[i] for i in range(len(tables))]
+
+
+def _check_nokap_internals() -> None:
+    try:
+        from nokap._cdp import SyncCDP  # noqa: F401
+        from nokap._pdf import capture_element_pdf, capture_pdf  # noqa: F401
+        from nokap._screenshot import capture_screenshot  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "ExportSession needs a version of nokap that it was tested with. Run the following to "
+            f"install it.\n\n`{_EXPORT_INSTALL_LINE}`"
+        ) from None
+
+
+def _resolve_gtsave_paths(files: Iterable[Path | str], n: int) -> list[Path]:
+    out_paths = [_resolve_gtsave_path(file) for file in files]
+
+    if len(out_paths) != n:
+        raise ValueError(
+            f"The number of files ({len(out_paths)}) must match the number of tables ({n})."
+        )
+
+    return out_paths
+
+
+def gtsave_many(
+    tables: Iterable[GT],
+    files: Iterable[Path | str],
+    workers: int = 1,
+    selector: str = "table",
+    expand: int | tuple[int, int, int, int] = 5,
+    zoom: float = 2.0,
+    delay: float = 0.2,
+    vwidth: int = 992,
+    vheight: int = 744,
+    single_page: bool = False,
+    batch_size: int = 25,
+) -> list[ExportResult]:
+    """
+    Save many GT tables to files (PNG, JPEG, WebP, or PDF).
+
+    This saves each table in `tables=` to the corresponding path in `files=`, in the same way as
+    `GT.gtsave()`. Rather than starting a new headless browser for every table, the browsers are
+    kept running and reused for all of the tables, and several tables can be exported at the same
+    time by using more than one worker. An error while exporting one table doesn't stop the others
+    from being exported.
+
+    To reuse the browsers across several calls, use an `ExportSession` directly. As with an
+    `ExportSession`, this needs the `export` extra of this package (`pip install
+    great_tables[export]`).
+
+    Parameters
+    ----------
+    tables
+        The GT tables to save.
+    files
+        The file paths to write the tables to (one per table). The format of each file is
+        determined by its extension, as in `GT.gtsave()`.
+    workers
+        The number of browsers to export tables with at the same time. Defaults to `1`.
+    selector, expand, zoom, delay, vwidth, vheight
+        Options used for every table. See `GT.gtsave()` for details.
+    single_page
+        If `True`, lay out the tables together on one page and capture them all with a single
+        screenshot, which is then cropped into the individual image files. This is much faster for
+        large numbers of tables, but doesn't support PDF output and requires the `Pillow` package.
+    batch_size
+        With `single_page=True`, the number of tables to place on each page. Defaults to `25`.
+
+    Returns
+    -------
+    list[ExportResult]
+        One result per table (in the same order as `tables=`). Each result has the path of the file
+        (`file`) and any exception raised while exporting the table (`error`, which is `None` if the
+        export succeeded).
+
+    Examples
+    --------
+    ```python
+    from great_tables import GT, gtsave_many
+    from great_tables.data import gtcars
+
+    tables = [GT(df[["model", "msrp"]]).tab_header(title=mfr) for mfr, df in gtcars.groupby("mfr")]
+    files = [f"table_{i}.png" for i in range(len(tables))]
+
+    results = gtsave_many(tables, files, workers=4)
+
+    for result in results:
+        if not result.ok:
+            print(f"Couldn't save {result.file}: {result.error}")
+    ```
+    """
+
+    # Check the paths before starting up any browsers
+    tables = list(tables)
+    files = _resolve_gtsave_paths(files, n=len(tables))
+
+    with ExportSession(workers=workers) as session:
+        return session.gtsave_many(
+            tables,
+            files,
+            selector=selector,
+            expand=expand,
+            zoom=zoom,
+            delay=delay,
+            vwidth=vwidth,
+            vheight=vheight,
+            single_page=single_page,
+            batch_size=batch_size,
+        )
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import inspect
 import math
 import re
 from dataclasses import dataclass
 from datetime import date, datetime, time
 from decimal import Decimal
-from functools import partial
+from functools import partial, wraps
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -20,12 +21,17 @@ from typing import (
     overload,
 )
 
-import babel
-import faicons
-from babel.dates import format_date, format_datetime, format_time
 from typing_extensions import TypeAlias
 
-from ._gt_data import FormatFn, FormatFns, FormatInfo, FormatterSkipElement, GTData, PFrameData
+from ._gt_data import (
+    FormatFn,
+    FormatFns,
+    FormatInfo,
+    FormatterCall,
+    FormatterSkipElement,
+    GTData,
+    PFrameData,
+)
 from ._helpers import px
 from ._locale import (
     _get_currencies_data,
@@ -89,7 +95,44 @@ MissingVals: TypeAlias = Literal[
     "remove",
 ]
 
+# Formatting methods that record their calls, by name (used to rebuild formatters from a spec)
+FORMATTER_METHODS: dict[str, Callable[..., Any]] = {}
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _records_call(method: F) -> F:
+    """Record the name and arguments of a formatting method on the formatter it adds.
+
+    The formatter's `call` is set to a `FormatterCall`, so that it can be serialized as a method
+    name with arguments, rather than as the functions the method builds. When one formatting
+    method calls another (e.g., `fmt_number()` calling `fmt()`), the outermost call is kept.
+    """
+
+    signature = inspect.signature(method)
+
+    @wraps(method)
+    def wrapper(self: GTSelf, *args: Any, **kwargs: Any) -> GTSelf:
+        res = method(self, *args, **kwargs)
+
+        arguments = signature.bind(self, *args, **kwargs).arguments
+        arguments.pop("self")
+
+        for before, after in [
+            (self._formats, res._formats),
+            (self._substitutions, res._substitutions),
+        ]:
+            if len(after) > len(before):
+                after[-1].call = FormatterCall(method.__name__, dict(arguments))
+
+        return res
+
+    FORMATTER_METHODS[method.__name__] = wrapper
+
+    return cast(F, wrapper)
 
+
+@_records_call
 def fmt(
     self: GTSelf,
     fns: FormatFn,
@@ -155,14 +198,15 @@ def fmt(
 
     col_res = resolve_cols_c(self, columns)
 
-    formatter = FormatInfo(fns, col_res, row_pos)
+    formatter = FormatInfo(fns, col_res, row_pos, rows_expr=rows)
 
     if is_substitution:
-        return self._replace(_substitutions=[*self._substitutions, formatter])
+        return self._replace(_substitutions=self._substitutions + [formatter])
 
-    return self._replace(_formats=[*self._formats, formatter])
+    return self._replace(_formats=self._formats + [formatter])
 
 
+@_records_call
 def fmt_number(
     self: GTSelf,
     columns: SelectExpr = None,
@@ -392,6 +436,7 @@ def fmt_number_context(
     return x_formatted
 
 
+@_records_call
 def fmt_integer(
     self: GTSelf,
     columns: SelectExpr = None,
@@ -582,6 +627,7 @@ def fmt_integer_context(
     return x_formatted
 
 
+@_records_call
 def fmt_scientific(
     self: GTSelf,
     columns: SelectExpr = None,
@@ -845,6 +891,7 @@ def fmt_scientific_context(
     return x_formatted
 
 
+@_records_call
 def fmt_engineering(
     self: GTSelf,
     columns: SelectExpr = None,
@@ -1186,6 +1233,7 @@ def fmt_engineering_context(
     return x_formatted
 
 
+@_records_call
 def fmt_percent(
     self: GTSelf,
     columns: SelectExpr = None,
@@ -1445,6 +1493,7 @@ _PARTSPER_UNITS: dict[str, dict[str, Any]] = {
 }
 
 
+@_records_call
 def fmt_partsper(
     self: GTSelf,
     columns: SelectExpr = None,
@@ -1740,6 +1789,7 @@ def fmt_partsper_context(
     return x_formatted
 
 
+@_records_call
 def fmt_currency(
     self: GTSelf,
     columns: SelectExpr = None,
@@ -2020,6 +2070,7 @@ def fmt_currency_context(
     return x_formatted
 
 
+@_records_call
 def fmt_roman(
     self: GTSelf,
     columns: SelectExpr = None,
@@ -2137,6 +2188,7 @@ def fmt_roman_context(
     return x_formatted
 
 
+@_records_call
 def fmt_bytes(
     self: GTSelf,
     columns: SelectExpr = None,
@@ -2547,6 +2599,7 @@ def _apply_duration_pattern(patterns: dict[str, str], value: int, formatted_valu
     return pattern.replace("{0}", formatted_value)
 
 
+@_records_call
 def fmt_duration(
     self: GTSelf,
     columns: SelectExpr = None,
@@ -3205,6 +3258,7 @@ def _format_duration_colon_sep(
     return day_part + ":".join(hms_parts)
 
 
+@_records_call
 def fmt_date(
     self: GTSelf,
     columns: SelectExpr = None,
@@ -3340,6 +3394,8 @@ def fmt_date_context(
     else:
         locale = _str_replace(locale, "-", "_")
 
+    from babel.dates import format_date
+
     # Format the date object to a string using Babel's `format_date()` function
     x_formatted = format_date(x, format=date_format_str, locale=locale)
 
@@ -3354,6 +3410,7 @@ def fmt_date_context(
     return x_formatted
 
 
+@_records_call
 def fmt_time(
     self: GTSelf,
     columns: SelectExpr = None,
@@ -3478,6 +3535,8 @@ def fmt_time_context(
     else:
         locale = _str_replace(locale, "-", "_")
 
+    from babel.dates import format_time
+
     # Format the time object to a string using Babel's `format_time()` function
     x_formatted = format_time(x, format=time_format_str, locale=locale)
 
@@ -3492,6 +3551,7 @@ def fmt_time_context(
     return x_formatted
 
 
+@_records_call
 def fmt_datetime(
     self: GTSelf,
     columns: SelectExpr = None,
@@ -3671,6 +3731,8 @@ def fmt_datetime_context(
         else:
             locale = _str_replace(locale, "-", "_")
 
+        from babel.dates import format_datetime
+
         # Format the datetime object to a string using Babel's `format_datetime()` function
         x_formatted = format_datetime(x, format=datetime_format_str, locale=locale)
 
@@ -3685,6 +3747,7 @@ def fmt_datetime_context(
     return x_formatted
 
 
+@_records_call
 def fmt_tf(
     self: GTSelf,
     columns: SelectExpr = None,
@@ -4000,6 +4063,7 @@ class TfMap:
         return res
 
 
+@_records_call
 def fmt_markdown(
     self: GTSelf,
     columns: SelectExpr = None,
@@ -4085,6 +4149,7 @@ def fmt_markdown_context(
     return x_formatted
 
 
+@_records_call
 def fmt_units(
     self: GTSelf,
     columns: SelectExpr = None,
@@ -4864,6 +4929,8 @@ def _normalize_locale(locale: str | None = None) -> str | None:
     if matches:
         return matches[0]
 
+    import babel
+
     try:
         babel.Locale.parse(supplied_locale, sep="-")
     except babel.UnknownLocaleError:
@@ -5369,6 +5436,7 @@ def _validate_datetime_obj(x: Any) -> None:
         raise ValueError(f"Invalid datetime object: '{x}'. The object must be a datetime object.")
 
 
+@_records_call
 def fmt_image(
     self: GTSelf,
     columns: SelectExpr = None,
@@ -5595,6 +5663,7 @@ class FmtImage:
         return f'<img src="{uri}" style="{style_string}">'
 
 
+@_records_call
 def fmt_icon(
     self: GTSelf,
     columns: SelectExpr = None,
@@ -5804,6 +5873,9 @@ class FmtIcon:
     SPAN_TEMPLATE: ClassVar = '<span style="white-space:nowrap;">{}</span>'
 
     def to_html(self, val: Any):
+        # faicons loads its full icon index on import, so defer it until an icon is rendered
+        import faicons
+
         if is_na(self.dispatch_on, val):
             return val
 
@@ -5864,6 +5936,7 @@ class FmtIcon:
         return FormatterSkipElement()
 
 
+@_records_call
 def fmt_flag(
     self: GTSelf,
     columns: SelectExpr = None,
@@ -6074,6 +6147,7 @@ class FmtFlag:
         return re.sub(r"<svg.*?>", replacement, flag_svg)
 
 
+@_records_call
 def fmt_nanoplot(
     self: GTSelf,
     columns: str | None = None,
@@ -6456,7 +6530,14 @@ def fmt_nanoplot(
 
         return nanoplot
 
-    return fmt_by_context(self, pf_format=fmt_nanoplot_fn, columns=columns, rows=rows)
+    res = fmt_by_context(self, pf_format=fmt_nanoplot_fn, columns=columns, rows=rows)
+
+    # The formatter holds values taken from the whole column (for bar scaling or autoscaling), so
+    # it is tied to this table's data
+    if all_single_y_vals is not None or autoscale:
+        res._formats[-1].uses_data = True
+
+    return res
 
 
 def _generate_data_vals(
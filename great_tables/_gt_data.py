@@ -1,21 +1,24 @@
 from __future__ import annotations
 
 import copy
-from collections.abc import Mapping, Sequence
+from array import array
+from collections.abc import Container, Hashable, Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass, field, replace
 from enum import Enum, auto
-from itertools import chain, product
+from itertools import chain, product, repeat
 from typing import TYPE_CHECKING, Any, Callable, Literal, Protocol, TypeVar, overload
 
 from typing_extensions import Self, TypeAlias, Union
 
 from ._cols_merge import ColMergeInfo, ColMerges  # noqa: F401 (re-exported)
 from ._helpers import GoogleFontImports
+from ._profile import span
 
 # TODO: move this class somewhere else (even gt_data could work)
 from ._styles import CellStyle
 from ._tbl_data import (
     Agnostic,
+    ColumnValues,
     DataFrameLike,
     TblData,
     _get_cell,
@@ -35,7 +38,7 @@ from ._tbl_data_align import (
     is_number_like_column,
 )
 from ._text import BaseText
-from ._utils import OrderedSet
+from ._utils import PersistentList
 
 if TYPE_CHECKING:
     from ._helpers import UnitStr
@@ -57,6 +60,41 @@ class FramelessData:
 # GT Data ----
 
 
+class SelectionCache:
+    """Results of evaluating selectors (e.g. `rows=pl.col("x") > 0`) against a table's data.
+
+    Evaluating a selector can mean filtering the whole table, so results are kept by a key
+    describing the selector. GTData objects share the cache until their data is replaced.
+    """
+
+    __slots__ = ("_results",)
+
+    max_size: int = 256
+
+    def __init__(self):
+        self._results: dict[Hashable, Any] = {}
+
+    def get_or_eval(self, key: Hashable | None, fn: Callable[[], T]) -> T:
+        """Return the result stored for key, or call fn and store its result.
+
+        A key of None means the selector can't be identified, so fn is always called.
+        """
+        if key is None:
+            return fn()
+
+        try:
+            return self._results[key]
+        except KeyError:
+            pass
+
+        if len(self._results) >= self.max_size:
+            # drop the oldest result
+            del self._results[next(iter(self._results))]
+
+        res = self._results[key] = fn()
+        return res
+
+
 def _prep_gt(
     data, rowname_col: str | None, groupname_col: str | None, auto_align: bool
 ) -> tuple[Stub, Boxhead]:
@@ -84,16 +122,17 @@ class GTData:
     _summary_rows: SummaryRows
     _summary_rows_grand: SummaryRows
     _source_notes: SourceNotes
-    _footnotes: Footnotes
-    _styles: Styles
+    _footnotes: PersistentList[FootnoteInfo]
+    _styles: PersistentList[StyleInfo]
     _locale: Locale | None
-    _formats: Formats
-    _substitutions: Formats
+    _formats: PersistentList[FormatInfo]
+    _substitutions: PersistentList[FormatInfo]
     _col_merge: ColMerges
-    _transforms: list  # list[TextTransformInfo]
+    _transforms: PersistentList[Any]  # PersistentList[TextTransformInfo]
     _options: Options
     _google_font_imports: GoogleFontImports = field(default_factory=GoogleFontImports)
     _has_built: bool = False
+    _selections: SelectionCache = field(default_factory=SelectionCache, compare=False, repr=False)
 
     def _replace(self, **kwargs: Any) -> Self:
         new_obj = copy.copy(self)
@@ -102,10 +141,31 @@ class GTData:
         if missing:
             raise ValueError(f"Replacements not in data: {missing}")
 
+        if "_tbl_data" in kwargs:
+            # selections evaluated against the old data don't apply to the new data
+            kwargs.setdefault("_selections", SelectionCache())
+
         new_obj.__dict__.update(kwargs)
 
         return new_obj
 
+    def _get_used_columns(self) -> list[str]:
+        """Return the columns of the data that the rendered table needs.
+
+        These are the columns that are shown (including the stub and row group columns), and
+        hidden columns that are merged into a shown column. Other hidden columns don't need to be
+        formatted or cast for rendering.
+        """
+
+        shown = {col.var for col in self._boxhead if col.type != ColInfoTypeEnum.hidden}
+
+        used = set(shown)
+        for info in self._col_merge:
+            if info.vars[0] in shown:
+                used.update(info.vars)
+
+        return [col for col in get_column_names(self._tbl_data) if col in used]
+
     @classmethod
     def from_data(
         cls,
@@ -135,13 +195,13 @@ class GTData:
             _summary_rows=SummaryRows(),
             _summary_rows_grand=SummaryRows(_is_grand_summary=True),
             _source_notes=[],
-            _footnotes=[],
-            _styles=[],
+            _footnotes=PersistentList(),
+            _styles=PersistentList(),
             _locale=Locale(locale),
-            _formats=[],
-            _substitutions=[],
+            _formats=PersistentList(),
+            _substitutions=PersistentList(),
             _col_merge=[],
-            _transforms=[],
+            _transforms=PersistentList(),
             _options=options,
             _google_font_imports=GoogleFontImports(),
         )
@@ -193,24 +253,49 @@ class Body:
     def __init__(self, body: TblData):
         self.body = body
 
-    def render_formats(self, data_tbl: TblData, formats: list[FormatInfo], context: Any):
-        for fmt in formats:
+    def render_formats(
+        self,
+        data_tbl: TblData,
+        formats: list[FormatInfo],
+        context: Any,
+        columns: Container[str] | None = None,
+        source: ColumnValues | None = None,
+    ):
+        """Apply formatters to the body, skipping cells outside of `columns` (if given).
+
+        The cells of `data_tbl` can be passed as `source`, to share them with other build steps.
+        """
+
+        if source is None:
+            source = ColumnValues(data_tbl)
+
+        for ii, fmt in enumerate(formats):
             eval_func = getattr(fmt.func, context, fmt.func.default)
             if eval_func is None:
                 raise Exception("Internal Error")
-            for col, row in fmt.cells.resolve():
-                result = eval_func(_get_cell(data_tbl, row, col))
-                if isinstance(result, FormatterSkipElement):
-                    continue
-
-                # TODO: I think that this is very inefficient with polars, so
-                # we could either accumulate results and set them per column, or
-                # could always use a pandas DataFrame inside Body?
-                new_body = _set_cell(self.body, row, col, result)
-                if new_body is not None:
-                    # Some backends do not support inplace operations, but return a new dataframe
-                    # TODO: Consolidate the behaviour of _set_cell
-                    self.body = new_body
+
+            subset = fmt.cells
+            if columns is not None:
+                subset = subset.without_cols([col for col in subset.cols if col not in columns])
+
+            cells = subset.resolve()
+            method = fmt.call.name if fmt.call is not None else None
+
+            with span("format", cells=len(cells), index=ii, method=method):
+                for col, row in cells:
+                    result = eval_func(source.get(row, col))
+                    if isinstance(result, FormatterSkipElement):
+                        continue
+
+                    # TODO: I think that this is very inefficient with polars, so
+                    # we could either accumulate results and set them per column, or
+                    # could always use a pandas DataFrame inside Body?
+                    new_body = _set_cell(self.body, row, col, result)
+                    if new_body is not None:
+                        # Some backends do not support inplace operations, but return a new
+                        # dataframe
+                        # TODO: Consolidate the behaviour of _set_cell
+                        self.body = new_body
 
         return self
 
@@ -240,7 +325,7 @@ class ColInfoTypeEnum(Enum):
     summary_placeholder = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ColInfo:
     # TODO: Make var readonly
     var: str
@@ -257,7 +342,7 @@ class ColInfo:
 
     def __post_init__(self):
         if self.column_label is None:
-            super().__setattr__("column_label", self.var)
+            object.__setattr__(self, "column_label", self.var)
 
     def replace_column_label(self, column_label: str) -> Self:
         return replace(self, column_label=column_label)
@@ -533,7 +618,7 @@ class Boxhead(_Sequence[ColInfo]):
 # Stub ----
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RowInfo:
     # TODO: Make `rownum_i` readonly
     rownum_i: int
@@ -550,6 +635,123 @@ class RowInfo:
     # `built` = False
 
 
+class StubRows(Sequence[RowInfo]):
+    """The rows of a stub, stored as arrays rather than as one `RowInfo` per row.
+
+    Row indices are kept in an integer array and group ids as codes into a list of the distinct
+    ids. Row names are only stored when the table has a rowname column. Indexing returns
+    `RowInfo` objects, which are created as needed.
+    """
+
+    __slots__ = ("rownum_i", "_group_codes", "_group_ids", "_rownames")
+
+    rownum_i: array[int]
+    _group_codes: array[int] | None
+    _group_ids: list[Any]
+    _rownames: list[Any] | None
+
+    def __init__(
+        self,
+        rownum_i: Iterable[int],
+        group_id: Iterable[Any] | None = None,
+        rowname: Iterable[Any] | None = None,
+    ):
+        self.rownum_i = array("q", rownum_i)
+
+        if group_id is None:
+            self._group_codes = None
+            self._group_ids = []
+        else:
+            codes: dict[Any, int] = {}
+            self._group_codes = array("l", (codes.setdefault(x, len(codes)) for x in group_id))
+            self._group_ids = list(codes)
+
+        self._rownames = None if rowname is None else list(rowname)
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[RowInfo]) -> StubRows:
+        if isinstance(rows, StubRows):
+            return rows
+
+        return cls(
+            [row.rownum_i for row in rows],
+            [row.group_id for row in rows],
+            [row.rowname for row in rows],
+        )
+
+    @property
+    def group_id(self) -> list[Any]:
+        """The group id of each row."""
+        if self._group_codes is None:
+            return [None] * len(self)
+
+        ids = self._group_ids
+        return [ids[code] for code in self._group_codes]
+
+    @property
+    def rowname(self) -> list[Any]:
+        """The row name of each row."""
+        return [None] * len(self) if self._rownames is None else self._rownames.copy()
+
+    def has_group_ids(self) -> bool:
+        return any(x is not None for x in self._group_ids)
+
+    def has_rownames(self) -> bool:
+        return self._rownames is not None and any(x is not None for x in self._rownames)
+
+    def take(self, indices: Iterable[int]) -> StubRows:
+        """Return the rows at the given positions."""
+        new = self.__class__.__new__(self.__class__)
+
+        indices = list(indices)
+        new.rownum_i = array("q", (self.rownum_i[ii] for ii in indices))
+        new._group_ids = self._group_ids
+        new._group_codes = (
+            None
+            if self._group_codes is None
+            else array("l", (self._group_codes[ii] for ii in indices))
+        )
+        new._rownames = None if self._rownames is None else [self._rownames[ii] for ii in indices]
+
+        return new
+
+    def _row(self, ii: int) -> RowInfo:
+        return RowInfo(
+            self.rownum_i[ii],
+            None if self._group_codes is None else self._group_ids[self._group_codes[ii]],
+            None if self._rownames is None else self._rownames[ii],
+        )
+
+    @overload
+    def __getitem__(self, ii: int) -> RowInfo: ...
+
+    @overload
+    def __getitem__(self, ii: slice) -> StubRows: ...
+
+    def __getitem__(self, ii: int | slice) -> RowInfo | StubRows:
+        if isinstance(ii, slice):
+            return self.take(range(len(self))[ii])
+
+        return self._row(ii)
+
+    def __iter__(self) -> Iterator[RowInfo]:
+        return map(self._row, range(len(self)))
+
+    def __len__(self) -> int:
+        return len(self.rownum_i)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (StubRows, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+
 class Stub:
     """Container for row information and labels, along with grouping information.
 
@@ -565,43 +767,29 @@ class Stub:
     # TODO: the rows get reordered at various points, but are never used in rendering?
     # the html rendering uses group_rows to index into the underlying DataFrame
 
-    _d: list[RowInfo]
-    rows: list[RowInfo]
+    _d: StubRows
+    rows: StubRows
     group_rows: GroupRows
 
-    def __init__(self, rows: list[RowInfo], group_rows: GroupRows):
-        self.rows = self._d = rows.copy()
+    def __init__(self, rows: Sequence[RowInfo], group_rows: GroupRows):
+        # StubRows are never modified in place, so they can be shared between stubs
+        self.rows = self._d = StubRows.from_rows(rows)
         self.group_rows = group_rows
 
     @classmethod
     def from_data(
         cls, data, rowname_col: str | None = None, groupname_col: str | None = None
     ) -> Self:
-        # Obtain a list of row indices from the data and initialize
-        # the `_stub` from that
-        row_indices = list(range(n_rows(data)))
-
-        if groupname_col is not None:
-            group_id = to_list(data[groupname_col])
-        else:
-            group_id = [None] * n_rows(data)
+        group_id = None if groupname_col is None else to_list(data[groupname_col])
+        row_names = None if rowname_col is None else to_list(data[rowname_col])
 
-        if rowname_col is not None:
-            row_names = to_list(data[rowname_col])
-        else:
-            row_names = [None] * n_rows(data)
-
-        # Obtain the column names from the data and initialize the
-        # `_stub` from that
-        row_info = [RowInfo(*i) for i in zip(row_indices, group_id, row_names)]
+        rows = StubRows(range(n_rows(data)), group_id, row_names)
 
         # create groups, and ensure they're ordered by first observed
-        group_names = OrderedSet(
-            row.group_id for row in row_info if row.group_id is not None
-        ).as_list()
+        group_names = [x for x in rows._group_ids if x is not None]
         group_rows = GroupRows(data, group_key=groupname_col).reorder(group_names)
 
-        return cls(row_info, group_rows)
+        return cls(rows, group_rows)
 
     def _set_cols(
         self, data: TblData, boxhead: Boxhead, rowname_col: str | None, groupname_col: str | None
@@ -621,9 +809,7 @@ class Stub:
         return [group.group_id for group in self.group_rows]
 
     def reorder_rows(self, indices) -> Self:
-        new_rows = [self.rows[ii] for ii in indices]
-
-        return self.__class__(new_rows, self.group_rows)
+        return self.__class__(self.rows.take(indices), self.group_rows)
 
     def order_groups(self, group_order: RowGroups) -> Self:
         # TODO: validate
@@ -687,10 +873,10 @@ class Stub:
     def _get_stub_components(self) -> list[str]:
         stub_components: list[str] = []
 
-        if any(entry.group_id is not None for entry in self.rows):
+        if self.rows.has_group_ids():
             stub_components.append("group_id")
 
-        if any(entry.rowname is not None for entry in self.rows):
+        if self.rows.has_rownames():
             stub_components.append("row_id")
 
         return stub_components
@@ -748,7 +934,7 @@ RowGroups: TypeAlias = list[str]
 # Group rows ----
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GroupRowInfo:
     group_id: str
     group_label: str | None = None
@@ -810,11 +996,10 @@ class GroupRows(_Sequence[GroupRowInfo]):
         distinct from MISSING_GROUP (which may currently be unused?).
 
         """
-        return (
-            [(ii, None) for ii in range(n)]
-            if not self._d
-            else [(ind, info) for info in self for ind in info.indices]
-        )
+        if not self._d:
+            return list(zip(range(n), repeat(None)))
+
+        return list(chain.from_iterable(zip(info.indices, repeat(info)) for info in self))
 
 
 # Spanners ----
@@ -913,7 +1098,7 @@ class FootnotePlacement(Enum):
     auto = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FootnoteInfo:
     locname: Loc | None = None
     grpname: str | None = None
@@ -929,18 +1114,40 @@ Footnotes: TypeAlias = list[FootnoteInfo]
 # Styles ----
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StyleInfo:
+    """Styles applied to a location.
+
+    Styles that apply to the same set of body cells are stored once, with the cells in `cells`
+    (a `CellRectangle` or a `CellMask`), rather than once for each cell with `colname` and
+    `rownum` set.
+    """
+
     locname: Loc
     grpname: str | None = None
     colname: str | None = None
     rownum: int | None = None
     colnum: int | None = None
     styles: list[CellStyle] = field(default_factory=list)
+    cells: CellSubset | None = None
 
 
 Styles: TypeAlias = list[StyleInfo]
 
+
+def entry_run_key(entry: StyleInfo | FootnoteInfo) -> Hashable:
+    """Group key for the runs of style or footnote entries added by a single call.
+
+    Entries added by a single `tab_style()` or `tab_footnote()` call share their location object,
+    and (unless they were computed from the data) their style objects.
+    """
+
+    if isinstance(entry, StyleInfo):
+        return (id(entry.locname), tuple(id(style) for style in entry.styles))
+
+    return (id(entry.locname), id(entry.footnotes), entry.placement)
+
+
 # Locale ----
 
 
@@ -974,34 +1181,172 @@ class FormatFns:
 
 
 class CellSubset:
+    cols: list[str]
+
     def resolve(self) -> list[tuple[str, int]]:
         raise NotImplementedError("Not implemented")
 
+    def contains(self, colname: str | None, row: int | None) -> bool:
+        raise NotImplementedError("Not implemented")
+
+    def without_cols(self, cols: Container[str]) -> Self:
+        raise NotImplementedError("Not implemented")
+
+    def row_indices(self) -> Sequence[int]:
+        """Return the rows with at least one selected cell."""
+        raise NotImplementedError("Not implemented")
+
+    def __len__(self) -> int:
+        raise NotImplementedError("Not implemented")
+
 
 class CellRectangle(CellSubset):
+    """The cells in every combination of some columns and some rows.
+
+    `rows` may be a `range` (e.g., for all rows of a table), which is stored in constant space.
+    """
+
     cols: list[str]
-    rows: list[int]
+    rows: Sequence[int]
 
-    def __init__(self, cols: list[str], rows: list[int]):
+    def __init__(self, cols: list[str], rows: Sequence[int]):
         self.cols = cols
         self.rows = rows
+        self._col_set: frozenset[str] | None = None
+        self._row_set: Container[int] | None = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(cols={self.cols!r}, rows={self.rows!r})"
 
     def resolve(self) -> list[tuple[str, int]]:
         return list(product(self.cols, self.rows))
 
+    def contains(self, colname: str | None, row: int | None) -> bool:
+        if self._col_set is None:
+            self._col_set = frozenset(self.cols)
+            self._row_set = self.rows if isinstance(self.rows, range) else frozenset(self.rows)
+
+        return colname in self._col_set and row in self._row_set  # type: ignore[operator]
+
+    def without_cols(self, cols: Container[str]) -> CellRectangle:
+        return CellRectangle([col for col in self.cols if col not in cols], self.rows)
+
+    def row_indices(self) -> Sequence[int]:
+        return self.rows
+
+    def __len__(self) -> int:
+        return len(self.cols) * len(self.rows)
+
+
+def _nonzero(mask: bytes) -> list[int]:
+    """Return the positions of the nonzero bytes in a mask."""
+
+    if not mask.count(0):
+        return list(range(len(mask)))
+
+    # masks hold 0s and 1s, and the search for each 1 runs in C
+    res: list[int] = []
+    ii = mask.find(1)
+    while ii != -1:
+        res.append(ii)
+        ii = mask.find(1, ii + 1)
+
+    return res
+
+
+class CellMask(CellSubset):
+    """The cells selected by a boolean mask for each of some columns.
+
+    Each mask holds a byte for every row of the table, which is 1 for selected cells and 0
+    otherwise.
+    """
+
+    masks: dict[str, bytes]
+
+    def __init__(self, masks: dict[str, bytes]):
+        self.masks = masks
+        self.cols = list(masks)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(cols={self.cols!r})"
+
+    def resolve(self) -> list[tuple[str, int]]:
+        # ordered by row, then column, like the mask itself
+        cells = [
+            (row, ii, colname)
+            for ii, (colname, mask) in enumerate(self.masks.items())
+            for row in _nonzero(mask)
+        ]
+        return [(colname, row) for row, _, colname in sorted(cells)]
+
+    def contains(self, colname: str | None, row: int | None) -> bool:
+        mask = self.masks.get(colname)  # type: ignore[arg-type]
+        return mask is not None and row is not None and bool(mask[row])
+
+    def without_cols(self, cols: Container[str]) -> CellMask:
+        return CellMask({col: mask for col, mask in self.masks.items() if col not in cols})
+
+    def row_indices(self) -> Sequence[int]:
+        if not self.masks:
+            return []
+
+        # combine the masks as integers, which is done in C rather than row by row
+        n_bytes = len(next(iter(self.masks.values())))
+        combined = 0
+        for mask in self.masks.values():
+            combined |= int.from_bytes(mask, "little")
+
+        return _nonzero(combined.to_bytes(n_bytes, "little"))
+
+    def __len__(self) -> int:
+        return sum(len(mask) - mask.count(0) for mask in self.masks.values())
+
+
+@dataclass(frozen=True)
+class FormatterCall:
+    """The name and arguments of the formatting method (e.g., `fmt_number()`) behind a formatter.
+
+    Formatters hold functions built from the method's arguments, which generally can't be
+    serialized. Recording the call instead lets a formatter be rebuilt by calling the method again
+    (see `GT.to_dict()`).
+    """
+
+    name: str
+    args: dict[str, Any]
+
 
 class FormatInfo:
     """Contains functions for formatting in different contexts, and columns and rows to apply to.
 
     Note that format functions apply to individual values.
+
+    The `rows=` selector the formatter was created with is kept as `rows_expr`, so that the rows
+    can be resolved again against new data (see `GTSpec.with_data()`). Formatters that captured
+    values from the table itself when they were created (e.g., the y-axis range of a nanoplot)
+    set `uses_data` to True, since they can't be applied to different data. Formatters added by a
+    formatting method record the method's name and arguments in `call`.
     """
 
     func: FormatFns
     cells: CellSubset
+    rows_expr: Any
+    uses_data: bool
+    call: FormatterCall | None
 
-    def __init__(self, func: FormatFns, cols: list[str], rows: list[int]):
+    def __init__(
+        self,
+        func: FormatFns,
+        cols: list[str],
+        rows: list[int],
+        rows_expr: Any = None,
+        uses_data: bool = False,
+        call: FormatterCall | None = None,
+    ):
         self.func = func
         self.cells = CellRectangle(cols, rows)
+        self.rows_expr = rows_expr
+        self.uses_data = uses_data
+        self.call = call
 
 
 # TODO: this will contain private methods for formatting cell values to strings
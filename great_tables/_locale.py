@@ -1,18 +1,105 @@
 from __future__ import annotations
 
+import pickle
 from csv import DictReader
 from typing import Any, TypedDict, cast
 
 from importlib_resources import files
+from typing_extensions import NotRequired
 
 DATA_MOD = files("great_tables") / "data"
 
+# The reference tables below are compiled from their CSV files into a single pickle by
+# `scripts/build_locale_bundle.py`, so that they can be loaded without parsing CSV text
+BUNDLE_FNAME = "x_bundle.pickle"
+
+# Bump this whenever the layout of the bundle changes
+BUNDLE_VERSION = 1
+
+# Bundle entry name -> (CSV file name, columns left out of the bundle)
+BUNDLE_SOURCES: dict[str, tuple[str, tuple[str, ...]]] = {
+    "locales": (
+        "x_locales.csv",
+        # text for interactive table widgets, which great_tables does not produce
+        (
+            "no_table_data_text",
+            "sort_label_text",
+            "filter_label_text",
+            "search_placeholder_text",
+            "page_next_text",
+            "page_previous_text",
+            "page_numbers_text",
+            "page_info_text",
+            "page_size_options_text",
+            "page_next_label_text",
+            "page_previous_label_text",
+            "page_number_label_text",
+            "page_jump_label_text",
+            "page_size_options_label_text",
+        ),
+    ),
+    "default_locales": ("x_default_locales.csv", ()),
+    "currencies": ("x_currencies.csv", ()),
+    "flags": ("x_flags.csv", ()),
+    "durations": ("x_durations.csv", ()),
+}
+
+_BUNDLE_CACHE: dict[str, bytes] | None = None
+_TABLE_CACHE: dict[str, list[dict[str, Any]]] = {}
+
 
 def read_csv(fname: str) -> list[dict[str, Any]]:
     with open(fname, encoding="utf8") as f:
         return list(DictReader(f))
 
 
+def _build_bundle(data_dir: Any = DATA_MOD) -> dict[str, Any]:
+    """Compile the reference CSV files into the structure stored in the bundle.
+
+    Each table is pickled separately, so that a table is only unpickled when it's first used.
+    Repeated values in a table (e.g., the `","` group mark) are stored once, so they're shared both
+    in the pickle and in memory once it's loaded.
+    """
+
+    tables: dict[str, bytes] = {}
+
+    for name, (fname, omit) in BUNDLE_SOURCES.items():
+        shared: dict[str, str] = {}
+        rows = [
+            {
+                shared.setdefault(key, key): shared.setdefault(val, val)
+                for key, val in row.items()
+                if key not in omit
+            }
+            for row in read_csv(data_dir / fname)
+        ]
+        tables[name] = pickle.dumps(rows, protocol=4)
+
+    return {"version": BUNDLE_VERSION, "tables": tables}
+
+
+def _load_table(name: str) -> list[dict[str, Any]]:
+    global _BUNDLE_CACHE
+
+    if name in _TABLE_CACHE:
+        return _TABLE_CACHE[name]
+
+    if _BUNDLE_CACHE is None:
+        bundle = pickle.loads((DATA_MOD / BUNDLE_FNAME).read_bytes())
+
+        if bundle["version"] != BUNDLE_VERSION:
+            raise RuntimeError(
+                f"The locale data bundle ({BUNDLE_FNAME}) is out of date. "
+                "Regenerate it with `python scripts/build_locale_bundle.py`."
+            )
+
+        _BUNDLE_CACHE = bundle["tables"]
+
+    table = _TABLE_CACHE[name] = pickle.loads(_BUNDLE_CACHE[name])
+
+    return table
+
+
 class Locale:
     locale: str | None
 
@@ -56,20 +143,20 @@ class LocalesDict(TypedDict):
     default_numbering_system: object
     minimum_grouping_digits: int
     currency_code: object
-    no_table_data_text: object
-    sort_label_text: object
-    filter_label_text: object
-    search_placeholder_text: object
-    page_next_text: object
-    page_previous_text: object
-    page_numbers_text: object
-    page_info_text: object
-    page_size_options_text: object
-    page_next_label_text: object
-    page_previous_label_text: object
-    page_number_label_text: object
-    page_jump_label_text: object
-    page_size_options_label_text: object
+    no_table_data_text: NotRequired[object]
+    sort_label_text: NotRequired[object]
+    filter_label_text: NotRequired[object]
+    search_placeholder_text: NotRequired[object]
+    page_next_text: NotRequired[object]
+    page_previous_text: NotRequired[object]
+    page_numbers_text: NotRequired[object]
+    page_info_text: NotRequired[object]
+    page_size_options_text: NotRequired[object]
+    page_next_label_text: NotRequired[object]
+    page_previous_label_text: NotRequired[object]
+    page_number_label_text: NotRequired[object]
+    page_jump_label_text: NotRequired[object]
+    page_size_options_label_text: NotRequired[object]
 
 
 class DefaultLocalesDict(TypedDict):
@@ -92,31 +179,24 @@ class FlagsDataDict(TypedDict):
     country_flag: str
 
 
-# Note that all the functions below cast the result hint of read_csv
-# to a more specific dict type, which contains item info.
+# Note that all the functions below cast the rows of the bundle to a more specific dict type,
+# which contains item info. The returned lists are shared, so they should not be modified.
 
 
 def _get_locales_data() -> list[LocalesDict]:
-    fname = DATA_MOD / "x_locales.csv"
-
-    return cast("list[LocalesDict]", read_csv(fname))
+    return cast("list[LocalesDict]", _load_table("locales"))
 
 
 def _get_default_locales_data() -> list[DefaultLocalesDict]:
-    fname = DATA_MOD / "x_default_locales.csv"
-    return cast("list[DefaultLocalesDict]", read_csv(fname))
+    return cast("list[DefaultLocalesDict]", _load_table("default_locales"))
 
 
 def _get_currencies_data() -> list[CurrenciesDataDict]:
-    fname = DATA_MOD / "x_currencies.csv"
-
-    return cast("list[CurrenciesDataDict]", read_csv(fname))
+    return cast("list[CurrenciesDataDict]", _load_table("currencies"))
 
 
 def _get_flags_data() -> list[FlagsDataDict]:
-    fname = DATA_MOD / "x_flags.csv"
-
-    return cast("list[FlagsDataDict]", read_csv(fname))
+    return cast("list[FlagsDataDict]", _load_table("flags"))
 
 
 class DurationsDataDict(TypedDict):
@@ -155,6 +235,4 @@ class DurationsDataDict(TypedDict):
 
 
 def _get_durations_data() -> list[DurationsDataDict]:
-    fname = DATA_MOD / "x_durations.csv"
-
-    return cast("list[DurationsDataDict]", read_csv(fname))
+    return cast("list[DurationsDataDict]", _load_table("durations"))
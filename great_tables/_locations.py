@@ -3,7 +3,7 @@ from __future__ import annotations
 import itertools
 from dataclasses import dataclass, replace
 from functools import singledispatch
-from typing import TYPE_CHECKING, Any, Callable, Literal, Union
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Literal, Union
 
 from typing_extensions import TypeAlias
 
@@ -11,6 +11,8 @@ from typing_extensions import TypeAlias
 # resolve generic, but we need to import at runtime, due to singledispatch looking
 # up annotations
 from ._gt_data import (
+    CellMask,
+    CellRectangle,
     ColInfoTypeEnum,
     FootnoteInfo,
     FootnotePlacement,
@@ -18,8 +20,16 @@ from ._gt_data import (
     Spanners,
     StyleInfo,
 )
-from ._styles import CellStyle
-from ._tbl_data import PlDataFrame, PlExpr, eval_select, eval_transform, get_column_names
+from ._styles import CellStyle, CellStyleFromData
+from ._tbl_data import (
+    PlDataFrame,
+    PlExpr,
+    PlSelectExpr,
+    eval_select,
+    eval_transform,
+    get_column_names,
+    n_rows,
+)
 from ._text import _process_text
 
 if TYPE_CHECKING:
@@ -70,7 +80,7 @@ RowSelectExpr: TypeAlias = 'list[int] | int | PlExpr | Callable[["TblData"], boo
 # straight while going through helpers.R, but no strong opinion on naming!
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CellPos:
     """The position of a cell in a DataFrame."""
 
@@ -939,6 +949,34 @@ def resolve_vector_l(expr: list[str], candidates: list[str], item_label: str) ->
     return [candidate in set_expr for candidate in candidates]
 
 
+def _selector_key(expr: Any) -> Hashable | None:
+    """Return a key identifying a selector, or None if it can't be identified.
+
+    Polars expressions and selectors are identified by their serialized form, so equal
+    expressions built by separate calls share a key. Callables are never identified, since
+    they may return different results for the same data.
+    """
+
+    if expr is None or isinstance(expr, (str, int)):
+        # the type is part of the key, since True == 1
+        return (type(expr).__name__, expr)
+
+    if isinstance(expr, list):
+        keys = tuple(_selector_key(x) for x in expr)
+        return None if None in keys else ("list", keys)
+
+    if isinstance(expr, (PlExpr, PlSelectExpr)):
+        try:
+            serialized = expr.meta.serialize(format="json")
+        except Exception:
+            return None
+
+        # expressions that call Python functions (e.g. map_elements()) may not be pure
+        return None if '"AnonymousFunction"' in serialized else ("polars", serialized)
+
+    return None
+
+
 def resolve_cols_c(
     data: GTData,
     expr: SelectExpr,
@@ -1013,13 +1051,17 @@ def resolve_cols_i(
         cols_excl = (stub_var, group_var)
 
         tbl_data = data._tbl_data
+        key = _selector_key(expr)
+        selected = data._selections.get_or_eval(
+            None if key is None else ("cols", key, strict),
+            lambda: eval_select(tbl_data, expr, strict),
+        )
     else:
         # I am not sure if this gets used in the R program, but it's
         # convenient for testing
-        tbl_data = data
         cols_excl = ()
+        selected = eval_select(data, expr, strict)
 
-    selected = eval_select(tbl_data, expr, strict)
     return [name_pos for name_pos in selected if name_pos[0] not in cols_excl]
 
 
@@ -1046,7 +1088,7 @@ def resolve_rows_i(
         expr: list[str | int] = [expr]
 
     if isinstance(data, GTData):
-        row_names = [getattr(row, row_name_attr) for row in data._stub]
+        row_names = getattr(data._stub.rows, row_name_attr)
     else:
         row_names = data
 
@@ -1071,15 +1113,28 @@ def resolve_rows_i(
         return selected
 
     elif isinstance(expr, PlExpr):
-        # TODO: decide later on the name supplied to `name`
-        # with_row_index supersedes with_row_count
         frame: PlDataFrame = data._tbl_data
-        meth_row_number = getattr(frame, "with_row_index", None)
-        if not meth_row_number:
-            meth_row_number = frame.with_row_count
+        stub_rows = data._stub.rows
+
+        def filter_rows() -> tuple[Any, list[tuple[str, int]]]:
+            # TODO: decide later on the name supplied to `name`
+            # with_row_index supersedes with_row_count
+            meth_row_number = getattr(frame, "with_row_index", None)
+            if not meth_row_number:
+                meth_row_number = frame.with_row_count
 
-        result = meth_row_number(name="__row_number__").filter(expr)
-        return [(row_names[ii], ii) for ii in result["__row_number__"]]
+            result = meth_row_number(name="__row_number__").filter(expr)
+
+            # the stub rows are kept with the result, so their id can't be reused
+            return stub_rows, [(row_names[ii], ii) for ii in result["__row_number__"]]
+
+        # the filter runs over the whole table, so it's only done once for equal expressions
+        key = _selector_key(expr)
+        _, selected = data._selections.get_or_eval(
+            None if key is None else ("rows", key, row_name_attr, id(stub_rows)), filter_rows
+        )
+
+        return list(selected)
 
     elif callable(expr):
         res: "list[bool]" = eval_transform(data._tbl_data, expr)
@@ -1102,13 +1157,13 @@ def resolve_rows_i(
     )
 
 
-def resolve_mask(
-    data: GTData | list[str],
+def _eval_mask(
+    data: GTData,
     expr: PlExpr,
     excl_stub: bool = True,
     excl_group: bool = True,
-) -> list[tuple[int, int, str]]:
-    """Return data for creating `CellPos`, based on expr"""
+) -> PlDataFrame:
+    """Return a frame of booleans for the columns selected by a mask expression."""
     if not isinstance(expr, PlExpr):
         raise ValueError("Only Polars expressions can be passed to the `mask` argument.")
 
@@ -1120,7 +1175,11 @@ def resolve_mask(
     cols_excl = [*(stub_var if excl_stub else []), *(group_var if excl_group else [])]
 
     # `df.select()` raises `ColumnNotFoundError` if columns are missing from the original DataFrame.
-    masked = frame.select(expr).drop(cols_excl, strict=False)
+    key = _selector_key(expr)
+    masked = data._selections.get_or_eval(
+        None if key is None else ("mask", key), lambda: frame.select(expr)
+    )
+    masked = masked.drop(cols_excl, strict=False)
 
     # Validate that `masked.columns` exist in the `frame_cols`
     missing = set(masked.columns) - set(frame_cols)
@@ -1138,14 +1197,46 @@ def resolve_mask(
             f"\n* Mask length: {masked.height}"
         )
 
-    cellpos_data: list[tuple[int, int, str]] = []  # column, row, colname for `CellPos`
-    col_idx_map = {colname: frame_cols.index(colname) for colname in frame_cols}
-    for row_idx, row_dict in enumerate(masked.iter_rows(named=True)):
-        for colname, value in row_dict.items():
-            if value:  # select only when `value` is True
-                col_idx = col_idx_map[colname]
-                cellpos_data.append((col_idx, row_idx, colname))
-    return cellpos_data
+    return masked
+
+
+def _mask_to_bytes(ser: Any) -> bytes:
+    import polars as pl
+
+    if ser.dtype == pl.Boolean:
+        return bytes(ser.fill_null(False).cast(pl.UInt8).to_list())
+
+    # masks of other types select the cells with truthy values
+    return bytes(1 if value else 0 for value in ser.to_list())
+
+
+def _mask_cells(
+    data: GTData,
+    expr: PlExpr,
+    excl_stub: bool = True,
+    excl_group: bool = True,
+) -> CellMask:
+    """Return the cells selected by a mask expression, as a mask of bytes for each column."""
+
+    masked = _eval_mask(data, expr, excl_stub=excl_stub, excl_group=excl_group)
+    return CellMask(
+        {colname: _mask_to_bytes(masked.get_column(colname)) for colname in masked.columns}
+    )
+
+
+def resolve_mask(
+    data: GTData,
+    expr: PlExpr,
+    excl_stub: bool = True,
+    excl_group: bool = True,
+) -> list[tuple[int, int, str]]:
+    """Return data for creating `CellPos`, based on expr"""
+
+    cells = _mask_cells(data, expr, excl_stub=excl_stub, excl_group=excl_group)
+    col_idx_map = {colname: ii for ii, colname in enumerate(get_column_names(data._tbl_data))}
+
+    # column, row, colname for `CellPos`
+    return [(col_idx_map[colname], row, colname) for colname, row in cells.resolve()]
 
 
 # Resolve generic ======================================================================
@@ -1298,6 +1389,27 @@ def _(loc: LocBody, data: GTData) -> list[CellPos]:
     return cell_pos
 
 
+def resolve_cells(loc: LocBody, data: GTData) -> CellRectangle | CellMask:
+    """Return the body cells selected by a location, as a whole rather than cell by cell."""
+
+    if (loc.columns is not None or loc.rows is not None) and loc.mask is not None:
+        raise ValueError(
+            "Cannot specify the `mask` argument along with `columns` or `rows` in `loc.body()`."
+        )
+
+    if loc.mask is not None:
+        return _mask_cells(data, loc.mask)
+
+    cols = [name for name, _ in resolve_cols_i(data=data, expr=loc.columns)]
+
+    if loc.rows is None:
+        rows: list[int] | range = range(n_rows(data._tbl_data))
+    else:
+        rows = [ii for _, ii in resolve_rows_i(data=data, expr=loc.rows)]
+
+    return CellRectangle(cols, rows)
+
+
 # Style generic ========================================================================
 
 
@@ -1542,10 +1654,40 @@ def _(loc: LocSummary, data: GTData, style: list[Union[CellStyle, FootnoteEntry]
 
 
 @set_style.register(LocBody)
+def _(loc: LocBody, data: GTData, style: list[Union[CellStyle, FootnoteEntry]]) -> GTData:
+    styles, new_footnotes = footnotes_split_style_list(style)
+
+    # evaluate any column expressions in styles
+    style_ready = [entry._evaluate_expressions(data._tbl_data) for entry in styles]
+
+    # the styles are stored once, along with the selected cells
+    cells = resolve_cells(loc, data)
+
+    if any(entry._requires_data() for entry in style_ready):
+        # styles that vary by row are rendered to CSS once, for each selected row
+        rows = cells.row_indices()
+        style_ready = [
+            CellStyleFromData(entry._css_by_row(data._tbl_data, rows))
+            if entry._requires_data()
+            else entry
+            for entry in style_ready
+        ]
+
+    new_styles = [StyleInfo(locname=loc, styles=style_ready, cells=cells)] if len(cells) else []
+
+    updated_footnotes = [
+        replace(footnote_info, locname=loc, colname=colname, rownum=row)
+        for colname, row in (cells.resolve() if new_footnotes else [])
+        for footnote_info in new_footnotes
+    ]
+
+    return data._replace(
+        _styles=data._styles + new_styles, _footnotes=data._footnotes + updated_footnotes
+    )
+
+
 @set_style.register(LocGrandSummary)
-def _(
-    loc: (LocBody | LocGrandSummary), data: GTData, style: list[Union[CellStyle, FootnoteEntry]]
-) -> GTData:
+def _(loc: LocGrandSummary, data: GTData, style: list[Union[CellStyle, FootnoteEntry]]) -> GTData:
     positions: list[CellPos] = resolve(loc, data)
 
     styles, new_footnotes = footnotes_split_style_list(style)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import TYPE_CHECKING, Any, Callable, Literal
 
 from ._gt_data import (
@@ -7,6 +8,7 @@ from ._gt_data import (
     GTData,
     Locale,
     RowGroups,
+    StyleInfo,
     Styles,
     SummaryRowInfo,
 )
@@ -17,6 +19,7 @@ from ._tbl_data import (
     eval_aggregate,
     reorder,
 )
+from ._utils import PersistentList
 
 if TYPE_CHECKING:
     from ._types import GTSelf
@@ -28,21 +31,29 @@ def row_group_order(self: GTSelf, groups: RowGroups) -> GTSelf:
     return self._replace(_stub=new_stub)
 
 
-def _remove_from_body_styles(styles: Styles, column: str) -> Styles:
+def _remove_from_body_styles(styles: Styles, column: str) -> PersistentList[StyleInfo]:
     # TODO: refactor
     from ._locations import LocBody
     from ._utils_render_html import _is_loc
 
-    new_styles = [
-        info for info in styles if not (_is_loc(info.locname, LocBody) and info.colname == column)
-    ]
+    new_styles: list[StyleInfo] = []
+    for info in styles:
+        if not _is_loc(info.locname, LocBody):
+            new_styles.append(info)
+        elif info.cells is not None:
+            if column not in info.cells.cols:
+                new_styles.append(info)
+            elif len(info.cells.cols) > 1:
+                new_styles.append(replace(info, cells=info.cells.without_cols([column])))
+        elif info.colname != column:
+            new_styles.append(info)
 
-    return new_styles
+    return PersistentList(new_styles)
 
 
 def _remove_from_group_styles(styles: Styles, column: str):
     # TODO(#341): once group styles are supported, will need to wire this up.
-    return list(styles)
+    return styles
 
 
 def tab_stub(
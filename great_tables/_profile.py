@@ -0,0 +1,450 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ContextManager,
+    Iterable,
+    Iterator,
+    Literal,
+    Sequence,
+)
+
+if TYPE_CHECKING:
+    from .gt import GT
+
+SpanHook = Callable[["ProfileSpan"], None]
+
+# The profile that rendering currently reports to, if any (set by `profile_render()`)
+_current_profile: ContextVar[RenderProfile | None] = ContextVar(
+    "great_tables_render_profile", default=None
+)
+
+
+@dataclass(frozen=True)
+class ProfileSpan:
+    """A timed phase of rendering a table.
+
+    Attributes
+    ----------
+    name
+        The name of the phase (e.g., `"render_formats"`).
+    path
+        The names of the enclosing phases and this phase, separated by `/` (e.g.,
+        `"build_data/render_formats"`).
+    start_time_ns
+        When the phase started, in nanoseconds since the epoch.
+    duration_ns
+        The wall time spent in the phase, in nanoseconds.
+    cells
+        The number of cells the phase worked on, if it applies to the phase.
+    attributes
+        Other information about the phase (e.g., the formatting method of a formatter).
+    peak_bytes
+        The most memory allocated during the phase, in bytes, on top of what was allocated when it
+        started. Only measured when profiling with `memory=True`.
+    retained_bytes
+        The memory allocated during the phase that was still allocated when it finished, in bytes
+        (negative if the phase freed more than it allocated). Only measured when profiling with
+        `memory=True`.
+    """
+
+    name: str
+    path: str
+    start_time_ns: int
+    duration_ns: int
+    cells: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    peak_bytes: int | None = None
+    retained_bytes: int | None = None
+
+    @property
+    def seconds(self) -> float:
+        return self.duration_ns / 1e9
+
+
+@dataclass(frozen=True)
+class PhaseSummary:
+    """The total time, number of calls and number of cells for a phase of rendering.
+
+    When memory is measured, `peak_bytes` is the largest peak of any call and `retained_bytes` is
+    the total memory retained by all calls.
+    """
+
+    path: str
+    calls: int
+    seconds: float
+    cells: int | None
+    peak_bytes: int | None = None
+    retained_bytes: int | None = None
+
+
+class _MemoryFrame:
+    """The memory allocated when a phase started, and the most allocated since."""
+
+    __slots__ = ("start", "peak")
+
+    def __init__(self, start: int):
+        self.start = start
+        self.peak = start
+
+
+def _format_bytes(n_bytes: int | None) -> str:
+    return "" if n_bytes is None else f"{n_bytes / 1024**2:.2f}"
+
+
+class RenderProfile:
+    """A report of the time spent in each phase of rendering tables.
+
+    A `RenderProfile` is created by [`profile_render()`](`great_tables.profile_render`) and
+    collects a span for each phase of rendering that happens within it.
+
+    Attributes
+    ----------
+    spans
+        All recorded spans, in the order they finished.
+    memory
+        Whether memory allocations are measured.
+    peak_bytes
+        When memory is measured, the most memory allocated within `profile_render()`, in bytes.
+    retained_bytes
+        When memory is measured, the memory allocated within `profile_render()` that was still
+        allocated when it exited, in bytes.
+    """
+
+    spans: list[ProfileSpan]
+    hooks: list[SpanHook]
+    memory: bool
+    peak_bytes: int | None
+    retained_bytes: int | None
+
+    def __init__(self, hooks: Sequence[SpanHook] = (), memory: bool = False):
+        self.spans = []
+        self.hooks = list(hooks)
+        self.memory = memory
+        self.peak_bytes = None
+        self.retained_bytes = None
+        self._stack: list[str] = []
+        self._frames: list[_MemoryFrame] = []
+
+    def __repr__(self) -> str:
+        phases = self.phases()
+        if not phases:
+            return "RenderProfile(no spans)"
+
+        width = max(len(phase.path) for phase in phases)
+        header = f"{'phase':<{width}}  {'calls':>6}  {'ms':>10}  {'cells':>9}"
+        if self.memory:
+            header += f"  {'peak MiB':>9}  {'kept MiB':>9}"
+
+        lines = [header]
+        for phase in phases:
+            cells = "" if phase.cells is None else phase.cells
+            line = f"{phase.path:<{width}}  {phase.calls:>6}  {phase.seconds * 1000:>10.3f}  {cells:>9}"
+            if self.memory:
+                peak, kept = _format_bytes(phase.peak_bytes), _format_bytes(phase.retained_bytes)
+                line += f"  {peak:>9}  {kept:>9}"
+            lines.append(line)
+
+        if self.memory:
+            peak, kept = _format_bytes(self.peak_bytes), _format_bytes(self.retained_bytes)
+            lines.append(f"{'total':<{width}}  {'':>6}  {'':>10}  {'':>9}  {peak:>9}  {kept:>9}")
+
+        return "\n".join(lines)
+
+    def _memory_enter(self) -> _MemoryFrame:
+        import tracemalloc
+
+        current, peak = tracemalloc.get_traced_memory()
+        if self._frames:
+            self._frames[-1].peak = max(self._frames[-1].peak, peak)
+
+        # the peak is reset for each phase, and passed on to the enclosing phase when it finishes
+        tracemalloc.reset_peak()
+        frame = _MemoryFrame(current)
+        self._frames.append(frame)
+
+        return frame
+
+    def _memory_exit(self, frame: _MemoryFrame) -> tuple[int, int]:
+        import tracemalloc
+
+        current, peak = tracemalloc.get_traced_memory()
+        frame.peak = max(frame.peak, peak)
+        self._frames.remove(frame)
+        if self._frames:
+            self._frames[-1].peak = max(self._frames[-1].peak, frame.peak)
+
+        return frame.peak - frame.start, current - frame.start
+
+    def _record(self, span: ProfileSpan) -> None:
+        self.spans.append(span)
+        for hook in self.hooks:
+            hook(span)
+
+    def phases(self) -> list[PhaseSummary]:
+        """Summarize the spans by phase, in the order each phase was first seen."""
+
+        totals: dict[str, list[Any]] = {}
+        for span in sorted(self.spans, key=lambda span: span.start_time_ns):
+            entry = totals.setdefault(span.path, [0, 0, None, None, None])
+            entry[0] += 1
+            entry[1] += span.duration_ns
+            if span.cells is not None:
+                entry[2] = (entry[2] or 0) + span.cells
+            if span.peak_bytes is not None:
+                entry[3] = max(entry[3] or 0, span.peak_bytes)
+            if span.retained_bytes is not None:
+                entry[4] = (entry[4] or 0) + span.retained_bytes
+
+        return [
+            PhaseSummary(path, calls, duration_ns / 1e9, cells, peak_bytes, retained_bytes)
+            for path, (calls, duration_ns, cells, peak_bytes, retained_bytes) in totals.items()
+        ]
+
+    def formats(self) -> list[ProfileSpan]:
+        """Return the spans of individual formatters (one per formatter, for each render)."""
+
+        return [span for span in self.spans if span.name == "format"]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the report as a dictionary (e.g., for writing to JSON)."""
+
+        res: dict[str, Any] = {
+            "phases": [vars(phase) for phase in self.phases()],
+            "formats": [
+                {"seconds": span.seconds, "cells": span.cells, **span.attributes}
+                for span in self.formats()
+            ],
+        }
+
+        if self.memory:
+            res["peak_bytes"] = self.peak_bytes
+            res["retained_bytes"] = self.retained_bytes
+            for entry, span in zip(res["formats"], self.formats()):
+                entry["peak_bytes"] = span.peak_bytes
+                entry["retained_bytes"] = span.retained_bytes
+
+        return res
+
+
+@contextmanager
+def profile_render(hooks: Sequence[SpanHook] = (), memory: bool = False) -> Iterator[RenderProfile]:
+    """Record the time spent in each phase of rendering tables.
+
+    Within this context manager, rendering a table (e.g., with `GT.as_raw_html()`, `GT.as_latex()`
+    or `GT.gtsave()`) records the wall time, number of calls and number of cells of each of its
+    phases: applying formatters (with a span for each formatter), merging columns, applying text
+    transforms, building the HTML of each part of the table, compiling the CSS and so on. This
+    helps to find out where the time goes when a table is slow to render.
+
+    Parameters
+    ----------
+    hooks
+        Functions that are called with each `ProfileSpan` as it finishes. Spans hold their start
+        time (in nanoseconds since the epoch), duration and the path of enclosing phases, so this
+        can be used to forward them to a tracing system.
+    memory
+        Whether to also measure the memory allocated in each phase, using the `tracemalloc` module.
+        For each phase, this records the peak memory allocated during the phase and the memory
+        it retained after it finished. Tracing allocations slows down rendering considerably, so
+        timings taken with `memory=True` should not be compared to those taken without it.
+
+    Returns
+    -------
+    RenderProfile
+        A report that is filled in as tables are rendered. Use `phases()` for a summary of each
+        phase, `formats()` for the spans of individual formatters, and `to_dict()` to get the
+        report as a dictionary.
+
+    Examples
+    --------
+    ```{python}
+    from great_tables import GT, exibble, profile_render
+
+    with profile_render() as profile:
+        GT(exibble).fmt_number(columns="num").fmt_currency(columns="currency").as_raw_html()
+
+    profile
+    ```
+    """
+
+    import tracemalloc
+
+    profile = RenderProfile(hooks, memory=memory)
+    token = _current_profile.set(profile)
+
+    started_tracing = memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+
+    frame = profile._memory_enter() if memory else None
+    try:
+        yield profile
+    finally:
+        if frame is not None:
+            profile.peak_bytes, profile.retained_bytes = profile._memory_exit(frame)
+        if started_tracing:
+            tracemalloc.stop()
+        _current_profile.reset(token)
+
+
+def profile_memory(
+    gt: GT, output: Literal["html", "latex"] = "html", **render_args: Any
+) -> RenderProfile:
+    """Render a table and report the memory allocated in each phase of rendering.
+
+    This renders the table once with [`profile_render(memory=True)`](`great_tables.profile_render`)
+    and returns the profile. The `peak_bytes` attribute of the profile holds the most memory
+    allocated at any point of rendering, and `retained_bytes` the memory still allocated after it
+    (which includes the rendered output). This can be used to check whether rendering a large table
+    fits within a memory limit.
+
+    Parameters
+    ----------
+    gt
+        The table to render.
+    output
+        The output format, either `"html"` (with `GT.as_raw_html()`) or `"latex"` (with
+        `GT.as_latex()`).
+    **render_args
+        Arguments passed to the rendering method (e.g., `inline_css=True`).
+
+    Returns
+    -------
+    RenderProfile
+        A report of the time and memory spent in each phase of rendering.
+
+    Examples
+    --------
+    ```{python}
+    from great_tables import GT, exibble, profile_memory
+
+    profile = profile_memory(GT(exibble).fmt_number(columns="num"))
+
+    profile.peak_bytes
+    ```
+    """
+
+    if output == "html":
+        render = gt.as_raw_html
+    elif output == "latex":
+        render = gt.as_latex
+    else:
+        raise ValueError(f'`output=` must be "html" or "latex", not {output!r}.')
+
+    # the output is kept until profiling ends, so that it counts towards the retained memory
+    with profile_render(memory=True) as profile:
+        rendered = render(**render_args)
+
+    del rendered
+
+    return profile
+
+
+def profiling() -> bool:
+    """Return whether a profile is active (e.g., to skip counting cells when it isn't)."""
+
+    return _current_profile.get() is not None
+
+
+# Returned by `span()` when no profile is active, so that rendering doesn't create a context
+# manager for every phase
+_NO_SPAN = nullcontext()
+
+
+def span(name: str, cells: int | None = None, **attributes: Any) -> ContextManager[None]:
+    """Time a phase of rendering, when a profile is active."""
+
+    profile = _current_profile.get()
+    if profile is None:
+        return _NO_SPAN
+
+    return _span(profile, name, cells, attributes)
+
+
+@contextmanager
+def _span(
+    profile: RenderProfile, name: str, cells: int | None, attributes: dict[str, Any]
+) -> Iterator[None]:
+    path = "/".join([*profile._stack, name])
+    profile._stack.append(name)
+    frame = profile._memory_enter() if profile.memory else None
+    start_time_ns = time.time_ns()
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        duration_ns = time.perf_counter_ns() - start
+        peak_bytes, retained_bytes = (
+            profile._memory_exit(frame) if frame is not None else (None, None)
+        )
+        profile._stack.pop()
+        profile._record(
+            ProfileSpan(
+                name,
+                path,
+                start_time_ns,
+                duration_ns,
+                cells,
+                attributes,
+                peak_bytes=peak_bytes,
+                retained_bytes=retained_bytes,
+            )
+        )
+
+
+def timed_iter(name: str, chunks: Iterable[str], cells: int | None = None) -> Iterable[str]:
+    """Time a phase that produces its output lazily, when a profile is active.
+
+    Only the time spent producing each chunk counts towards the phase, and the span is recorded
+    once all chunks were produced.
+    """
+
+    profile = _current_profile.get()
+    if profile is None:
+        return chunks
+
+    path = "/".join([*profile._stack, name])
+
+    def _timed() -> Iterator[str]:
+        start_time_ns = time.time_ns()
+        duration_ns = 0
+        peak_bytes = retained_bytes = 0
+        iterator = iter(chunks)
+
+        while True:
+            frame = profile._memory_enter() if profile.memory else None
+            start = time.perf_counter_ns()
+            try:
+                chunk = next(iterator)
+            except StopIteration:
+                break
+            finally:
+                duration_ns += time.perf_counter_ns() - start
+                if frame is not None:
+                    chunk_peak, chunk_retained = profile._memory_exit(frame)
+                    peak_bytes = max(peak_bytes, retained_bytes + chunk_peak)
+                    retained_bytes += chunk_retained
+
+            yield chunk
+
+        memory = (peak_bytes, retained_bytes) if profile.memory else (None, None)
+        profile._record(
+            ProfileSpan(
+                name,
+                path,
+                start_time_ns,
+                duration_ns,
+                cells,
+                peak_bytes=memory[0],
+                retained_bytes=memory[1],
+            )
+        )
+
+    return _timed()
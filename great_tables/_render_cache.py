@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Literal
+
+if TYPE_CHECKING:
+    from .gt import GT
+
+RenderCacheEvent = Literal["hit", "miss", "bypass", "store", "evict"]
+
+_SUFFIXES = {"html": ".html", "latex": ".tex"}
+_STATS_FIELDS = {
+    "hit": "hits",
+    "miss": "misses",
+    "bypass": "bypasses",
+    "store": "stores",
+    "evict": "evictions",
+}
+
+
+@dataclass
+class RenderCacheStats:
+    """Counts of the events of a `RenderCache`."""
+
+    hits: int = 0
+    misses: int = 0
+    bypasses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+
+def _has_callables(obj: Any) -> bool:
+    if isinstance(obj, dict):
+        return obj.get("__type__") == "callable" or any(_has_callables(v) for v in obj.values())
+
+    if isinstance(obj, list):
+        return any(_has_callables(x) for x in obj)
+
+    return False
+
+
+class RenderCache:
+    """A persistent, on-disk cache of rendered tables.
+
+    When a `RenderCache` is passed to [`GT.as_raw_html()`](`great_tables.GT.as_raw_html`) or
+    [`GT.as_latex()`](`great_tables.GT.as_latex`), the rendered output is stored in a directory,
+    keyed by a hash of the table's data, its setup (as described by
+    [`GT.to_dict()`](`great_tables.GT.to_dict`)), the rendering arguments and the version of Great
+    Tables. Rendering the same table again returns the stored output instead. This is useful in
+    pipelines that regenerate many tables where most of them don't change between runs.
+
+    The directory is bounded in size: once it grows past `max_size=`, the least recently used
+    entries are removed.
+
+    Parameters
+    ----------
+    path
+        The directory to store rendered tables in. It's created if it doesn't exist.
+    max_size
+        The maximum total size of the stored tables, in bytes.
+    callables
+        How to handle tables that hold user-defined functions (e.g., a formatting function passed
+        to `fmt()`). With `"by_name"`, functions are identified by their import path, so changing
+        the body of a function requires clearing the cache (with `clear()`). With `"bypass"`, such
+        tables are always rendered without the cache. Tables that hold lambdas or nested functions
+        can't be identified and are always rendered without the cache.
+    on_event
+        A function that is called for each cache event, with the event name (one of `"hit"`,
+        `"miss"`, `"bypass"`, `"store"`, and `"evict"`) and the key of the entry (`None` for
+        `"bypass"`). This can be used for logging or collecting metrics. Counts of each event are
+        also available from the `stats` attribute.
+
+    Examples
+    --------
+    ```python
+    from great_tables import GT, RenderCache, exibble
+
+    cache = RenderCache("~/.cache/report-tables")
+
+    html = GT(exibble, id="exibble").fmt_number(columns="num").as_raw_html(cache=cache)
+
+    cache.stats
+    ```
+
+    Note that a table without an ID (set with `GT(id=)` or `GT.with_id()`) gets a random ID each
+    time it's rendered, and a cached table keeps the ID it was first rendered with.
+    """
+
+    path: Path
+    max_size: int
+    callables: Literal["by_name", "bypass"]
+    on_event: Callable[[RenderCacheEvent, str | None], None] | None
+    stats: RenderCacheStats
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_size: int = 256 * 1024**2,
+        callables: Literal["by_name", "bypass"] = "by_name",
+        on_event: Callable[[RenderCacheEvent, str | None], None] | None = None,
+    ):
+        if callables not in ("by_name", "bypass"):
+            raise ValueError(f'`callables=` must be "by_name" or "bypass", not {callables!r}.')
+
+        self.path = Path(path).expanduser()
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self.callables = callables
+        self.on_event = on_event
+        self.stats = RenderCacheStats()
+
+    def __repr__(self) -> str:
+        return f"RenderCache({str(self.path)!r}, max_size={self.max_size})"
+
+    def _emit(self, event: RenderCacheEvent, key: str | None) -> None:
+        attr = _STATS_FIELDS[event]
+        setattr(self.stats, attr, getattr(self.stats, attr) + 1)
+
+        if self.on_event is not None:
+            self.on_event(event, key)
+
+    def _entries(self) -> list[Path]:
+        return [p for p in self.path.iterdir() if p.suffix in _SUFFIXES.values()]
+
+    def key(self, gt: GT, kind: Literal["html", "latex"], **render_args: Any) -> str | None:
+        """Return the cache key for rendering a table, or `None` if it can't be cached.
+
+        Parameters
+        ----------
+        gt
+            The table to render.
+        kind
+            The output format, either `"html"` or `"latex"`.
+        **render_args
+            The arguments used for rendering (e.g., `make_page=True`).
+        """
+        import hashlib
+        import json
+
+        from . import __version__
+        from ._serialize import to_dict
+        from ._tbl_data import frame_digest
+
+        try:
+            spec = to_dict(gt)
+        except TypeError:
+            # the table holds functions that can't be identified by name
+            return None
+
+        if self.callables == "bypass" and _has_callables(spec):
+            return None
+
+        setup = {"version": __version__, "kind": kind, "args": render_args, "spec": spec}
+
+        hasher = hashlib.sha256(json.dumps(setup, sort_keys=True).encode("utf-8"))
+
+        try:
+            hasher.update(frame_digest(gt._tbl_data))
+        except TypeError:
+            # the data holds values that can't be pickled
+            return None
+
+        return hasher.hexdigest()
+
+    def get(self, key: str, kind: Literal["html", "latex"]) -> str | None:
+        """Return the stored output for a key, or `None` if there is none."""
+
+        entry = self.path / f"{key}{_SUFFIXES[kind]}"
+        try:
+            text = entry.read_bytes().decode("utf-8")
+        except FileNotFoundError:
+            return None
+
+        # mark the entry as recently used
+        try:
+            os.utime(entry)
+        except FileNotFoundError:
+            pass
+
+        return text
+
+    def put(self, key: str, kind: Literal["html", "latex"], text: str) -> None:
+        """Store the output for a key, removing least recently used entries to stay in size."""
+
+        content = text.encode("utf-8")
+        if len(content) > self.max_size:
+            return
+
+        entry = self.path / f"{key}{_SUFFIXES[kind]}"
+
+        # write to a temporary file first, so other processes and threads never read a partial
+        # entry
+        fd, tmp_name = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_name, entry)
+        finally:
+            if os.path.exists(tmp_name):
+                os.remove(tmp_name)
+        self._emit("store", key)
+
+        self._evict(keep=entry)
+
+    def _evict(self, keep: Path) -> None:
+        sizes: list[tuple[float, int, Path]] = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            sizes.append((stat.st_mtime, stat.st_size, entry))
+
+        total = sum(size for _, size, _ in sizes)
+
+        for _, size, entry in sorted(sizes, key=lambda x: x[0]):
+            if total <= self.max_size:
+                break
+
+            if entry == keep:
+                continue
+
+            try:
+                entry.unlink()
+            except FileNotFoundError:
+                pass
+
+            total -= size
+            self._emit("evict", entry.stem)
+
+    def clear(self) -> None:
+        """Remove all stored tables."""
+
+        for entry in self._entries():
+            try:
+                entry.unlink()
+            except FileNotFoundError:
+                pass
+
+    def size(self) -> int:
+        """Return the total size of the stored tables, in bytes."""
+
+        return sum(entry.stat().st_size for entry in self._entries())
+
+    def _get_or_render(
+        self,
+        gt: GT,
+        kind: Literal["html", "latex"],
+        render: Callable[[], str],
+        **render_args: Any,
+    ) -> str:
+        key = self.key(gt, kind, **render_args)
+        if key is None:
+            self._emit("bypass", None)
+            return render()
+
+        cached = self.get(key, kind)
+        if cached is not None:
+            self._emit("hit", key)
+            return cached
+
+        self._emit("miss", key)
+        text = render()
+        self.put(key, kind, text)
+
+        return text
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import html
 import re
-from dataclasses import fields
+from dataclasses import dataclass, fields
 from functools import partial
 from string import Template
+from typing import Container, Iterator
 
 from importlib_resources import files
 
@@ -85,10 +87,41 @@ def css_add(value: str | int, amount: int):
         raise NotImplementedError(f"Unable to add to CSS value: {value}")
 
 
+def _selector_is_used(selector: str, used: Container[str]) -> bool:
+    """Determine whether every tag name and class in a selector is present in `used`."""
+
+    # Drop pseudo-classes (e.g., `:first-child`) since these don't refer to tags or classes
+    selector = re.sub(r"::?[\w-]+(\([^)]*\))?", "", selector)
+
+    classes = re.findall(r"\.([\w-]+)", selector)
+    tags = re.findall(r"(?:^|[\s>+~])([a-zA-Z][\w-]*)", selector)
+
+    return all(f".{cls}" in used for cls in classes) and all(tag in used for tag in tags)
+
+
+def _prune_css(css: str, used: Container[str]) -> str:
+    """Remove CSS rules whose selectors can't match any of the tag names and classes in `used`."""
+
+    def _replace(match: re.Match[str]) -> str:
+        selectors = match.group(1).split(",")
+        return match.group(0) if any(_selector_is_used(x, used) for x in selectors) else ""
+
+    return re.sub(r"([^{}]+)\{[^{}]*\}", _replace, css)
+
+
 def compile_scss(
-    data: GTData, id: str | None, compress: bool = True, all_important: bool = False
+    data: GTData,
+    id: str | None,
+    compress: bool = True,
+    all_important: bool = False,
+    used: Container[str] | None = None,
 ) -> str:
-    """Return CSS for styling a table, based on options set."""
+    """Return CSS for styling a table, based on options set.
+
+    If `used` is provided, it should contain the tag names (e.g., `"td"`) and class selectors
+    (e.g., `".gt_row"`) that appear in the rendered table. Any default rules that can't match these
+    are then left out of the CSS. The rules for the `table_additional_css` option are always kept.
+    """
 
     # Obtain the SCSS options dictionary
     options = {field.name: getattr(data._options, field.name) for field in fields(data._options)}
@@ -177,6 +210,9 @@ def compile_scss(
 
     compiled_css = Template(gt_styles_default).substitute(final_params)
 
+    if used is not None:
+        compiled_css = _prune_css(compiled_css, used=used)
+
     if has_id:
         compiled_css = re.sub(r"\.gt_", f"#{id} .gt_", compiled_css, count=0, flags=re.MULTILINE)
         compiled_css = re.sub(r"thead", f"#{id} thead", compiled_css, count=0, flags=re.MULTILINE)
@@ -192,3 +228,250 @@ def compile_scss(
     finalized_css = f"{google_font_css}{gt_table_class_str}\n\n{compiled_css}{additional_css_block}"
 
     return finalized_css
+
+
+def compile_interned_styles(interned: dict[str, str], id: str | None) -> str:
+    """Return CSS rules for style declarations that were interned as classes.
+
+    Interned styles stand in for inline `style=` attributes, which take precedence over any rule in
+    the stylesheet. To preserve that precedence, every declaration is marked as `!important`.
+    """
+
+    class_prefix = f"#{id} " if id is not None else ""
+
+    rules: list[str] = []
+    for declarations, class_name in interned.items():
+        parts = _split_declarations(html.unescape(declarations).strip())
+
+        # Avoid doubling up on declarations that were already marked as `!important`
+        declarations = "".join(
+            f"{_IMPORTANT_RE.sub('', part.rstrip())} !important;" for part in parts if part.strip()
+        )
+
+        rules.append(f"{class_prefix}.{class_name} {{ {declarations} }}")
+
+    return "\n".join(rules)
+
+
+_IMPORTANT_RE = re.compile(r"\s*!important$")
+
+
+def _split_declarations(declarations: str) -> list[str]:
+    """Split CSS declarations on the semicolons between them.
+
+    Semicolons inside quotes or parentheses (e.g., in `url('data:image/png;base64,...')`) are part
+    of a value, so they don't end a declaration.
+    """
+
+    parts: list[str] = []
+    start = 0
+    depth = 0
+    quote = None
+    escaped = False
+
+    for ii, char in enumerate(declarations):
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif quote is not None:
+            if char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth = max(depth - 1, 0)
+        elif char == ";" and depth == 0:
+            parts.append(declarations[start:ii])
+            start = ii + 1
+
+    parts.append(declarations[start:])
+
+    return parts
+
+
+# Rules for inlining styles ----
+# With `inline_css="native"`, the HTML renderer writes the declarations of the stylesheet rules that
+# match each element into its `style=` attribute. The renderer knows the tag name, classes and
+# ancestors of every element it creates, so the rules only need selectors made of those: compound
+# selectors of a tag name and classes (along with the `:first-child` and `:last-child`
+# pseudo-classes, and the id of the table's container), joined by descendant or child combinators.
+# This covers the whole default stylesheet. Other rules (like at-rules) are left out.
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/", flags=re.DOTALL)
+_COMPOUND_RE = re.compile(
+    r"(?P<tag>[a-zA-Z][\w-]*|\*)?(?P<id>#[\w-]+)?(?P<classes>(?:\.[\w-]+)*)"
+    r"(?::(?P<pseudo>first-child|last-child))?"
+)
+_COMBINATOR_RE = re.compile(r"\s*(>)\s*|\s+")
+
+
+@dataclass(frozen=True)
+class CssCompound:
+    """A compound selector, like `td.gt_row` or `.gt_column_spanner_outer:first-child`."""
+
+    tag: str | None
+    classes: frozenset[str]
+    pseudo: str | None = None
+
+    # whether this is the id of the table's container (which is an ancestor of every element)
+    is_container: bool = False
+
+
+@dataclass(frozen=True)
+class CssRule:
+    """A stylesheet rule with a selector that the HTML renderer can match against its elements."""
+
+    # Compound selectors from right to left, along with the combinator (`" "` or `">"`) that joins
+    # each one to the compound on its left
+    compounds: tuple[CssCompound, ...]
+    combinators: tuple[str, ...]
+    specificity: tuple[int, int, int]
+    order: int
+    declarations: tuple[tuple[str, str, bool], ...]
+
+
+def compile_rules(data: GTData, id: str | None, all_important: bool = False) -> list[CssRule]:
+    """Return the rules of a table's stylesheet, for writing them into style attributes.
+
+    The rules are read from the same CSS as `compile_scss()` returns, so that inlined styles match
+    the ones the stylesheet would apply.
+    """
+
+    css = compile_scss(data, id=id, compress=False, all_important=all_important)
+
+    rules: list[CssRule] = []
+
+    for selector_list, body in _iter_css_rules(css):
+        declarations = parse_declarations(body)
+
+        if not declarations:
+            continue
+
+        for selector in selector_list.split(","):
+            parsed = _parse_selector(selector, id=id)
+
+            if parsed is None:
+                continue
+
+            compounds, combinators = parsed
+            n_ids = sum(compound.is_container for compound in compounds)
+            n_classes = sum(len(x.classes) + (x.pseudo is not None) for x in compounds)
+            n_tags = sum(x.tag is not None for x in compounds)
+
+            rules.append(
+                CssRule(
+                    compounds=compounds,
+                    combinators=combinators,
+                    specificity=(n_ids, n_classes, n_tags),
+                    order=len(rules),
+                    declarations=declarations,
+                )
+            )
+
+    return rules
+
+
+def parse_declarations(declarations: str) -> tuple[tuple[str, str, bool], ...]:
+    """Parse CSS declarations into `(property, value, important)` tuples."""
+
+    parsed: list[tuple[str, str, bool]] = []
+
+    for part in _split_declarations(declarations):
+        prop, sep, value = part.partition(":")
+        prop = prop.strip().lower()
+        value = value.strip()
+
+        if not sep or not prop or not value:
+            continue
+
+        important = _IMPORTANT_RE.search(value) is not None
+        if important:
+            value = _IMPORTANT_RE.sub("", value)
+
+        parsed.append((prop, value, important))
+
+    return tuple(parsed)
+
+
+def _iter_css_rules(css: str) -> Iterator[tuple[str, str]]:
+    """Yield the selector list and declarations of each top-level rule, skipping at-rules."""
+
+    css = _COMMENT_RE.sub("", css)
+
+    pos = 0
+    while pos < len(css):
+        brace = css.find("{", pos)
+        if brace == -1:
+            return
+
+        prelude = css[pos:brace]
+
+        # Skip statement at-rules (like `@import url(...);`) before the rule
+        at = prelude.find("@")
+        while at != -1 and ";" in prelude[at:]:
+            prelude = prelude[prelude.index(";", at) + 1 :]
+            at = prelude.find("@")
+
+        # Find the end of the block, along with any nested blocks
+        depth = 0
+        end = brace
+        for end in range(brace, len(css)):
+            if css[end] == "{":
+                depth += 1
+            elif css[end] == "}":
+                depth -= 1
+                if depth == 0:
+                    break
+
+        body = css[brace + 1 : end]
+
+        if "@" not in prelude and "{" not in body:
+            yield prelude.strip(), body
+
+        pos = end + 1
+
+
+def _parse_selector(
+    selector: str, id: str | None
+) -> tuple[tuple[CssCompound, ...], tuple[str, ...]] | None:
+    """Parse a selector into compounds and combinators, or return `None` if it's unsupported."""
+
+    pieces = _COMBINATOR_RE.split(selector.strip())
+
+    # With a capture group in the pattern, `re.split()` interleaves the compounds with the captured
+    # combinator (`">"`, or `None` for whitespace)
+    compound_strs = pieces[0::2]
+    combinators = tuple(" " if x is None else x for x in pieces[1::2])
+
+    compounds: list[CssCompound] = []
+    for ii, compound_str in enumerate(compound_strs):
+        match = _COMPOUND_RE.fullmatch(compound_str)
+        if not compound_str or match is None:
+            return None
+
+        tag, id_part, classes, pseudo = match.group("tag", "id", "classes", "pseudo")
+
+        if id_part is not None:
+            # An id can only refer to the table's container, which wraps all other elements
+            if ii > 0 or id_part[1:] != id or tag or classes or pseudo:
+                return None
+
+            compounds.append(CssCompound(tag=None, classes=frozenset(), is_container=True))
+            continue
+
+        compounds.append(
+            CssCompound(
+                tag=None if tag in (None, "*") else tag.lower(),
+                classes=frozenset(classes.split(".")[1:]),
+                pseudo=pseudo,
+            )
+        )
+
+    if compounds[-1].is_container:
+        # the container itself isn't styled by the renderer
+        return None
+
+    return tuple(reversed(compounds)), tuple(reversed(combinators))
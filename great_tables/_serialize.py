@@ -0,0 +1,555 @@
+from __future__ import annotations
+
+import importlib
+from dataclasses import fields, is_dataclass, replace
+from datetime import date, datetime, time
+from enum import Enum
+from functools import cache, partial
+from itertools import groupby
+from typing import TYPE_CHECKING, Any
+
+from ._formats import FORMATTER_METHODS
+from ._gt_data import (
+    Boxhead,
+    CellMask,
+    CellRectangle,
+    CellSubset,
+    FootnoteInfo,
+    FormatFns,
+    FormatInfo,
+    FormatterCall,
+    GoogleFontImports,
+    GroupRows,
+    Options,
+    Spanners,
+    Stub,
+    StyleInfo,
+    SummaryRows,
+    _nonzero,
+    entry_run_key,
+)
+from ._tbl_data import DataFrameLike, PlExpr, get_column_names, n_rows, validate_frame
+from ._utils import PersistentList
+
+if TYPE_CHECKING:
+    from .gt import GT
+
+# Version of the layout produced by `GT.to_dict()`; bump it for changes that older versions of
+# `GT.from_dict()` couldn't read
+SPEC_VERSION = 1
+
+_TYPE_KEY = "__type__"
+
+
+@cache
+def _registered_types() -> dict[str, type]:
+    """Classes that can appear in a serialized table, by name."""
+
+    from ._cols_merge import ColMergeInfo
+    from ._gt_data import (
+        ColInfo,
+        ColInfoTypeEnum,
+        FootnotePlacement,
+        Heading,
+        SpannerInfo,
+        SummaryRowInfo,
+        TextTransformInfo,
+    )
+    from ._helpers import GoogleFont, UnitDefinition, UnitDefinitionList
+    from ._locations import FootnoteEntry, Loc
+    from ._styles import CellStyle
+    from ._text import BaseText
+
+    def subclasses(cls: type) -> list[type]:
+        return [cls, *(sub for child in cls.__subclasses__() for sub in subclasses(child))]
+
+    classes = [
+        ColInfo,
+        ColInfoTypeEnum,
+        ColMergeInfo,
+        FootnoteEntry,
+        FootnotePlacement,
+        GoogleFont,
+        Heading,
+        SpannerInfo,
+        SummaryRowInfo,
+        TextTransformInfo,
+        UnitDefinition,
+        UnitDefinitionList,
+        *subclasses(Loc),
+        *subclasses(CellStyle),
+        *subclasses(BaseText),
+    ]
+
+    return {cls.__name__: cls for cls in classes}
+
+
+def _import_ref(ref: str) -> Any:
+    module_name, _, qualname = ref.partition(":")
+    obj = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr)
+
+    return obj
+
+
+def _callable_ref(fn: Any, where: str) -> str:
+    module = getattr(fn, "__module__", None)
+    qualname = getattr(fn, "__qualname__", "")
+
+    if module is not None and "<" not in qualname:
+        ref = f"{module}:{qualname}"
+        try:
+            if _import_ref(ref) is fn:
+                return ref
+        except (ImportError, AttributeError):
+            pass
+
+    raise TypeError(
+        f"The function {fn!r} in {where} can't be serialized. Only functions that can be imported "
+        "by name (e.g., defined at the top level of a module) are supported, not lambdas or "
+        "nested functions."
+    )
+
+
+def _encode(obj: Any, where: str) -> Any:
+    """Convert a value to a form made of JSON types only.
+
+    Values other than JSON scalars and lists are stored as objects with a `__type__` key.
+    """
+
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+
+    if isinstance(obj, (list, PersistentList)):
+        return [_encode(x, where) for x in obj]
+
+    if isinstance(obj, (tuple, set, frozenset)):
+        return {_TYPE_KEY: type(obj).__name__, "items": [_encode(x, where) for x in obj]}
+
+    if isinstance(obj, dict):
+        items = [[_encode(k, where), _encode(v, where)] for k, v in obj.items()]
+        return {_TYPE_KEY: "dict", "items": items}
+
+    if isinstance(obj, (datetime, date, time)):
+        return {_TYPE_KEY: type(obj).__name__, "value": obj.isoformat()}
+
+    if isinstance(obj, PlExpr):
+        return {_TYPE_KEY: "polars.Expr", "value": obj.meta.serialize(format="json")}
+
+    if isinstance(obj, FormatFns):
+        fns = {context: _encode(fn, where) for context, fn in vars(obj).items()}
+        return {_TYPE_KEY: "FormatFns", **fns}
+
+    cls = type(obj)
+    if _registered_types().get(cls.__name__) is cls:
+        if isinstance(obj, Enum):
+            return {_TYPE_KEY: cls.__name__, "name": obj.name}
+
+        if is_dataclass(obj):
+            values = {f.name: _encode(getattr(obj, f.name), where) for f in fields(obj) if f.init}
+        else:
+            # UnitStr is the only registered class that isn't a dataclass
+            values = {"units_str": _encode(obj.units_str, where)}
+
+        return {_TYPE_KEY: cls.__name__, **values}
+
+    if isinstance(obj, partial):
+        return {
+            _TYPE_KEY: "partial",
+            "func": _encode(obj.func, where),
+            "args": _encode(list(obj.args), where),
+            "keywords": _encode(obj.keywords, where),
+        }
+
+    if callable(obj):
+        return {_TYPE_KEY: "callable", "ref": _callable_ref(obj, where)}
+
+    if cls.__module__ == "numpy" and hasattr(obj, "item"):
+        # numpy scalars
+        return _encode(obj.item(), where)
+
+    raise TypeError(f"Objects of type `{cls.__name__}` in {where} can't be serialized.")
+
+
+def _decode(obj: Any) -> Any:
+    """Reverse `_encode()`."""
+
+    if isinstance(obj, list):
+        return [_decode(x) for x in obj]
+
+    if not isinstance(obj, dict):
+        return obj
+
+    type_name = obj[_TYPE_KEY]
+
+    if type_name in ("tuple", "set", "frozenset"):
+        return {"tuple": tuple, "set": set, "frozenset": frozenset}[type_name](
+            _decode(x) for x in obj["items"]
+        )
+
+    if type_name == "dict":
+        return {_decode(k): _decode(v) for k, v in obj["items"]}
+
+    if type_name in ("datetime", "date", "time"):
+        return {"datetime": datetime, "date": date, "time": time}[type_name].fromisoformat(
+            obj["value"]
+        )
+
+    if type_name == "polars.Expr":
+        from io import StringIO
+
+        import polars as pl
+
+        return pl.Expr.deserialize(StringIO(obj["value"]), format="json")
+
+    if type_name == "FormatFns":
+        return FormatFns(**{k: _decode(v) for k, v in obj.items() if k != _TYPE_KEY})
+
+    if type_name == "partial":
+        return partial(_decode(obj["func"]), *_decode(obj["args"]), **_decode(obj["keywords"]))
+
+    if type_name == "callable":
+        return _import_ref(obj["ref"])
+
+    cls = _registered_types().get(type_name)
+    if cls is None:
+        raise ValueError(f"Unknown type `{type_name}` in the table spec.")
+
+    if issubclass(cls, Enum):
+        return cls[obj["name"]]
+
+    return cls(**{k: _decode(v) for k, v in obj.items() if k != _TYPE_KEY})
+
+
+def _encode_cells(entries: list[Any], where: str) -> list[list[Any]]:
+    return [
+        [_encode(entry.grpname, where), entry.colname, entry.rownum, entry.colnum]
+        for entry in entries
+    ]
+
+
+def _encode_cell_set(cells: CellSubset, n: int) -> dict[str, Any]:
+    if isinstance(cells, CellMask):
+        return {"masks": {col: _nonzero(mask) for col, mask in cells.masks.items()}}
+
+    if isinstance(cells, CellRectangle):
+        rows = list(cells.rows)
+        return {"columns": cells.cols, "rows": None if rows == list(range(n)) else rows}
+
+    raise TypeError(f"Cells of type {type(cells).__name__} can't be serialized.")
+
+
+def _decode_cell_set(entry: dict[str, Any], n: int) -> CellSubset:
+    if "masks" in entry:
+        masks: dict[str, bytes] = {}
+        for col, rows in entry["masks"].items():
+            mask = bytearray(n)
+            for row in rows:
+                mask[row] = 1
+            masks[col] = bytes(mask)
+
+        return CellMask(masks)
+
+    rows = entry["rows"]
+    return CellRectangle(entry["columns"], range(n) if rows is None else rows)
+
+
+def _encode_styles(styles: list[StyleInfo], n: int) -> list[dict[str, Any]]:
+    # styles added by one call share a location and style objects, so they are stored once per
+    # run of entries along with the cells they apply to
+    out: list[dict[str, Any]] = []
+    for _, run in groupby(styles, key=entry_run_key):
+        run = list(run)
+        loc = _encode(run[0].locname, "styles")
+        styles = _encode(run[0].styles, "styles")
+
+        if run[0].cells is not None:
+            # styles that were stored for a set of cells
+            out.extend(
+                {"loc": loc, "styles": styles, "cell_set": _encode_cell_set(entry.cells, n)}
+                for entry in run
+            )
+        else:
+            out.append({"loc": loc, "styles": styles, "cells": _encode_cells(run, "styles")})
+
+    return out
+
+
+def _decode_styles(entries: list[dict[str, Any]], n: int) -> list[StyleInfo]:
+    out: list[StyleInfo] = []
+    for entry in entries:
+        loc = _decode(entry["loc"])
+        styles = _decode(entry["styles"])
+
+        if "cell_set" in entry:
+            out.append(StyleInfo(loc, styles=styles, cells=_decode_cell_set(entry["cell_set"], n)))
+            continue
+
+        out.extend(
+            StyleInfo(loc, _decode(grpname), colname, rownum, colnum, styles)
+            for grpname, colname, rownum, colnum in entry["cells"]
+        )
+
+    return out
+
+
+def _encode_footnotes(footnotes: list[FootnoteInfo]) -> list[dict[str, Any]]:
+    out: list[dict[str, Any]] = []
+    for _, run in groupby(footnotes, key=entry_run_key):
+        run = list(run)
+        out.append(
+            {
+                "loc": _encode(run[0].locname, "footnotes"),
+                "footnotes": _encode(run[0].footnotes, "footnotes"),
+                "placement": _encode(run[0].placement, "footnotes"),
+                "cells": _encode_cells(run, "footnotes"),
+            }
+        )
+
+    return out
+
+
+def _decode_footnotes(entries: list[dict[str, Any]]) -> list[FootnoteInfo]:
+    out: list[FootnoteInfo] = []
+    for entry in entries:
+        loc = _decode(entry["loc"])
+        footnotes = _decode(entry["footnotes"])
+        placement = _decode(entry["placement"])
+        out.extend(
+            FootnoteInfo(loc, _decode(grpname), colname, rownum, colnum, footnotes, placement)
+            for grpname, colname, rownum, colnum in entry["cells"]
+        )
+
+    return out
+
+
+def _encode_formats(
+    formats: list[FormatInfo], n: int, is_substitution: bool
+) -> list[dict[str, Any]]:
+    out: list[dict[str, Any]] = []
+    for ii, info in enumerate(formats):
+        call = info.call
+        if call is None:
+            # a formatter not added through a formatting method can still be stored as a call to
+            # fmt(), as long as its functions can be imported by name
+            rows = info.rows_expr if info.rows_expr is not None else info.cells.rows
+            call = FormatterCall(
+                "fmt", {"fns": info.func, "rows": rows, "is_substitution": is_substitution}
+            )
+
+        where = f"the arguments to {call.name}() (formatter {ii})"
+        out.append(
+            {
+                "method": call.name,
+                "args": {
+                    k: _encode(v, where)
+                    for k, v in call.args.items()
+                    # column selections are stored resolved, except for single column names (which
+                    # some methods require)
+                    if k != "columns" or isinstance(v, str)
+                },
+                "columns": info.cells.cols,
+                "rows": None if info.cells.rows == list(range(n)) else info.cells.rows,
+            }
+        )
+
+    return out
+
+
+def _apply_formats(gt: GT, entries: list[dict[str, Any]], is_substitution: bool) -> GT:
+    n = n_rows(gt._tbl_data)
+
+    for entry in entries:
+        method = FORMATTER_METHODS.get(entry["method"])
+        if method is None:
+            raise ValueError(f"Unknown formatting method `{entry['method']}` in the table spec.")
+
+        args = {"columns": entry["columns"], **{k: _decode(v) for k, v in entry["args"].items()}}
+        gt = method(gt, **args)
+
+        # the method resolved its rows again, but the cells are restored exactly, in case
+        # resolving them depended on the state of the table when the method was first called
+        rows = list(range(n)) if entry["rows"] is None else entry["rows"]
+        added = gt._substitutions[-1] if is_substitution else gt._formats[-1]
+        added.cells = CellRectangle(entry["columns"], rows)
+
+    return gt
+
+
+def to_dict(self: GT) -> dict[str, Any]:
+    """Convert the table's setup into a dictionary that can be serialized.
+
+    The dictionary describes everything set up on the table, like formatting, styling, labels,
+    spanners, footnotes and options, using only types that JSON supports (so it can be written
+    with `json.dumps()`, or with other serializers like msgpack). Formatters are stored as the name
+    of the formatting method used to create them (e.g., `"fmt_number"`), along with its arguments.
+    The table's data is not included; it's supplied again when the table is rebuilt with
+    [`GT.from_dict()`](`great_tables.GT.from_dict`).
+
+    Since a table built this way can be passed between processes and machines, this is useful for
+    handing tables off to separate rendering workers.
+
+    Functions passed to methods (e.g., custom formatting functions given to `fmt()`) are stored by
+    their import path, so they need to be importable by name where the table is rebuilt. Lambdas
+    and nested functions can't be serialized, and result in an error.
+
+    Returns
+    -------
+    dict[str, Any]
+        A dictionary describing the table.
+
+    Examples
+    --------
+    Let's make a table and convert it to a JSON string.
+
+    ```{python}
+    import json
+    from great_tables import GT, exibble
+
+    gt = (
+        GT(exibble, rowname_col="row")
+        .fmt_number(columns="num", decimals=1)
+        .tab_header(title="Exibble")
+    )
+
+    spec = json.dumps(gt.to_dict())
+    ```
+
+    The table can then be rebuilt from the JSON string and the data.
+
+    ```{python}
+    GT.from_dict(json.loads(spec), exibble)
+    ```
+    """
+
+    n = n_rows(self._tbl_data)
+    default_options = Options()
+
+    return {
+        "spec_version": SPEC_VERSION,
+        "data": {"columns": get_column_names(self._tbl_data), "n_rows": n},
+        "locale": self._locale._locale if self._locale is not None else None,
+        "boxhead": _encode(list(self._boxhead), "the column info"),
+        "row_groups": [
+            _encode([info.group_id, info.group_label, info.summary_row_side], "the row groups")
+            for info in self._stub.group_rows
+        ],
+        "spanners": _encode(list(self._spanners), "the spanners"),
+        "heading": _encode(self._heading, "the heading"),
+        "stubhead": _encode(self._stubhead, "the stubhead"),
+        "source_notes": _encode(self._source_notes, "the source notes"),
+        "summary_rows": _encode(self._summary_rows._d, "the summary rows"),
+        "summary_rows_grand": _encode(self._summary_rows_grand._d, "the grand summary rows"),
+        "styles": _encode_styles(self._styles, n),
+        "footnotes": _encode_footnotes(self._footnotes),
+        "formats": _encode_formats(self._formats, n, is_substitution=False),
+        "substitutions": _encode_formats(self._substitutions, n, is_substitution=True),
+        "col_merge": _encode(self._col_merge, "the column merges"),
+        "transforms": _encode(self._transforms, "the text transforms"),
+        "options": {
+            f.name: _encode(getattr(self._options, f.name).value, f"option `{f.name}`")
+            for f in fields(self._options)
+            if getattr(self._options, f.name) != getattr(default_options, f.name)
+        },
+        "google_font_imports": sorted(self._google_font_imports.imports),
+    }
+
+
+def from_dict(cls: type[GT], spec: dict[str, Any], data: DataFrameLike) -> GT:
+    """Rebuild a table from a dictionary created by `GT.to_dict()`.
+
+    Parameters
+    ----------
+    spec
+        A dictionary created by [`GT.to_dict()`](`great_tables.GT.to_dict`) (e.g., after a round
+        trip through `json.dumps()` and `json.loads()`).
+    data
+        The table's data. It must have the same columns and number of rows as the data of the
+        table the dictionary was created from.
+
+    Returns
+    -------
+    GT
+        A GT object equivalent to the one the dictionary was created from.
+
+    Notes
+    -----
+    Functions stored in the dictionary are imported by name, so only rebuild tables from
+    dictionaries that come from a trusted source.
+    """
+
+    if spec.get("spec_version") != SPEC_VERSION:
+        raise ValueError(
+            f"Unsupported table spec version: {spec.get('spec_version')!r} (expected "
+            f"{SPEC_VERSION})."
+        )
+
+    data = validate_frame(data)
+
+    columns = spec["data"]["columns"]
+    if set(get_column_names(data)) != set(columns):
+        raise ValueError(
+            f"The data's columns {get_column_names(data)} don't match the columns of the table "
+            f"spec {columns}."
+        )
+
+    if n_rows(data) != spec["data"]["n_rows"]:
+        raise ValueError(
+            f"The data has {n_rows(data)} rows, but the table spec was created from data with "
+            f"{spec['data']['n_rows']} rows."
+        )
+
+    boxhead = Boxhead(_decode(spec["boxhead"]))
+    stub_info = boxhead._get_stub_column()
+    group_info = boxhead._get_row_group_column()
+    rowname_col = stub_info.var if stub_info is not None else None
+    groupname_col = group_info.var if group_info is not None else None
+
+    # column alignments are restored with the boxhead, so they aren't inferred from the data
+    gt = cls(
+        data,
+        rowname_col=rowname_col,
+        groupname_col=groupname_col,
+        auto_align=False,
+        locale=spec["locale"],
+    )
+
+    # restore the order and labels of row groups, with row indices taken from the data
+    group_rows = {info.group_id: info for info in gt._stub.group_rows}
+    restored = []
+    for group_id, group_label, summary_row_side in _decode(spec["row_groups"]):
+        if group_id in group_rows:
+            info = group_rows.pop(group_id)
+            restored.append(
+                replace(info, group_label=group_label, summary_row_side=summary_row_side)
+            )
+    stub = Stub(gt._stub.rows, GroupRows([*restored, *group_rows.values()]))
+
+    options = Options()
+    for name, value in spec["options"].items():
+        options = replace(options, **{name: replace(getattr(options, name), value=_decode(value))})
+
+    gt = gt._replace(
+        _boxhead=boxhead,
+        _stub=stub,
+        _spanners=Spanners(_decode(spec["spanners"])),
+        _heading=_decode(spec["heading"]),
+        _stubhead=_decode(spec["stubhead"]),
+        _source_notes=_decode(spec["source_notes"]),
+        _summary_rows=SummaryRows(_decode(spec["summary_rows"])),
+        _summary_rows_grand=SummaryRows(
+            _decode(spec["summary_rows_grand"]), _is_grand_summary=True
+        ),
+        _styles=PersistentList(_decode_styles(spec["styles"], n_rows(data))),
+        _footnotes=PersistentList(_decode_footnotes(spec["footnotes"])),
+        _col_merge=_decode(spec["col_merge"]),
+        _transforms=PersistentList(_decode(spec["transforms"])),
+        _options=options,
+        _google_font_imports=GoogleFontImports(frozenset(spec["google_font_imports"])),
+    )
+
+    gt = _apply_formats(gt, spec["formats"], is_substitution=False)
+    gt = _apply_formats(gt, spec["substitutions"], is_substitution=True)
+
+    return gt
@@ -0,0 +1,322 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from itertools import groupby
+from typing import TYPE_CHECKING, Any
+
+from ._gt_data import (
+    Body,
+    CellRectangle,
+    FootnoteInfo,
+    FormatInfo,
+    Stub,
+    StyleInfo,
+    entry_run_key,
+)
+from ._locations import LocBody, LocStub, resolve_rows_i
+from ._styles import CellStyleFromData
+from ._tbl_data import DataFrameLike, _get_column_dtype, get_column_names, n_rows, validate_frame
+from ._utils import PersistentList
+
+if TYPE_CHECKING:
+    from .gt import GT
+
+
+@dataclass(frozen=True)
+class _RowTemplate:
+    """A run of styles or footnotes at a row-level location, to be expanded over all rows."""
+
+    loc: LocBody | LocStub
+    columns: list[str | None]
+    entry: StyleInfo | FootnoteInfo
+
+    def expand(self, n: int) -> list[Any]:
+        if isinstance(self.entry, StyleInfo) and self.entry.cells is not None:
+            return [replace(self.entry, cells=CellRectangle(self.columns, range(n)))]
+
+        return [
+            replace(self.entry, colname=colname, rownum=row)
+            for colname in self.columns
+            for row in range(n)
+        ]
+
+
+def _compile_row_entries(
+    entries: list[Any], kind: str, problems: list[str]
+) -> list[Any | _RowTemplate]:
+    """Replace runs of entries that cover every row with templates that can be re-expanded."""
+
+    compiled: list[Any | _RowTemplate] = []
+
+    for _, run in groupby(entries, key=entry_run_key):
+        run = list(run)
+        first = run[0]
+
+        is_cell_set = isinstance(first, StyleInfo) and first.cells is not None
+
+        if first.rownum is None and not is_cell_set:
+            # not tied to rows (e.g., the header or column labels)
+            compiled.extend(run)
+            continue
+
+        loc = first.locname
+
+        if not isinstance(loc, (LocBody, LocStub)):
+            problems.append(f"{kind} at {type(loc).__name__} locations")
+            continue
+
+        if loc.rows is not None or getattr(loc, "mask", None) is not None:
+            problems.append(
+                f"{kind} at locations that select rows (`{type(loc).__name__}` with rows= or mask=)"
+            )
+            continue
+
+        if is_cell_set and any(isinstance(style, CellStyleFromData) for style in first.styles):
+            problems.append("styles computed from the data (e.g., with from_column())")
+            continue
+
+        if is_cell_set:
+            # styles stored once for a set of cells, which covers all rows
+            compiled.extend(
+                _RowTemplate(loc=loc, columns=list(entry.cells.cols), entry=entry) for entry in run
+            )
+            continue
+
+        if kind == "styles" and isinstance(loc, LocBody) and len(run) == 1:
+            # a style computed from the data (e.g. from_column()) yields new style objects for
+            # each cell, so a lone entry can't be told apart from a static style
+            problems.append("styles computed from the data (e.g., with from_column())")
+            continue
+
+        columns = list(dict.fromkeys(entry.colname for entry in run))
+        compiled.append(_RowTemplate(loc=loc, columns=columns, entry=first))
+
+    return compiled
+
+
+def _expand_row_entries(compiled: list[Any | _RowTemplate], n: int) -> list[Any]:
+    out: list[Any] = []
+    for item in compiled:
+        if isinstance(item, _RowTemplate):
+            out.extend(item.expand(n))
+        else:
+            out.append(item)
+
+    return out
+
+
+def _frame_schema(data: DataFrameLike) -> dict[str, str]:
+    return {col: str(_get_column_dtype(data, col)) for col in get_column_names(data)}
+
+
+class GTSpec:
+    """A table specification that can be applied to new data.
+
+    A `GTSpec` is created with [`GT.freeze()`](`great_tables.GT.freeze`). It holds everything set
+    up on a table (formatting, styling, labels, spanners, options, and so on) along with the
+    resolved column selections, and creates a new `GT` for any table of the same schema through
+    [`with_data()`](`great_tables.GTSpec.with_data`).
+    """
+
+    _gt: GT
+    _schema: dict[str, str]
+    _frame_type: type
+    _group_order: list[Any] | None
+    _styles: list[Any]
+    _footnotes: list[Any]
+
+    def __init__(self, gt: GT):
+        problems: list[str] = []
+        n = n_rows(gt._tbl_data)
+
+        if gt._summary_rows or gt._summary_rows_grand:
+            problems.append("summary rows (their values are computed from the data)")
+
+        for info in [*gt._formats, *gt._substitutions]:
+            if info.uses_data:
+                problems.append("formatters that hold values from the data (e.g., fmt_nanoplot())")
+                break
+
+        full_rows = list(range(n))
+        for merge in gt._col_merge:
+            if merge.rows != full_rows:
+                problems.append("column merges that apply to a subset of rows")
+                break
+
+        self._styles = _compile_row_entries(gt._styles, "styles", problems)
+        self._footnotes = _compile_row_entries(gt._footnotes, "footnotes", problems)
+
+        if problems:
+            problem_list = "\n".join(f"  * {problem}" for problem in dict.fromkeys(problems))
+            raise ValueError(
+                "This table can't be frozen into a spec, since parts of it depend on the values in "
+                f"its data:\n\n{problem_list}\n\n"
+                "Apply these to the GT returned by `GTSpec.with_data()` instead."
+            )
+
+        self._gt = gt
+        self._schema = _frame_schema(gt._tbl_data)
+        self._frame_type = type(gt._tbl_data)
+
+        # Only keep the group order if it was changed (e.g. with row_group_order()); otherwise
+        # groups should follow their order of appearance in the new data
+        stub_col, group_col = self._stub_columns()
+        default_stub = Stub.from_data(gt._tbl_data, rowname_col=stub_col, groupname_col=group_col)
+        if gt._stub.group_ids != default_stub.group_ids:
+            self._group_order = gt._stub.group_ids
+        else:
+            self._group_order = None
+
+    def __repr__(self) -> str:
+        return f"<GTSpec: {len(self._schema)} columns>"
+
+    def _stub_columns(self) -> tuple[str | None, str | None]:
+        stub_info = self._gt._boxhead._get_stub_column()
+        group_info = self._gt._boxhead._get_row_group_column()
+
+        return (
+            stub_info.var if stub_info is not None else None,
+            group_info.var if group_info is not None else None,
+        )
+
+    def _validate_schema(self, data: DataFrameLike) -> None:
+        if not isinstance(data, self._frame_type):
+            raise TypeError(
+                f"The spec was created from a {self._frame_type.__name__}, but the new data is a "
+                f"{type(data).__name__}."
+            )
+
+        schema = _frame_schema(data)
+
+        missing = [col for col in self._schema if col not in schema]
+        extra = [col for col in schema if col not in self._schema]
+        mismatched = [
+            f"{col} ({self._schema[col]} -> {schema[col]})"
+            for col in self._schema
+            if col in schema and schema[col] != self._schema[col]
+        ]
+
+        errors = []
+        if missing:
+            errors.append(f"Missing columns: {missing}")
+        if extra:
+            errors.append(f"Unexpected columns: {extra}")
+        if mismatched:
+            errors.append(f"Columns with a different type: {mismatched}")
+
+        if errors:
+            raise ValueError(
+                "The new data does not match the schema of the spec.\n\n" + "\n".join(errors)
+            )
+
+    def with_data(self, data: DataFrameLike) -> GT:
+        """Create a table from the spec, using new data.
+
+        The new data must have the same columns, with the same types, as the data the spec was
+        created from (the order of columns may differ). Only the data-dependent parts of the table
+        are set up again: the stub and row groups, and the rows targeted by formatters, styles and
+        footnotes. Column selections, labels, alignments, spanners and options are reused as is.
+
+        Parameters
+        ----------
+        data
+            A DataFrame object with the same schema as the data used to create the spec.
+
+        Returns
+        -------
+        GT
+            A new GT object for `data`.
+
+        Examples
+        --------
+        ```{python}
+        import polars as pl
+        from great_tables import GT
+
+        df = pl.DataFrame({"name": ["a", "b"], "value": [1.2345, 2.3456]})
+
+        spec = GT(df, rowname_col="name").fmt_number(columns="value", decimals=1).freeze()
+
+        spec.with_data(pl.DataFrame({"name": ["c", "d", "e"], "value": [3.1, 4.22, 5.333]}))
+        ```
+        """
+
+        self._validate_schema(data)
+        data = validate_frame(data)
+
+        gt = self._gt
+        n = n_rows(data)
+
+        stub_col, group_col = self._stub_columns()
+        stub = Stub.from_data(data, rowname_col=stub_col, groupname_col=group_col)
+
+        if self._group_order is not None:
+            present = set(stub.group_ids)
+            stub = stub.order_groups([g for g in self._group_order if g in present])
+
+        new = gt._replace(_tbl_data=data, _body=Body.from_empty(data), _stub=stub)
+
+        def rebind(info: FormatInfo) -> FormatInfo:
+            if info.rows_expr is None:
+                rows = list(range(n))
+            else:
+                rows = [pos for _, pos in resolve_rows_i(new, info.rows_expr)]
+
+            return FormatInfo(
+                info.func, info.cells.cols, rows, rows_expr=info.rows_expr, call=info.call
+            )
+
+        return new._replace(
+            _formats=PersistentList(rebind(info) for info in gt._formats),
+            _substitutions=PersistentList(rebind(info) for info in gt._substitutions),
+            _styles=PersistentList(_expand_row_entries(self._styles, n)),
+            _footnotes=PersistentList(_expand_row_entries(self._footnotes, n)),
+            _col_merge=[replace(merge, rows=list(range(n))) for merge in gt._col_merge],
+        )
+
+
+def freeze(self: GT) -> GTSpec:
+    """Freeze the table into a spec that can be applied to new data.
+
+    Dashboards and reports often build the same table over and over, each time with fresh data.
+    With `freeze()`, the table is set up once and turned into a
+    [`GTSpec`](`great_tables.GTSpec`), whose [`with_data()`](`great_tables.GTSpec.with_data`)
+    method creates a new `GT` for data of the same schema. Column selections are resolved only
+    once and column alignments are not inferred again, so only the data-dependent parts of the
+    table are redone.
+
+    Parts of a table that depend on the values in its data can't be carried over to other data.
+    These are summary rows, formatters that hold values from the data (like `fmt_nanoplot()`),
+    styles computed from the data (like `from_column()` and `data_color()`), and styles,
+    footnotes or column merges that select particular rows. A table with any of these raises an
+    error when frozen, and they should be applied to the result of `with_data()` instead.
+
+    Returns
+    -------
+    GTSpec
+        A spec holding the table's setup.
+
+    Examples
+    --------
+    Let's set up a table with the first few rows of the `exibble` dataset, and freeze it.
+
+    ```{python}
+    from great_tables import GT, exibble
+
+    spec = (
+        GT(exibble.head(3), rowname_col="row")
+        .fmt_number(columns="num", decimals=1)
+        .fmt_currency(columns="currency")
+        .tab_header(title="Exibble")
+        .freeze()
+    )
+    ```
+
+    The spec can now be used to make the same table from other rows.
+
+    ```{python}
+    spec.with_data(exibble.tail(3))
+    ```
+    """
+
+    return GTSpec(self)
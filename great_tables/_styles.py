@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, fields, replace
-from typing import TYPE_CHECKING, Any, Callable, Literal, Union
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Literal, Union
 
 from typing_extensions import Self, TypeAlias
 
 from ._helpers import GoogleFont, px
-from ._tbl_data import PlExpr, TblData, _get_cell, eval_transform
+from ._tbl_data import PlExpr, TblData, _get_cell, eval_transform, n_rows, to_list
 
 if TYPE_CHECKING:
     from ._locations import Loc
@@ -89,9 +90,15 @@ class FromValues:
 class CellStyle:
     """A style specification."""
 
+    # whether the CSS depends on the row it's rendered for
+    _varies_by_row: ClassVar[bool] = False
+
     def _to_html_style(self) -> str:
         raise NotImplementedError
 
+    def _to_html_style_for_row(self, row: int | None) -> str:
+        return self._to_html_style()
+
     def _evaluate_expressions(self, data: TblData) -> Self:
         new_fields: dict[str, FromValues] = {}
         for field in fields(self):
@@ -128,6 +135,56 @@ class CellStyle:
 
         return replace(self, **new_fields)
 
+    def _css_by_row(self, data: TblData, rows: Iterable[int]) -> list[str | None]:
+        """Return the CSS declarations of this style for each row of the data.
+
+        Fields with FromColumn or FromValues are fetched for the whole column at once, and each
+        distinct combination of field values is rendered once. Rows not in `rows` are None.
+        """
+
+        names: list[str] = []
+        columns: list[list[Any]] = []
+        fns: list[Callable[[Any], Any] | None] = []
+        for field in fields(self):
+            attr = getattr(self, field.name)
+            if isinstance(attr, FromColumn):
+                names.append(field.name)
+                columns.append(to_list(data[attr.column]))
+                fns.append(attr.fn)
+            elif isinstance(attr, FromValues):
+                names.append(field.name)
+                columns.append(attr.values)
+                fns.append(None)
+
+        css: list[str | None] = [None] * n_rows(data)
+        rendered: dict[tuple[Any, ...], str] = {}
+
+        for row in rows:
+            values = tuple(
+                col[row] if fn is None else fn(col[row]) for col, fn in zip(columns, fns)
+            )
+
+            try:
+                css[row] = rendered[values]
+            except KeyError:
+                css[row] = rendered[values] = self._with_values(names, values)
+            except TypeError:
+                # values that can't be hashed (e.g. lists) are rendered each time
+                css[row] = self._with_values(names, values)
+
+        return css
+
+    def _with_values(self, names: list[str], values: tuple[Any, ...]) -> str:
+        return replace(self, **dict(zip(names, values)))._to_html_style()
+
+    def _requires_data(self) -> bool:
+        """Return whether any field takes its values from the data (e.g., with from_column())."""
+
+        return any(
+            isinstance(getattr(self, field.name), (FromColumn, FromValues))
+            for field in fields(self)
+        )
+
     def _raise_if_requires_data(self, loc: Loc):
         for field in fields(self):
             attr = getattr(self, field.name)
@@ -139,6 +196,27 @@ class CellStyle:
                 )
 
 
+@dataclass
+class CellStyleFromData(CellStyle):
+    """A style computed from the data, rendered to CSS for each row.
+
+    Styles whose values come from the data (e.g., with `from_column()`) are turned into this
+    class when they're applied to the table body. `css` holds the declarations for each row of
+    the data, and is None for rows that aren't styled.
+    """
+
+    css: list[str | None]
+
+    _varies_by_row: ClassVar[bool] = True
+
+    def _to_html_style(self) -> str:
+        raise TypeError("CellStyleFromData can only be rendered for a row of the data.")
+
+    def _to_html_style_for_row(self, row: int | None) -> str:
+        res = self.css[row] if row is not None else None
+        return "" if res is None else res
+
+
 @dataclass
 class CellStyleCss(CellStyle):
     """A style specification for custom CSS rules.
@@ -383,11 +461,10 @@ class CellStyleBorders(CellStyle):
             return ""
 
         # If self.sides is a string, convert to a list
-        if isinstance(self.sides, str):
-            self.sides = [self.sides]
+        sides = [self.sides] if isinstance(self.sides, str) else self.sides
 
         # If 'all' is provided then call the function recursively with all sides
-        if "all" in self.sides:
+        if "all" in sides:
             return CellStyleBorders(
                 sides=["top", "bottom", "left", "right"],
                 color=self.color,
@@ -403,10 +480,38 @@ class CellStyleBorders(CellStyle):
         style = self.style
 
         border_css_list: list[str] = []
-        for side in self.sides:
+        for side in sides:
             if side not in ("top", "bottom", "left", "right"):
                 raise ValueError(f"Invalid side '{side}' provided.")
             border_css_list.append(f"border-{side}: {weight} {style} {color};")
 
         border_css = "".join(border_css_list)
         return border_css
+
+
+# CSS for combined styles ==============================================================
+
+
+def _styles_to_css(
+    styles: Sequence[CellStyle],
+    row: int | None = None,
+    cache: dict[tuple[int, ...], str] | None = None,
+) -> str:
+    """Return the CSS declarations of several styles, separated by spaces.
+
+    The row is only used by styles computed from the data. The same combination of styles is
+    usually rendered for many cells (e.g. a fill on every cell of a column), so combinations that
+    don't vary by row are stored in `cache` by the identities of their style objects. The cache
+    should only live as long as the styles it was filled from (e.g., for one render).
+    """
+
+    if cache is None or any(style._varies_by_row for style in styles):
+        css = [style._to_html_style_for_row(row) for style in styles]
+        return " ".join(x for x in css if x)
+
+    key = tuple(map(id, styles))
+    try:
+        return cache[key]
+    except KeyError:
+        res = cache[key] = _styles_to_css(styles, row)
+        return res
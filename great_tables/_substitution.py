@@ -4,7 +4,7 @@ import re
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Callable, Literal
 
-from ._formats import fmt
+from ._formats import _records_call, fmt
 from ._gt_data import FormatterSkipElement
 from ._helpers import html
 from ._tbl_data import DataFrameLike, SelectExpr, is_na
@@ -29,6 +29,7 @@ def _convert_missing(context: Literal["html"], el: str):
     return el
 
 
+@_records_call
 def sub_missing(
     self: GTSelf,
     columns: SelectExpr = None,
@@ -95,6 +96,7 @@ def sub_missing(
     return fmt(self, fns=subber.to_html, columns=columns, rows=rows, is_substitution=True)
 
 
+@_records_call
 def sub_zero(
     self: GTSelf,
     columns: SelectExpr = None,
@@ -183,6 +185,7 @@ class SubZero:
         return FormatterSkipElement()
 
 
+@_records_call
 def sub_small_vals(
     self: GTSelf,
     columns: SelectExpr = None,
@@ -284,6 +287,7 @@ def sub_small_vals(
     return fmt(self, fns=subber.to_html, columns=columns, rows=rows, is_substitution=True)
 
 
+@_records_call
 def sub_large_vals(
     self: GTSelf,
     columns: SelectExpr = None,
@@ -376,6 +380,7 @@ def sub_large_vals(
     return fmt(self, fns=subber.to_html, columns=columns, rows=rows, is_substitution=True)
 
 
+@_records_call
 def sub_values(
     self: GTSelf,
     columns: SelectExpr = None,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from dataclasses import replace
 from typing import TYPE_CHECKING, Callable, Literal
 
 from ._gt_data import TextTransformInfo
@@ -125,6 +126,7 @@ def tab_style(
     # 1. transform dictionary to string (with Google Font name)
     # 2. add Google Font import statement
     if any(isinstance(s, CellStyle) for s in style):
+        new_style = []
         for s in style:
             if (
                 isinstance(s, CellStyle)
@@ -136,14 +138,18 @@ def tab_style(
                 font_name = s.font.get_font_name()
                 font_import_stmt = s.font.make_import_stmt()
 
-                # Replace GoogleFont class with font name
-                s.font = font_name
+                # Replace GoogleFont class with font name, on a copy of the caller's style
+                s = replace(s, font=font_name)
 
                 # Add the Google Font import statement to the internal font imports
                 new_data = new_data._replace(
                     _google_font_imports=new_data._google_font_imports.add(font_import_stmt)
                 )
 
+            new_style.append(s)
+
+        style = new_style
+
     for loc in locations:
         new_data = set_style(loc, new_data, style)
 
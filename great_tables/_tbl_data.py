@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 import re
 import warnings
 from functools import singledispatch
@@ -242,6 +243,61 @@ def _(data: PyArrowTable, row: int, column: str) -> Any:
     return data.column(column)[row].as_py()
 
 
+# _get_column_values ----
+
+
+@singledispatch
+def _get_column_values(data: DataFrameLike, column: str) -> list[Any]:
+    """Get the content of every cell in a column, as `_get_cell()` returns it"""
+
+    _raise_not_implemented(data)
+
+
+@_get_column_values.register(PlDataFrame)
+def _(data: Any, column: str) -> list[Any]:
+    return data[column].to_list()
+
+
+@_get_column_values.register(PdDataFrame)
+def _(data: Any, column: str) -> list[Any]:
+    col_ii = data.columns.get_loc(column)
+
+    if not isinstance(col_ii, int):
+        raise ValueError("Column named " + column + " matches multiple columns.")
+
+    # iterating the array (rather than .tolist()) keeps numpy scalars, like .iloc does
+    return list(data.iloc[:, col_ii].array)
+
+
+@_get_column_values.register(PyArrowTable)
+def _(data: PyArrowTable, column: str) -> list[Any]:
+    return data.column(column).to_pylist()
+
+
+class ColumnValues:
+    """The cells of a table's columns, pulled into lists the first time a column is used.
+
+    This is faster than calling `_get_cell()` for many cells of the same columns, which is slow
+    for pandas in particular. The data should not be modified while the values are in use.
+    """
+
+    __slots__ = ("data", "_columns")
+
+    def __init__(self, data: DataFrameLike):
+        self.data = data
+        self._columns: dict[str, list[Any]] = {}
+
+    def __getitem__(self, column: str) -> list[Any]:
+        values = self._columns.get(column)
+        if values is None:
+            values = self._columns[column] = _get_column_values(self.data, column)
+
+        return values
+
+    def get(self, row: int, column: str) -> Any:
+        return self[column][row]
+
+
 # _set_cell ----
 
 
@@ -566,23 +622,65 @@ def _(df: PdDataFrame):
 
 @cast_frame_to_string.register
 def _(df: PlDataFrame):
+    return df.select([_pl_cast_to_string(name, dtype) for name, dtype in df.schema.items()])
+
+
+def _pl_cast_to_string(name: str, dtype: Any) -> PlExpr:
+    """Return an expression casting a polars column to strings, like `str()` of its values."""
     import polars as pl
-    import polars.selectors as cs
 
-    list_cols = [
-        name
-        for name, dtype in df.schema.items()
-        if issubclass(dtype.base_type(), (pl.List, pl.Array))
-    ]
+    col = pl.col(name)
+    base_type = dtype.base_type()
+
+    if issubclass(base_type, pl.Duration):
+        return _pl_duration_to_string(col).alias(name)
+
+    if issubclass(base_type, (pl.List, pl.Array)):
+        inner = dtype.inner
+        if not (inner.is_integer() or inner == pl.Boolean):
+            # other values (e.g. floats and strings) are formatted differently by python
+            return col.map_elements(lambda x: str(x.to_list()), return_dtype=pl.String)
+
+        if issubclass(base_type, pl.Array):
+            col = col.arr.to_list()
+
+        el = pl.element()
+        if inner == pl.Boolean:
+            el = pl.when(el).then(pl.lit("True")).when(el.not_()).then(pl.lit("False"))
+        else:
+            el = el.cast(pl.String)
+
+        items = col.list.eval(el.fill_null("None")).list.join(", ")
+        return pl.concat_str(pl.lit("["), items, pl.lit("]")).alias(name)
+
+    return col.cast(pl.Utf8)
+
+
+def _pl_duration_to_string(col: PlExpr) -> PlExpr:
+    """Format durations like `str()` of a timedelta (e.g. "-1 day, 23:59:59.000001")."""
+    import polars as pl
 
-    duration_cols = [
-        name for name, dtype in df.schema.items() if issubclass(dtype.base_type(), pl.Duration)
-    ]
+    us = col.dt.total_microseconds()
+    days = us.floordiv(86_400_000_000)
+    secs = (us - days * 86_400_000_000).floordiv(1_000_000)
+    micros = us - days * 86_400_000_000 - secs * 1_000_000
+
+    day_label = pl.when(days.abs() == 1).then(pl.lit(" day, ")).otherwise(pl.lit(" days, "))
+    days_str = pl.when(days == 0).then(pl.lit("")).otherwise(pl.concat_str(days, day_label))
+    micros_str = (
+        pl.when(micros == 0)
+        .then(pl.lit(""))
+        .otherwise(pl.concat_str(pl.lit("."), micros.cast(pl.String).str.zfill(6)))
+    )
 
-    return df.with_columns(
-        cs.by_name(list_cols).map_elements(lambda x: str(x.to_list()), return_dtype=pl.String),
-        cs.by_name(duration_cols).map_elements(str, return_dtype=pl.String),
-        cs.all().exclude(list_cols + duration_cols).cast(pl.Utf8),
+    return pl.concat_str(
+        days_str,
+        secs.floordiv(3600).cast(pl.String),
+        pl.lit(":"),
+        (secs.floordiv(60) % 60).cast(pl.String).str.zfill(2),
+        pl.lit(":"),
+        (secs % 60).cast(pl.String).str.zfill(2),
+        micros_str,
     )
 
 
@@ -593,6 +691,74 @@ def _(df: PyArrowTable):
     return pa.table({col: pa.array(df.column(col).cast(pa.string())) for col in df.column_names})
 
 
+# cast_column_to_string ----
+
+
+@singledispatch
+def cast_column_to_string(
+    df: DataFrameLike, column: str, rows: list[int] | None = None
+) -> list[Any]:
+    """Return the values of a column cast to string, for some rows (or all rows)."""
+    raise NotImplementedError(f"Unsupported type: {type(df)}")
+
+
+@cast_column_to_string.register
+def _(df: PdDataFrame, column: str, rows: list[int] | None = None) -> list[Any]:
+    ser = df[column] if rows is None else df[column].iloc[rows]
+    return ser.astype("string").tolist()
+
+
+@cast_column_to_string.register
+def _(df: PlDataFrame, column: str, rows: list[int] | None = None) -> list[Any]:
+    frame = df.select(column) if rows is None else df.select(column)[rows]
+    return frame.select(_pl_cast_to_string(column, df.schema[column])).to_series().to_list()
+
+
+@cast_column_to_string.register
+def _(df: PyArrowTable, column: str, rows: list[int] | None = None) -> list[Any]:
+    import pyarrow as pa
+
+    arr = df.column(column) if rows is None else df.column(column).take(rows)
+    return arr.cast(pa.string()).to_pylist()
+
+
+class StringCells:
+    """The cells of a table body as strings, falling back to the data for unformatted cells.
+
+    This is a lazy version of filling the nulls of the body with the data cast to string. Each
+    column is worked out when one of its cells is first requested, and only the cells with no
+    formatted value are cast.
+    """
+
+    def __init__(self, body: DataFrameLike, data: DataFrameLike):
+        self.body = body
+        self.data = data
+        self._columns: dict[str, list[Any]] = {}
+
+    def get(self, row: int, column: str) -> Any:
+        values = self._columns.get(column)
+        if values is None:
+            values = self._columns[column] = self._fill_column(column)
+
+        return values[row]
+
+    def _fill_column(self, column: str) -> list[Any]:
+        values = to_list(self.body[column])
+
+        # formatted cells are always strings, so anything else is a missing value
+        missing = [ii for ii, value in enumerate(values) if not isinstance(value, str)]
+        if not missing:
+            return values
+
+        if len(missing) == len(values):
+            return cast_column_to_string(self.data, column)
+
+        for ii, value in zip(missing, cast_column_to_string(self.data, column, missing)):
+            values[ii] = value
+
+        return values
+
+
 # replace_null_frame ----
 
 
@@ -968,3 +1134,84 @@ def _(ser: PlSeries, indexes: list[int]) -> PlSeries:
 @get_rows.register(PyArrowChunkedArray)
 def _(ser: Any, indexes: list[int]) -> PyArrowArray | PyArrowChunkedArray:
     return ser.take(indexes)
+
+
+# frame_digest ----
+
+
+class _HashWriter(io.RawIOBase):
+    """A file-like object that feeds everything written to it into a hash."""
+
+    def __init__(self, hasher: Any):
+        self.hasher = hasher
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b: Any) -> int:
+        self.hasher.update(b)
+        return len(b)
+
+
+@singledispatch
+def frame_digest(data: DataFrameLike) -> bytes:
+    """Return a digest of the table's column names, types and values.
+
+    Tables with the same digest hold the same data. The reverse doesn't always hold (e.g., the
+    same data split into different chunks may give different digests), so the digest is meant
+    for use as a cache key.
+    """
+    _raise_not_implemented(data)
+
+
+@frame_digest.register(PdDataFrame)
+def _(data: PdDataFrame) -> bytes:
+    import hashlib
+    import pickle
+
+    import pandas as pd
+
+    hasher = hashlib.sha256()
+    hasher.update(repr([(col, str(dtype)) for col, dtype in data.dtypes.items()]).encode())
+
+    # pandas hashes object values by their string form (e.g., 1 and "1" hash the same), so
+    # object columns (and the index) are pickled instead, which keeps the type of each value
+    is_object = [pd.api.types.is_object_dtype(dtype) for dtype in data.dtypes]
+    typed_cols = [ii for ii, obj in enumerate(is_object) if not obj]
+    object_cols = [ii for ii, obj in enumerate(is_object) if obj]
+
+    if typed_cols:
+        typed = data.iloc[:, typed_cols]
+        hasher.update(pd.util.hash_pandas_object(typed, index=False).to_numpy().tobytes())
+
+    try:
+        hasher.update(pickle.dumps(data.index))
+        for ii in object_cols:
+            hasher.update(pickle.dumps(list(data.iloc[:, ii])))
+    except (pickle.PicklingError, AttributeError, TypeError) as e:
+        raise TypeError("The table holds values that can't be hashed.") from e
+
+    return hasher.digest()
+
+
+@frame_digest.register(PlDataFrame)
+def _(data: PlDataFrame) -> bytes:
+    import hashlib
+
+    hasher = hashlib.sha256()
+    data.write_ipc(_HashWriter(hasher), compression="uncompressed")
+
+    return hasher.digest()
+
+
+@frame_digest.register(PyArrowTable)
+def _(data: PyArrowTable) -> bytes:
+    import hashlib
+
+    import pyarrow as pa
+
+    hasher = hashlib.sha256()
+    with pa.ipc.new_stream(_HashWriter(hasher), data.schema) as writer:
+        writer.write_table(data)
+
+    return hasher.digest()
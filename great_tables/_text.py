@@ -5,8 +5,6 @@ import re
 from dataclasses import dataclass
 from typing import Callable
 
-from multimark import markdown_to_html, markdown_to_latex
-
 
 class BaseText:
     """Abstract base class for text elements"""
@@ -59,6 +57,8 @@ class Html(Text):
 
 
 def _md_html(x: str) -> str:
+    from multimark import markdown_to_html
+
     if "{{" in x and "}}" in x:
         from great_tables._helpers import UnitStr
 
@@ -74,6 +74,8 @@ def _md_html(x: str) -> str:
 
 
 def _md_latex(x: str) -> str:
+    from multimark import markdown_to_latex
+
     result = markdown_to_latex(x, extensions=["strikethrough"])
     # Strip trailing newline that cmark adds
     return result.rstrip("\n")
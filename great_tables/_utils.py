@@ -3,17 +3,19 @@ from __future__ import annotations
 import importlib
 import itertools
 import re
-from collections.abc import Generator, Set
+from collections.abc import Generator, Sequence, Set
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, TypeVar, overload
 
-from ._tbl_data import _get_cell, _set_cell, get_column_names, n_rows
+from ._tbl_data import ColumnValues, _set_cell, get_column_names, n_rows
 from ._text import BaseText, _process_text
 
 if TYPE_CHECKING:
     from ._gt_data import FormatInfo, GTData
     from ._tbl_data import TblData
 
+T = TypeVar("T")
+
 
 def _try_import(name: str, pip_install_line: str | None = None) -> ModuleType:
     try:
@@ -117,6 +119,107 @@ class OrderedSet(Set[Any]):
         return f"{cls_name}({lst!r})"
 
 
+class PersistentList(Sequence[T]):
+    """An immutable list, that shares its items with the list it was extended from.
+
+    Adding items with `+` returns a new list without copying the existing items, so it takes time
+    in proportion to the number of added items only. GT methods replace their lists of styles,
+    formats, etc. with longer ones on every call, and this keeps a long chain of calls from
+    taking quadratic time. The items are gathered into a tuple the first time the list is read
+    from (e.g., when rendering), and this tuple is kept for later reads.
+    """
+
+    __slots__ = ("_parent", "_tail", "_len", "_items")
+
+    _parent: PersistentList[T] | None
+    _tail: tuple[T, ...]
+    _len: int
+    _items: tuple[T, ...] | None
+
+    def __init__(self, items: Iterable[T] = ()):
+        self._parent = None
+        self._tail = tuple(items)
+        self._len = len(self._tail)
+        self._items = self._tail
+
+    def _extend(self, items: Iterable[T]) -> PersistentList[T]:
+        tail = tuple(items)
+        if not tail:
+            return self
+        if not self._len:
+            return PersistentList(tail)
+
+        new = PersistentList.__new__(PersistentList)
+        new._parent = self
+        new._tail = tail
+        new._len = self._len + len(tail)
+        new._items = None
+
+        return new
+
+    def _flat(self) -> tuple[T, ...]:
+        if self._items is None:
+            # walk back to the closest list whose items were already gathered
+            tails: list[tuple[T, ...]] = []
+            node = self
+            while node._items is None:
+                tails.append(node._tail)
+                node = node._parent  # type: ignore[assignment]
+
+            self._items = node._items + tuple(itertools.chain.from_iterable(reversed(tails)))
+
+        return self._items
+
+    @overload
+    def __getitem__(self, ii: int) -> T: ...
+
+    @overload
+    def __getitem__(self, ii: slice) -> PersistentList[T]: ...
+
+    def __getitem__(self, ii: int | slice) -> T | PersistentList[T]:
+        if isinstance(ii, slice):
+            return PersistentList(self._flat()[ii])
+
+        # the last items don't need gathering (e.g., for `gt._formats[-1]`)
+        if -len(self._tail) <= ii < 0:
+            return self._tail[ii]
+
+        return self._flat()[ii]
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._flat())
+
+    def __add__(self, other: Iterable[T]) -> PersistentList[T]:
+        if not isinstance(other, (PersistentList, list, tuple)):
+            return NotImplemented
+
+        return self._extend(other)
+
+    def __radd__(self, other: Iterable[T]) -> PersistentList[T]:
+        if not isinstance(other, (list, tuple)):
+            return NotImplemented
+
+        return PersistentList(other)._extend(self._flat())
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (PersistentList, list, tuple)):
+            return self._len == len(other) and self._flat() == tuple(other)
+
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._flat())!r})"
+
+    def __reduce__(self):
+        # avoid pickling (and deep copying) the chain of lists one level at a time
+        return (PersistentList, (self._flat(),))
+
+
 def _as_css_font_family_attr(fonts: list[str], value_only: bool = False) -> str:
     fonts_w_spaces: list[str] = list(map(lambda x: f"'{x}'" if " " in x else x, fonts))
 
@@ -232,10 +335,18 @@ def _flatten_list(x: Any) -> list[Any]:
 # yet since that would result in a circular import. This will be fixed in the future (when HTML
 # escaping is implemented).
 def _migrate_unformatted_to_output(
-    data: GTData, data_tbl: TblData, formats: list[FormatInfo], context: str
+    data: GTData,
+    data_tbl: TblData,
+    formats: list[FormatInfo],
+    context: str,
+    columns: list[str] | None = None,
+    source: ColumnValues | None = None,
 ) -> GTData:
     """
     Escape unformatted cells so they are safe for a specific output context.
+
+    Only cells in `columns` are escaped, when given (e.g., to skip hidden columns). The cells of
+    `data_tbl` can be passed as `source`, to share them with other build steps.
     """
 
     # TODO: This function will eventually be applied to all context types but for now
@@ -243,6 +354,9 @@ def _migrate_unformatted_to_output(
     if context != "latex":
         return data
 
+    if source is None:
+        source = ColumnValues(data_tbl)
+
     all_formatted_cells: list[list[tuple[str, int]]] = []
 
     for fmt in formats:
@@ -257,7 +371,7 @@ def _migrate_unformatted_to_output(
     deduplicate_formatted_cells = list(set(_flatten_list(all_formatted_cells)))
 
     # Get all visible cells in the table
-    all_visible_cells = _get_visible_cells(data=data_tbl)
+    all_visible_cells = _get_visible_cells(data=data_tbl, columns=columns)
 
     # Get the difference between the visible cells and the formatted cells
     all_unformatted_cells = list(set(all_visible_cells) - set(deduplicate_formatted_cells))
@@ -267,7 +381,7 @@ def _migrate_unformatted_to_output(
 
     for col, row in all_unformatted_cells:
         # Get the cell value and cast as string
-        cell_value = _get_cell(data_tbl, row, col)
+        cell_value = source.get(row, col)
         cell_value_str = str(cell_value)
 
         result = _process_text(cell_value_str, context=context)
@@ -279,8 +393,11 @@ def _migrate_unformatted_to_output(
 
 # Get a list of tuples for all visible cells in the table
 # Define the type of `data` as `TblData` when doing so won't result in a circular import
-def _get_visible_cells(data: TblData) -> list[tuple[str, int]]:
-    return [(col, row) for col in get_column_names(data) for row in range(n_rows(data))]
+def _get_visible_cells(data: TblData, columns: list[str] | None = None) -> list[tuple[str, int]]:
+    if columns is None:
+        columns = get_column_names(data)
+
+    return [(col, row) for col in columns for row in range(n_rows(data))]
 
 
 def is_valid_http_schema(url: str) -> bool:
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import re
+from contextvars import ContextVar
 from itertools import chain
-from typing import TYPE_CHECKING, Any, cast
+from typing import Any, Iterator, cast
 
-from htmltools import HTML, TagList, css, tags
+from htmltools import HTML, Tag, TagList, css, tags
+from typing_extensions import TypeAlias
 
 from . import _locations as loc
 from ._gt_data import (
+    CellRectangle,
     ColInfo,
     ColInfoTypeEnum,
     FootnoteInfo,
@@ -17,14 +21,13 @@ from ._gt_data import (
     Styles,
     SummaryRowInfo,
 )
+from ._scss import CssCompound, CssRule, parse_declarations
 from ._spanners import spanners_print_matrix
-from ._tbl_data import _get_cell, cast_frame_to_string, replace_null_frame
+from ._styles import _styles_to_css
+from ._tbl_data import StringCells
 from ._text import BaseText, _process_text, _process_text_id
 from ._utils import heading_has_subtitle, heading_has_title, seq_groups
 
-if TYPE_CHECKING:
-    from ._tbl_data import TblData
-
 
 # TODO: The footnote ordering functions (_get_locnum_for_footnote_location,
 # _get_summary_locnum, _get_footnote_mark_string, _process_footnotes_for_display)
@@ -112,27 +115,316 @@ def _is_loc(loc: str | loc.Loc, cls: type[loc.Loc]):
     return isinstance(loc, cls)
 
 
-def _flatten_styles(styles: Styles, wrap: bool = False) -> str | None:
+def _flatten_styles(
+    styles: Styles,
+    wrap: bool = False,
+    row: int | None = None,
+    cache: dict[tuple[int, ...], str] | None = None,
+) -> str | None:
     # flatten all StyleInfo.styles lists
-    style_entries = list(chain.from_iterable((x.styles for x in styles)))
-    rendered_styles = [el._to_html_style() for el in style_entries]
+    rendered_styles = _styles_to_css(
+        list(chain.from_iterable(x.styles for x in styles)), row, cache
+    )
 
     # TODO dedupe rendered styles in sequence
 
     if wrap:
         if rendered_styles:
             # return style html attribute
-            return f' style="{" ".join(rendered_styles)}"'
+            return f' style="{rendered_styles}"'
         # if no rendered styles, just return a blank
         return ""
     if rendered_styles:
         # return space-separated list of rendered styles
-        return " ".join(rendered_styles)
+        return rendered_styles
     # if not wrapping the styles for html element,
     # return None so htmltools omits a style attribute
     return None
 
 
+class _CellStyleIndex:
+    """Look up the styles of body cells, without going through every style for each cell.
+
+    Styles are either stored for a single cell (with `colname` and `rownum`) or for a set of cells
+    (with `cells`). Single cells are looked up by position, sets of cells with a list of rows by
+    row, and other sets of cells (e.g., all rows of some columns) by column. Styles are returned in
+    the order they were added.
+
+    The index lives for one render, and `css_cache` holds the CSS of the combinations of styles
+    rendered from it (see `_styles_to_css()`).
+    """
+
+    def __init__(self, styles: list[StyleInfo]):
+        self.css_cache: dict[tuple[int, ...], str] = {}
+        self._by_cell: dict[tuple[str | None, int | None], list[tuple[int, StyleInfo]]] = {}
+        self._by_rownum: dict[int | None, list[tuple[int, StyleInfo]]] = {}
+        self._by_row: dict[int, list[tuple[int, StyleInfo]]] = {}
+        self._by_col: dict[str, list[tuple[int, StyleInfo]]] = {}
+
+        for ii, info in enumerate(styles):
+            cells = info.cells
+            if cells is None:
+                self._by_cell.setdefault((info.colname, info.rownum), []).append((ii, info))
+                self._by_rownum.setdefault(info.rownum, []).append((ii, info))
+            elif isinstance(cells, CellRectangle) and not isinstance(cells.rows, range):
+                for row in cells.rows:
+                    self._by_row.setdefault(row, []).append((ii, info))
+            else:
+                for colname in cells.cols:
+                    self._by_col.setdefault(colname, []).append((ii, info))
+
+    def get(self, colname: str | None, rownum: int | None) -> list[StyleInfo]:
+        """Return the styles of a single cell."""
+
+        found = [*self._by_cell.get((colname, rownum), [])]
+
+        candidates = [
+            *(self._by_row.get(rownum, []) if rownum is not None else []),
+            *(self._by_col.get(colname, []) if colname is not None else []),
+        ]
+        for ii, info in candidates:
+            if info.cells is not None and info.cells.contains(colname, rownum):
+                found.append((ii, info))
+
+        if len(found) > 1:
+            found.sort(key=lambda x: x[0])
+
+        return [info for _, info in found]
+
+    def get_row(self, rownum: int | None) -> list[StyleInfo]:
+        """Return the styles stored for single cells in a row, whatever their column."""
+
+        return [info for _, info in self._by_rownum.get(rownum, [])]
+
+
+class _StyleClasses:
+    """Generated CSS classes that stand in for the inline styles of body cells.
+
+    Each distinct style declaration string is assigned a class name (e.g., `gt_s0`, `gt_s1`, etc.),
+    in the order first seen.
+    """
+
+    def __init__(self, prefix: str = "gt_s"):
+        self.prefix = prefix
+        self.interned: dict[str, str] = {}
+
+    def get(self, declarations: str) -> str:
+        class_name = self.interned.get(declarations)
+        if class_name is None:
+            class_name = self.interned[declarations] = f"{self.prefix}{len(self.interned)}"
+
+        return class_name
+
+
+def _cell_style_attr(
+    declarations: str | None,
+    classes: list[str],
+    style_classes: _StyleClasses | None,
+    tag: str = "td",
+    ancestors: tuple[_Element, ...] = (),
+    first: bool = False,
+    last: bool = False,
+) -> str:
+    """Return the style attribute of a cell, or add a class standing in for it to classes."""
+
+    if declarations and style_classes is not None:
+        classes.append(style_classes.get(declarations))
+        return ""
+
+    return _style_attr(tag, " ".join(classes), declarations, ancestors, first=first, last=last)
+
+
+# An element created by the renderer, as its tag name and classes
+_Element: TypeAlias = tuple[str, str]
+
+# The elements that hold the parts of the table
+_TABLE: _Element = ("table", "gt_table")
+_THEAD: _Element = ("thead", "")
+_TBODY: _Element = ("tbody", "gt_table_body")
+_TFOOT: _Element = ("tfoot", "")
+
+
+class _InlineStyles:
+    """The rules of a table's stylesheet, resolved for the elements that the renderer creates.
+
+    With `inline_css="native"`, the declarations of the rules matching each element are written to
+    its style attribute, instead of the table having a `<style>` block. An element is described by
+    its tag name and classes, along with those of its ancestors (nearest first). The position of an
+    element among its siblings (for `:first-child` and `:last-child`) is only known for table cells,
+    and footnote marks are matched without their ancestors. Declarations in an element's own style
+    attribute take precedence over the rules, unless the rule's declaration is `!important`.
+    """
+
+    def __init__(self, rules: list[CssRule]):
+        # Rules indexed by a class of their rightmost compound, or else by its tag name
+        self._rules: dict[str, list[CssRule]] = {}
+        for rule in rules:
+            compound = rule.compounds[0]
+            key = f".{min(compound.classes)}" if compound.classes else compound.tag or "*"
+            self._rules.setdefault(key, []).append(rule)
+
+        self._resolved: dict[tuple[Any, ...], str] = {}
+
+    def resolve(
+        self,
+        tag: str,
+        classes: str,
+        declarations: str | None = None,
+        ancestors: tuple[_Element, ...] = (),
+        first: bool = False,
+        last: bool = False,
+    ) -> str:
+        """Return the declarations for the style attribute of an element."""
+
+        key = (tag, classes, declarations, ancestors, first, last)
+        try:
+            return self._resolved[key]
+        except KeyError:
+            pass
+
+        class_set = frozenset(classes.split())
+        candidates = [
+            *self._rules.get("*", []),
+            *self._rules.get(tag, []),
+            *(rule for cls in class_set for rule in self._rules.get(f".{cls}", [])),
+        ]
+        matched = sorted(
+            (
+                rule
+                for rule in candidates
+                if _compound_matches(rule.compounds[0], tag, class_set, first, last)
+                and _ancestors_match(rule, 1, ancestors)
+            ),
+            key=lambda rule: (rule.specificity, rule.order),
+        )
+
+        resolved: dict[str, tuple[str, bool]] = {}
+        for rule in matched:
+            for prop, value, important in rule.declarations:
+                if prop in resolved and resolved[prop][1] and not important:
+                    continue
+                resolved[prop] = (value, important)
+
+        for prop, value, important in parse_declarations(declarations or ""):
+            if prop in resolved and resolved[prop][1] and not important:
+                continue
+            resolved.pop(prop, None)
+            resolved[prop] = (value, important)
+
+        res = self._resolved[key] = "".join(
+            f"{prop}: {value}{' !important' if important else ''};"
+            for prop, (value, important) in resolved.items()
+        )
+
+        return res
+
+
+def _compound_matches(
+    compound: CssCompound, tag: str, classes: frozenset[str], first: bool, last: bool
+) -> bool:
+    return (
+        (compound.tag is None or compound.tag == tag)
+        and compound.classes <= classes
+        and (compound.pseudo is None or (first if compound.pseudo == "first-child" else last))
+    )
+
+
+def _ancestors_match(rule: CssRule, pos: int, ancestors: tuple[_Element, ...]) -> bool:
+    """Check whether the compounds of a rule from `pos` on match some of an element's ancestors."""
+
+    if pos == len(rule.compounds):
+        return True
+
+    compound = rule.compounds[pos]
+    combinator = rule.combinators[pos - 1]
+
+    if compound.is_container:
+        # The container wraps the table, so it's the parent of the outermost element
+        return combinator == " " or not ancestors
+
+    candidates = ancestors[:1] if combinator == ">" else ancestors
+
+    for ii, (tag, classes) in enumerate(candidates):
+        # The positions of ancestors aren't known, so they never match pseudo-classes
+        if _compound_matches(compound, tag, frozenset(classes.split()), False, False):
+            if _ancestors_match(rule, pos + 1, ancestors[ii + 1 :]):
+                return True
+
+    return False
+
+
+# The stylesheet rules to inline while rendering a table with `inline_css="native"`
+_inline_styles: ContextVar[_InlineStyles | None] = ContextVar("_inline_styles", default=None)
+
+
+def _style_attr(
+    tag: str,
+    classes: str = "",
+    declarations: str | None = None,
+    ancestors: tuple[_Element, ...] = (),
+    first: bool = False,
+    last: bool = False,
+) -> str:
+    """Return the style attribute of an element, or an empty string if it has no styles.
+
+    When the stylesheet rules are being inlined, the attribute also has the declarations of the
+    rules that match the element.
+    """
+
+    inline = _inline_styles.get()
+    if inline is not None:
+        declarations = inline.resolve(tag, classes, declarations, ancestors, first, last)
+        declarations = declarations.replace('"', "&quot;")
+
+    return f' style="{declarations}"' if declarations else ""
+
+
+def _inline_tag_styles(node: Tag | TagList, ancestors: tuple[_Element, ...]) -> None:
+    """Write the inlined stylesheet rules into the style attributes of htmltools tags."""
+
+    inline = _inline_styles.get()
+    if inline is None:
+        return
+
+    children = [node] if isinstance(node, Tag) else node
+    elements = [child for child in children if isinstance(child, Tag)]
+
+    for ii, el in enumerate(elements):
+        classes = el.attrs.get("class") or ""
+        is_cell = el.name in ("th", "td")
+
+        style = inline.resolve(
+            el.name,
+            classes,
+            el.attrs.get("style"),
+            ancestors,
+            first=is_cell and ii == 0,
+            last=is_cell and ii == len(elements) - 1,
+        )
+        if style:
+            el.attrs["style"] = style
+
+        _inline_tag_styles(el.children, ((el.name, classes), *ancestors))
+
+
+_TAG_RE = re.compile(r"<([a-zA-Z][\w-]*)((?:[^<>\"']|\"[^\"]*\"|'[^']*')*)>")
+_ANY_CLASS_ATTR_RE = re.compile(r"\bclass\s*=\s*(?:\"([^\"]*)\"|'([^']*)')")
+
+
+def _collect_used_selectors(html: str) -> set[str]:
+    """Collect the tag names and class selectors (e.g., `".gt_row"`) used in rendered HTML."""
+
+    used: set[str] = set()
+
+    for tag, attrs in _TAG_RE.findall(html):
+        used.add(tag.lower())
+
+        for double_quoted, single_quoted in _ANY_CLASS_ATTR_RE.findall(attrs):
+            used.update(f".{cls}" for cls in (double_quoted or single_quoted).split())
+
+    return used
+
+
 def _create_element_id(table_id: str | None, element_id: str | BaseText | None) -> str:
     # Given a table ID, element IDs are prepended by it to ensure the resulting HTML
     # has unique IDs.
@@ -173,8 +465,8 @@ def create_heading_component_h(data: GTData) -> str:
     styles_header = [x for x in data._styles if _is_loc(x.locname, loc.LocHeader)]
     styles_title = [x for x in data._styles if _is_loc(x.locname, loc.LocTitle)]
     styles_subtitle = [x for x in data._styles if _is_loc(x.locname, loc.LocSubTitle)]
-    title_style = _flatten_styles(styles_header + styles_title, wrap=True)
-    subtitle_style = _flatten_styles(styles_header + styles_subtitle, wrap=True)
+    title_style = _flatten_styles(styles_header + styles_title)
+    subtitle_style = _flatten_styles(styles_header + styles_subtitle)
 
     has_summary_rows = bool(data._summary_rows or data._summary_rows_grand)
 
@@ -186,18 +478,30 @@ def create_heading_component_h(data: GTData) -> str:
         options=data._options,
     )
 
+    # Each heading row has a single cell
+    tr_ancestors = (_THEAD, _TABLE)
+    td_ancestors = (("tr", "gt_heading"), *tr_ancestors)
+    tr_style = _style_attr("tr", "gt_heading", ancestors=tr_ancestors)
+
+    title_classes = "gt_heading gt_title gt_font_normal"
+    title_attr = _style_attr("td", title_classes, title_style, td_ancestors, first=True, last=True)
+
     if has_subtitle:
+        subtitle_classes = "gt_heading gt_subtitle gt_font_normal gt_bottom_border"
+        subtitle_attr = _style_attr(
+            "td", subtitle_classes, subtitle_style, td_ancestors, first=True, last=True
+        )
         heading = f"""
-  <tr class="gt_heading">
-    <td colspan="{n_cols_total}" class="gt_heading gt_title gt_font_normal"{title_style}>{title}</td>
+  <tr class="gt_heading"{tr_style}>
+    <td colspan="{n_cols_total}" class="{title_classes}"{title_attr}>{title}</td>
   </tr>
-  <tr class="gt_heading">
-    <td colspan="{n_cols_total}" class="gt_heading gt_subtitle gt_font_normal gt_bottom_border"{subtitle_style}>{subtitle}</td>
+  <tr class="gt_heading"{tr_style}>
+    <td colspan="{n_cols_total}" class="{subtitle_classes}"{subtitle_attr}>{subtitle}</td>
   </tr>"""
     else:
         heading = f"""
-  <tr class="gt_heading">
-    <td colspan="{n_cols_total}" class="gt_heading gt_title gt_font_normal"{title_style}>{title}</td>
+  <tr class="gt_heading"{tr_style}>
+    <td colspan="{n_cols_total}" class="{title_classes}"{title_attr}>{title}</td>
   </tr>"""
 
     return heading
@@ -600,28 +904,60 @@ def create_columns_component_h(data: GTData) -> str:
             higher_spanner_rows,
             table_col_headings,
         )
+
+    _inline_tag_styles(table_col_headings, (_THEAD, _TABLE))
+
     return table_col_headings
 
 
 def create_body_component_h(data: GTData) -> str:
-    # for now, just coerce everything in the original data to a string
-    # so we can fill in the body data with it
-    _str_orig_data = cast_frame_to_string(data._tbl_data)
-    tbl_data = replace_null_frame(data._body.body, _str_orig_data)
+    all_body_rows = "\n".join(_iter_body_rows_h(data))
+
+    return f"""<tbody class="gt_table_body">
+{all_body_rows}
+</tbody>"""
+
+
+def iter_body_component_h(
+    data: GTData, style_classes: _StyleClasses | None = None
+) -> Iterator[str]:
+    """Yield the HTML of the table body in pieces, one row at a time.
+
+    Joining the yielded strings gives the same result as `create_body_component_h()`. When
+    `style_classes` is given, the inline styles of cells are replaced by classes from it.
+    """
+
+    yield f'<tbody class="gt_table_body"{_style_attr(*_TBODY, ancestors=(_TABLE,))}>\n'
+
+    for i, row_html in enumerate(_iter_body_rows_h(data, style_classes)):
+        yield row_html if i == 0 else f"\n{row_html}"
+
+    yield "\n</tbody>"
+
+
+def _iter_body_rows_h(data: GTData, style_classes: _StyleClasses | None = None) -> Iterator[str]:
+    # unformatted cells are filled in with the original data, cast to string as they're needed
+    tbl_data = StringCells(data._body.body, data._tbl_data)
 
     # Filter list of StyleInfo to only those that apply to the stub
     styles_row_group_label = [x for x in data._styles if _is_loc(x.locname, loc.LocRowGroups)]
-    styles_row_label = [x for x in data._styles if _is_loc(x.locname, loc.LocStub)]
-    styles_summary_label = [x for x in data._styles if _is_loc(x.locname, loc.LocSummaryStub)]
-    styles_grand_summary_label = [
-        x for x in data._styles if _is_loc(x.locname, loc.LocGrandSummaryStub)
-    ]
+    styles_row_label = _CellStyleIndex([x for x in data._styles if _is_loc(x.locname, loc.LocStub)])
+    styles_summary_label = _CellStyleIndex(
+        [x for x in data._styles if _is_loc(x.locname, loc.LocSummaryStub)]
+    )
+    styles_grand_summary_label = _CellStyleIndex(
+        [x for x in data._styles if _is_loc(x.locname, loc.LocGrandSummaryStub)]
+    )
 
     # Filter list of StyleInfo to only those that apply to the body
-    styles_cells = [x for x in data._styles if _is_loc(x.locname, loc.LocBody)]
+    styles_cells = _CellStyleIndex([x for x in data._styles if _is_loc(x.locname, loc.LocBody)])
     # styles_body = [x for x in data._styles if _is_loc(x.locname, loc.LocBody2)]
-    styles_summary = [x for x in data._styles if _is_loc(x.locname, loc.LocSummary)]
-    styles_grand_summary = [x for x in data._styles if _is_loc(x.locname, loc.LocGrandSummary)]
+    styles_summary = _CellStyleIndex(
+        [x for x in data._styles if _is_loc(x.locname, loc.LocSummary)]
+    )
+    styles_grand_summary = _CellStyleIndex(
+        [x for x in data._styles if _is_loc(x.locname, loc.LocGrandSummary)]
+    )
 
     # Get the default column vars
     column_vars = data._boxhead._get_default_columns()
@@ -656,8 +992,6 @@ def create_body_component_h(data: GTData) -> str:
     # Are the rows in the table body to be striped?
     table_body_striped = data._options.row_striping_include_table_body.value
 
-    body_rows: list[str] = []
-
     # Add grand summary rows at top
     top_g_summary_rows = data._summary_rows_grand.get_summary_rows(side="top")
     for i, summary_row in enumerate(top_g_summary_rows):
@@ -674,8 +1008,9 @@ def create_body_component_h(data: GTData) -> str:
             summary_row=summary_row,
             css_class="gt_last_grand_summary_row_top" if i == len(top_g_summary_rows) - 1 else None,
             data=data,
+            style_classes=style_classes,
         )
-        body_rows.append(row_html)
+        yield row_html
 
     # iterate over rows (ordered by groupings)
     prev_group_info = None
@@ -702,7 +1037,7 @@ def create_body_component_h(data: GTData) -> str:
                     for style in styles_row_group_label
                     if group_info.group_id in style.grpname
                 ]
-                group_styles = _flatten_styles(_styles, wrap=True)
+                group_styles = _flatten_styles(_styles)
 
                 # Apply footnote marks to group label
                 footnotes_group = [
@@ -732,7 +1067,15 @@ def create_body_component_h(data: GTData) -> str:
                         + len(bottom_summary_rows_for_group)
                     )
 
-                    leading_cell = f"""  <th{group_styles} class="gt_row gt_left gt_stub_row_group"
+                    # The group label is the first cell of the row that starts the group
+                    leading_style = _style_attr(
+                        "th",
+                        "gt_row gt_left gt_stub_row_group",
+                        group_styles,
+                        (("tr", "gt_row_group_first"), _TBODY, _TABLE),
+                        first=True,
+                    )
+                    leading_cell = f"""  <th{leading_style} class="gt_row gt_left gt_stub_row_group"
     rowspan="{rowspan_value}">{group_label}</th>"""
 
                 # Append a table row for the group heading
@@ -745,11 +1088,21 @@ def create_body_component_h(data: GTData) -> str:
                         "gt_empty_group_heading" if group_label == "" else "gt_group_heading_row"
                     )
 
-                    group_row = f"""  <tr class="{group_class}">
-    <th class="gt_group_heading" colspan="{colspan_value}"{group_styles}>{group_label}</th>
+                    group_tr_style = _style_attr("tr", group_class, ancestors=(_TBODY, _TABLE))
+                    group_th_style = _style_attr(
+                        "th",
+                        "gt_group_heading",
+                        group_styles,
+                        (("tr", group_class), _TBODY, _TABLE),
+                        first=True,
+                        last=True,
+                    )
+
+                    group_row = f"""  <tr class="{group_class}"{group_tr_style}>
+    <th class="gt_group_heading" colspan="{colspan_value}"{group_th_style}>{group_label}</th>
   </tr>"""
 
-                    body_rows.append(group_row)
+                    yield group_row
 
                 # Render top summary rows immediately after the group heading
                 if data._summary_rows and top_summary_rows_for_group:
@@ -775,8 +1128,9 @@ def create_body_component_h(data: GTData) -> str:
                             data=data,
                             summary_group_id=group_info.group_id,
                             row_class="gt_row_group_first" if si == 0 and leading_cell else None,
+                            style_classes=style_classes,
                         )
-                        body_rows.append(row_html)
+                        yield row_html
 
                     # Clear leading_cell so data row doesn't also get it
                     if leading_cell:
@@ -797,8 +1151,9 @@ def create_body_component_h(data: GTData) -> str:
             tbl_data=tbl_data,
             data=data,
             row_class="gt_row_group_first" if leading_cell else None,
+            style_classes=style_classes,
         )
-        body_rows.append(row_html)
+        yield row_html
 
         prev_group_info = group_info
 
@@ -831,8 +1186,9 @@ def create_body_component_h(data: GTData) -> str:
                         css_class="gt_first_summary_row" if si == 0 else None,
                         data=data,
                         summary_group_id=group_id,
+                        style_classes=style_classes,
                     )
-                    body_rows.append(row_html)
+                    yield row_html
 
     # Add grand summary rows at bottom
     bottom_g_summary_rows = data._summary_rows_grand.get_summary_rows(side="bottom")
@@ -850,14 +1206,9 @@ def create_body_component_h(data: GTData) -> str:
             summary_row=summary_row,
             css_class="gt_first_grand_summary_row_bottom" if i == 0 else None,
             data=data,
+            style_classes=style_classes,
         )
-        body_rows.append(row_html)
-
-    all_body_rows = "\n".join(body_rows)
-
-    return f"""<tbody class="gt_table_body">
-{all_body_rows}
-</tbody>"""
+        yield row_html
 
 
 def _create_row_component_h(
@@ -867,16 +1218,17 @@ def _create_row_component_h(
     has_group_stub_column: bool,
     apply_stub_striping: bool,
     apply_body_striping: bool,
-    styles_cells: list[StyleInfo],  # Either styles_cells OR styles_grand_summary
-    styles_labels: list[StyleInfo],  # Either styles_row_label OR styles_grand_summary_label
+    styles_cells: _CellStyleIndex,  # Either styles_cells OR styles_grand_summary
+    styles_labels: _CellStyleIndex,  # Either styles_row_label OR styles_grand_summary_label
     leading_cell: str | None = None,  # For group label when row_group_as_column = True
     row_index: int | None = None,
     summary_row: SummaryRowInfo | None = None,  # For summary rows
-    tbl_data: TblData | None = None,
+    tbl_data: StringCells | None = None,
     css_class: str | None = None,
     data: GTData | None = None,  # For footnote handling
     summary_group_id: str | None = None,  # For group summary rows (distinguishes from grand)
     row_class: str | None = None,  # CSS class for the <tr> element
+    style_classes: _StyleClasses | None = None,  # Classes standing in for inline cell styles
 ) -> str:
     """Create a single table row (either data row or summary row)"""
 
@@ -885,18 +1237,26 @@ def _create_row_component_h(
     summary_css_class = "gt_summary_row" if is_group_summary else "gt_grand_summary_row"
     body_cells: list[str] = []
 
+    # The elements that contain the cells, for inlining the stylesheet rules
+    tr_ancestors = (_TBODY, _TABLE)
+    cell_ancestors = (("tr", row_class or ""), *tr_ancestors)
+
     if leading_cell:
         body_cells.append(leading_cell)
 
     # Handle special cases for summary rows with group stub columns
     if is_summary_row and has_group_stub_column:
-        cell_styles = _flatten_styles(
-            [x for x in styles_labels if x.rownum == row_index], wrap=True
-        )
-
         classes = ["gt_row", "gt_left", "gt_stub", summary_css_class]
         if css_class:
             classes.append(css_class)
+        cell_styles = _cell_style_attr(
+            _flatten_styles(styles_labels.get_row(row_index), cache=styles_labels.css_cache),
+            classes,
+            style_classes,
+            "th",
+            cell_ancestors,
+            first=not body_cells,
+        )
         classes_str = " ".join(classes)
 
         # Apply footnotes to the summary stub label
@@ -939,7 +1299,7 @@ def _create_row_component_h(
         # Normal case: process all column_vars
         column_vars_to_process = column_vars
 
-    for colinfo in column_vars_to_process:
+    for col_index, colinfo in enumerate(column_vars_to_process):
         # Get cell content
         if is_summary_row:
             if colinfo == row_stub_var or colinfo.is_stub:
@@ -950,7 +1310,7 @@ def _create_row_component_h(
             # TODO: this row is technically a summary row, but is_summary_row is False here
             cell_content = "&nbsp;"
         else:
-            cell_content = _get_cell(tbl_data, row_index, colinfo.var)
+            cell_content = tbl_data.get(row_index, colinfo.var)
 
         if css_class:
             classes = [css_class]
@@ -1019,12 +1379,8 @@ def _create_row_component_h(
                     cell_str = _apply_footnotes_to_text(footnotes_i, data, cell_str)
 
         # Get styles
-        _body_styles = [
-            x for x in styles_cells if x.rownum == row_index and x.colname == colinfo.var
-        ]
-        _rowname_styles = (
-            [x for x in styles_labels if x.rownum == row_index] if colinfo.is_stub else []
-        )
+        _body_styles = styles_cells.get(colinfo.var, row_index)
+        _rowname_styles = styles_labels.get_row(row_index) if colinfo.is_stub else []
 
         # Build classes and element
         if colinfo.is_stub:
@@ -1042,14 +1398,25 @@ def _create_row_component_h(
             if apply_body_striping:
                 classes.append("gt_striped")
 
+        cell_styles = _cell_style_attr(
+            _flatten_styles(
+                _body_styles + _rowname_styles, row=row_index, cache=styles_cells.css_cache
+            ),
+            classes,
+            style_classes,
+            el_name,
+            cell_ancestors,
+            first=not body_cells,
+            last=col_index == len(column_vars_to_process) - 1,
+        )
         classes_str = " ".join(classes)
-        cell_styles = _flatten_styles(_body_styles + _rowname_styles, wrap=True)
 
         body_cells.append(
             f"""    <{el_name}{cell_styles} class="{classes_str}">{cell_str}</{el_name}>"""
         )
 
-    tr_open = f'  <tr class="{row_class}">' if row_class else "  <tr>"
+    tr_style = _style_attr("tr", row_class or "", ancestors=tr_ancestors)
+    tr_open = f'  <tr class="{row_class}"{tr_style}>' if row_class else f"  <tr{tr_style}>"
     return tr_open + "\n" + "\n".join(body_cells) + "\n  </tr>"
 
 
@@ -1139,6 +1506,13 @@ def create_footer_component_h(data: GTData) -> str:
 
     footer_rows = []
 
+    # The elements that contain the footer cells and their content, for inlining the stylesheet rules
+    tr_ancestors = (_TFOOT, _TABLE)
+    sourcenotes_tr = ("tr", "gt_sourcenotes")
+    sourcenotes_tr_style = _style_attr(*sourcenotes_tr, ancestors=tr_ancestors)
+    sourcenote_ancestors = (("td", "gt_sourcenote"), sourcenotes_tr, *tr_ancestors)
+    sourcenote_md_style = _style_attr("span", "gt_from_md", ancestors=sourcenote_ancestors)
+
     # Add source notes if they exist
     if source_notes:
         # Filter list of StyleInfo to only those that apply to the source notes
@@ -1151,11 +1525,18 @@ def create_footer_component_h(data: GTData) -> str:
 
         if multiline:
             # Each source note gets its own row with gt_sourcenotes class on the tr
-            _styles = _flatten_styles(styles_footer + styles_source_notes, wrap=True)
+            _styles = _style_attr(
+                "td",
+                "gt_sourcenote",
+                _flatten_styles(styles_footer + styles_source_notes),
+                (sourcenotes_tr, *tr_ancestors),
+                first=True,
+                last=True,
+            )
             for note in source_notes:
                 note_str = _process_text(note)
                 footer_rows.append(
-                    f'<tr class="gt_sourcenotes"><td class="gt_sourcenote" colspan="{n_cols_total}"{_styles}><span class="gt_from_md">{note_str}</span></td></tr>'
+                    f'<tr class="gt_sourcenotes"{sourcenotes_tr_style}><td class="gt_sourcenote" colspan="{n_cols_total}"{_styles}><span class="gt_from_md"{sourcenote_md_style}>{note_str}</span></td></tr>'
                 )
         else:
             # All source notes in a single row with gt_sourcenotes class on the tr
@@ -1165,8 +1546,11 @@ def create_footer_component_h(data: GTData) -> str:
                 source_note_list.append(note_str)
 
             source_notes_str_joined = separator.join(source_note_list)
+            _styles = _style_attr(
+                "td", "gt_sourcenote", None, (sourcenotes_tr, *tr_ancestors), first=True, last=True
+            )
             footer_rows.append(
-                f'<tr class="gt_sourcenotes"><td class="gt_sourcenote" colspan="{n_cols_total}"><span class="gt_from_md">{source_notes_str_joined}</span></td></tr>'
+                f'<tr class="gt_sourcenotes"{sourcenotes_tr_style}><td class="gt_sourcenote" colspan="{n_cols_total}"{_styles}><span class="gt_from_md"{sourcenote_md_style}>{source_notes_str_joined}</span></td></tr>'
             )
 
     # Add footnotes if they exist
@@ -1175,6 +1559,15 @@ def create_footer_component_h(data: GTData) -> str:
         footnotes_with_marks = _process_footnotes_for_display(data, footnotes)
 
         if footnotes_with_marks:
+            footnotes_tr = ("tr", "gt_footnotes")
+            footnotes_tr_style = _style_attr(*footnotes_tr, ancestors=tr_ancestors)
+            footnote_style = _style_attr(
+                "td", "gt_footnote", None, (footnotes_tr, *tr_ancestors), first=True, last=True
+            )
+            footnote_md_style = _style_attr(
+                "span", "gt_from_md", None, (("td", "gt_footnote"), footnotes_tr, *tr_ancestors)
+            )
+
             # Each footnote gets its own row
             for footnote_data in footnotes_with_marks:
                 mark = footnote_data.get("mark", "")
@@ -1184,20 +1577,20 @@ def create_footer_component_h(data: GTData) -> str:
 
                 # Wrap footnote text in `gt_from_md` span if it contains HTML markup
                 if "<" in text and ">" in text:
-                    footnote_text = f'<span class="gt_from_md">{text}</span>'
+                    footnote_text = f'<span class="gt_from_md"{footnote_md_style}>{text}</span>'
                 else:
                     footnote_text = text
 
                 footnote_html = f"{footnote_mark_html} {footnote_text}"
                 footer_rows.append(
-                    f'<tr class="gt_footnotes"><td class="gt_footnote" colspan="{n_cols_total}">{footnote_html}</td></tr>'
+                    f'<tr class="gt_footnotes"{footnotes_tr_style}><td class="gt_footnote" colspan="{n_cols_total}"{footnote_style}>{footnote_html}</td></tr>'
                 )
 
     # If no footer content, return empty string
     if not footer_rows:
         return ""
 
-    return f'<tfoot>{"".join(footer_rows)}</tfoot>'
+    return f'<tfoot{_style_attr(*_TFOOT, ancestors=(_TABLE,))}>{"".join(footer_rows)}</tfoot>'
 
 
 def _should_display_footnote(data: GTData, footnote: FootnoteInfo) -> bool:
@@ -1357,7 +1750,17 @@ def _create_footnote_mark_html(mark: str) -> str:
         return ""
 
     # Use consistent span structure for both references and footer
-    return f'<span class="gt_footnote_marks" style="white-space:nowrap;font-style:italic;font-weight:normal;line-height:0;">{mark}</span>'
+    return _footnote_marks_span(mark)
+
+
+def _footnote_marks_span(marks: str) -> str:
+    # Footnote marks can be anywhere in the table, so they're styled without their ancestors
+    style = _style_attr(
+        "span",
+        "gt_footnote_marks",
+        "white-space:nowrap;font-style:italic;font-weight:normal;line-height:0;",
+    )
+    return f'<span class="gt_footnote_marks"{style}>{marks}</span>'
 
 
 def _get_footnote_mark_string(data: GTData, footnote_info: FootnoteInfo) -> str:
@@ -1489,10 +1892,7 @@ def _apply_footnotes_to_text(footnotes: list[FootnoteInfo], data: GTData, text:
     if mark_strings:
         # Join mark strings with commas (no spaces)
         marks_text = ",".join(mark_strings)
-        marks_html = (
-            '<span class="gt_footnote_marks" style="white-space:nowrap;font-style:italic;'
-            f'font-weight:normal;line-height:0;">{marks_text}</span>'
-        )
+        marks_html = _footnote_marks_span(marks_text)
 
         # Determine placement based on the first footnote's placement setting
         # (all footnotes for the same location should have the same placement)
@@ -6,7 +6,7 @@ from itertools import chain
 from typing import TYPE_CHECKING
 
 from ._spanners import spanners_print_matrix
-from ._tbl_data import _get_cell, cast_frame_to_string, replace_null_frame
+from ._tbl_data import StringCells
 from ._text import _process_text
 from ._utils import heading_has_subtitle, heading_has_title, seq_groups
 from ._utils_render_html import _get_spanners_matrix_height
@@ -417,8 +417,8 @@ def create_body_component_l(data: GTData) -> str:
         The LaTeX code for the body component of the table.
     """
 
-    _str_orig_data = cast_frame_to_string(data._tbl_data)
-    tbl_data = replace_null_frame(data._body.body, _str_orig_data)
+    # unformatted cells are filled in with the original data, cast to string as they're needed
+    tbl_data = StringCells(data._body.body, data._tbl_data)
 
     # Get the default column vars
     column_vars = data._boxhead._get_default_columns()
@@ -501,7 +501,7 @@ def create_body_component_l(data: GTData) -> str:
         if has_row_stub_column:
             # Get the row name from the stub
             if row_stub_var is not None:
-                rowname = _get_cell(tbl_data, i, row_stub_var.var)
+                rowname = tbl_data.get(i, row_stub_var.var)
                 rowname_str = str(rowname)
             else:
                 # Placeholder stub for summary rows (no actual rowname column)
@@ -511,7 +511,7 @@ def create_body_component_l(data: GTData) -> str:
 
         # Add data cells
         for colinfo in column_vars:
-            cell_content = _get_cell(tbl_data, i, colinfo.var)
+            cell_content = tbl_data.get(i, colinfo.var)
             cell_str: str = str(cell_content)
 
             body_cells.append(cell_str)
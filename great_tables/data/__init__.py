@@ -1,15 +1,106 @@
+"""Example datasets, loaded from the bundled CSV files on first access.
+
+Each dataset is read when it is first used (e.g., `from great_tables.data import gtcars`) and then
+kept on the module, so importing `great_tables.data` itself is cheap.
+
+Set the `GREAT_TABLES_DATA_CACHE` environment variable to a directory to also keep a copy of each
+loaded dataset there in the Arrow IPC (Feather) format. Later processes read that copy instead of
+parsing the CSV file again, which is much faster for the larger datasets. The cache is optional:
+if the directory can't be written or pyarrow isn't available for pandas, the CSV file is used.
+"""
+
 from __future__ import annotations
 
-from typing import Any
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable
 
 from importlib_resources import files
 
+DATA_CACHE_ENV_VAR = "GREAT_TABLES_DATA_CACHE"
+
+
+def _cache_path(fname: Any, dtype: dict[str, str] | None, backend: str) -> Path | None:
+    """Return the location of the cached copy of a CSV file, or None if caching is disabled."""
+
+    cache_dir = os.environ.get(DATA_CACHE_ENV_VAR)
+    if not cache_dir:
+        return None
+
+    try:
+        stat = os.stat(str(fname))
+    except OSError:
+        # the CSV file is not on the filesystem (e.g. inside a zip archive)
+        return None
+
+    # invalidate the cached copy whenever the CSV file or the requested column types change
+    key = f"{stat.st_size}-{stat.st_mtime_ns}-{sorted((dtype or {}).items())}"
+    digest = hashlib.sha1(key.encode()).hexdigest()[:12]
+
+    return Path(cache_dir) / f"{Path(str(fname)).stem}-{backend}-{digest}.arrow"
+
+
+def _read_cached(
+    fname: Any,
+    dtype: dict[str, str] | None,
+    backend: str,
+    read_csv: Callable[[], Any],
+    read_ipc: Callable[[Path], Any],
+    write_ipc: Callable[[Any, Path], None],
+) -> Any:
+    """Read a dataset from the Arrow IPC cache if possible, falling back to (and filling it from)
+    the CSV file."""
+
+    cache_file = _cache_path(fname, dtype, backend)
+
+    if cache_file is None:
+        return read_csv()
+
+    if cache_file.exists():
+        try:
+            return read_ipc(cache_file)
+        except (ImportError, OSError):
+            pass
+
+    df = read_csv()
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # write to a temporary file first, so concurrent readers never see a partial file
+        fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        os.close(fd)
+        try:
+            write_ipc(df, Path(tmp_name))
+            os.replace(tmp_name, cache_file)
+        finally:
+            if os.path.exists(tmp_name):
+                os.remove(tmp_name)
+    except (ImportError, OSError):
+        pass
+
+    return df
+
 
 def _read_csv_pandas(fname: Any, dtype: dict[str, str] | None = None) -> Any:
     """Read a CSV file as a pandas DataFrame."""
     import pandas as pd
 
-    return pd.read_csv(fname, dtype=dtype)
+    def read_feather(path: Path) -> Any:
+        # restore the requested types, since Arrow has no direct equivalent of e.g. `object`
+        df = pd.read_feather(path)
+        return df.astype({col: t for col, t in (dtype or {}).items() if col in df.columns})
+
+    return _read_cached(
+        fname,
+        dtype,
+        backend="pandas",
+        read_csv=lambda: pd.read_csv(fname, dtype=dtype),
+        read_ipc=read_feather,
+        write_ipc=lambda df, path: df.to_feather(path),
+    )
 
 
 def _read_csv_polars(fname: Any, dtype: dict[str, str] | None = None) -> Any:
@@ -26,7 +117,14 @@ def _read_csv_polars(fname: Any, dtype: dict[str, str] | None = None) -> Any:
         }
         schema_overrides = {col: _PD_TO_PL[t] for col, t in dtype.items()}
 
-    return pl.read_csv(fname, schema_overrides=schema_overrides)
+    return _read_cached(
+        fname,
+        dtype,
+        backend="polars",
+        read_csv=lambda: pl.read_csv(fname, schema_overrides=schema_overrides),
+        read_ipc=pl.read_ipc,
+        write_ipc=lambda df, path: df.write_ipc(path),
+    )
 
 
 def _read_csv(fname: Any, dtype: dict[str, str] | None = None) -> Any:
@@ -327,8 +425,7 @@ _nuclides_dtype = {
 _islands_fname = DATA_MOD / "x-islands.csv"
 _airquality_fname = DATA_MOD / "x-airquality.csv"
 
-countrypops = _read_csv(_countrypops_fname, dtype=_countrypops_dtype)  # type: ignore
-countrypops.__doc__ = """
+_countrypops_doc = """
 Yearly populations of countries from 1960 to 2022.
 
 A dataset that presents yearly, total populations of countries. Total population is based on counts
@@ -363,8 +460,7 @@ Source
 <https://data.worldbank.org/indicator/SP.POP.TOTL>
 """
 
-sza = _read_csv(_sza_fname, dtype=_sza_dtype)  # type: ignore
-sza.__doc__ = """
+_sza_doc = """
 Twice hourly solar zenith angles by month & latitude.
 
 This dataset contains solar zenith angles (in degrees, with the range of 0-90) every half hour from
@@ -410,8 +506,7 @@ Calculated Actinic Fluxes (290 - 700 nm) for Air Pollution Photochemistry Applic
 1976), available at: <https://nepis.epa.gov/Exe/ZyPURL.cgi?Dockey=9100JA26.txt>.
 """
 
-gtcars = _read_csv(_gtcars_fname, dtype=_gtcars_dtype)  # type: ignore
-gtcars.__doc__ = """
+_gtcars_doc = """
 Deluxe automobiles from the 2014-2017 period.
 
 Expensive and fast cars. Each row describes a car of a certain make, model, year, and trim. Basic
@@ -469,8 +564,7 @@ $ msrp        <f64> 447000.0, 291744.0, 263553.0
 
 """
 
-sp500 = _read_csv(_sp500_fname, dtype=_sp500_dtype)  # type: ignore
-sp500.__doc__ = """
+_sp500_doc = """
 Daily S&P 500 Index data from 1950 to 2015.
 
 This dataset provides daily price indicators for the S&P 500 index from the beginning of 1950 to the
@@ -503,8 +597,7 @@ $ adj_close <f64> 2043.9399, 2063.3601, 2078.3601
 
 """
 
-pizzaplace = _read_csv(_pizzaplace_fname, dtype=_pizzaplace_dtype)  # type: ignore
-pizzaplace.__doc__ = """
+_pizzaplace_doc = """
 A year of pizza sales from a pizza place.
 
 A synthetic dataset that describes pizza sales for a pizza place somewhere in the US. While the
@@ -620,8 +713,7 @@ $ price <f64> 13.25, 16.0, 16.0
 
 """
 
-exibble = _read_csv(_exibble_fname, dtype=_exibble_dtype)  # type: ignore
-exibble.__doc__ = """
+_exibble_doc = """
 A toy example table for testing with great_tables: exibble.
 
 This table contains data of a few different classes, which makes it well-suited for quick
@@ -663,8 +755,7 @@ $ group    <str> 'grp_a', 'grp_a', 'grp_a'
 
 """
 
-towny = _read_csv(_towny_fname, dtype=_towny_dtype)  # type: ignore
-towny.__doc__ = """
+_towny_doc = """
 Populations of all municipalities in Ontario from 1996 to 2021.
 
 A dataset containing census population data from six census years (1996 to 2021) for all 414 of
@@ -741,8 +832,7 @@ $ pop_change_2016_2021_pct <f64> 0.0932, 0.007, 0.0013
 
 """
 
-peeps = _read_csv(_peeps_fname, dtype=_peeps_dtype)  # type: ignore
-peeps.__doc__ = """
+_peeps_doc = """
 A table of personal information for people all over the world.
 
 The `peeps` dataset contains records for one hundred people residing in ten different countries.
@@ -797,8 +887,7 @@ $ weight_kg    <f64> 76.4, 74.9, 61.6
 
 """
 
-films = _read_csv(_films_fname, dtype=_films_dtype)  # type: ignore
-films.__doc__ = """
+_films_doc = """
 Feature films in competition at the Cannes Film Festival.
 
 Each entry in the `films` is a feature film that appeared in the official selection during a
@@ -845,8 +934,7 @@ $ imdb_url            <str> 'https://www.imdb.com/title/tt0038297/',
 
 """
 
-metro = _read_csv(_metro_fname, dtype=_metro_dtype)  # type: ignore
-metro.__doc__ = """
+_metro_doc = """
 The stations of the Paris Metro.
 
 A dataset with information on all 314 Paris Metro stations as of June 2024. Each record represents a
@@ -913,8 +1001,7 @@ $ location           <str> 'Paris 16th, Paris 17th',
 
 """
 
-gibraltar = _read_csv(_gibraltar_fname, dtype=_gibraltar_dtype)  # type: ignore
-gibraltar.__doc__ = """
+_gibraltar_doc = """
 Weather conditions in Gibraltar, May 2023.
 
 The `gibraltar` dataset has meteorological data for the Gibraltar Airport Station from May 1 to May
@@ -955,8 +1042,7 @@ $ condition  <str> 'Fair', 'Fair', 'Fair'
 
 """
 
-constants = _read_csv(_constants_fname, dtype=_constants_dtype)  # type: ignore
-constants.__doc__ = """
+_constants_doc = """
 The fundamental physical constants.
 
 This dataset contains values for over 300 basic fundamental constants in nature. The values
@@ -996,8 +1082,7 @@ $ units     <str> None, 'kg', 'J'
 
 """
 
-illness = _read_csv(_illness_fname, dtype=_illness_dtype)  # type: ignore
-illness.__doc__ = """
+_illness_doc = """
 Lab tests for one suffering from an illness.
 
 A dataset with artificial daily lab data for a patient with Yellow Fever (YF). The table comprises
@@ -1081,8 +1166,7 @@ $ norm_u <f64> None, 10.0, 8.0
 
 """
 
-reactions = _read_csv(_reactions_fname, dtype=_reactions_dtype)  # type: ignore
-reactions.__doc__ = """
+_reactions_doc = """
 Reaction rates for gas-phase atmospheric reactions of organic compounds.
 
 The `reactions` dataset contains kinetic data for second-order (two body) gas-phase chemical
@@ -1200,8 +1284,7 @@ $ Cl_t_high     <f64> 300.0, 500.0, 950.0
 
 """
 
-photolysis = _read_csv(_photolysis_fname, dtype=_photolysis_dtype)  # type: ignore
-photolysis.__doc__ = """
+_photolysis_doc = """
 Data on photolysis rates for gas-phase organic compounds.
 
 The `photolysis` dataset contains numerical values for describing the photolytic degradation
@@ -1255,8 +1338,7 @@ $ sigma_298_cm2 <str> '1.43E-18,1.27E-18,1.11E-18,...',
 
 """
 
-nuclides = _read_csv(_nuclides_fname, dtype=_nuclides_dtype)  # type: ignore
-nuclides.__doc__ = """
+_nuclides_doc = """
 Nuclide data.
 
 The `nuclides` dataset contains information on all known nuclides, providing data on nuclear
@@ -1330,10 +1412,6 @@ $ mass_excess_uncert         <f64> 1.3e-05, 1.5e-05, 8e-05
 
 """
 
-islands = _read_csv(_islands_fname)  # type: ignore
-airquality = _read_csv(_airquality_fname)  # type: ignore
-
-
 _x_locales_fname = DATA_MOD / "x_locales.csv"
 _x_locales_dtype = {
     "country_name": "object",
@@ -1390,8 +1468,30 @@ _x_locales_dtype = {
     "page_size_options_label_text": "object",
 }
 
-__x_locales = _read_csv(_x_locales_fname, dtype=_x_locales_dtype)  # type: ignore
 
+# ---------------------------------------------------------------------------
+# Lazy dataset access: data.<name>
+# ---------------------------------------------------------------------------
+
+# Docstrings attached to the datasets when they are loaded
+_DATASET_DOCS: dict[str, str] = {
+    "countrypops": _countrypops_doc,
+    "sza": _sza_doc,
+    "gtcars": _gtcars_doc,
+    "sp500": _sp500_doc,
+    "pizzaplace": _pizzaplace_doc,
+    "exibble": _exibble_doc,
+    "towny": _towny_doc,
+    "peeps": _peeps_doc,
+    "films": _films_doc,
+    "metro": _metro_doc,
+    "gibraltar": _gibraltar_doc,
+    "constants": _constants_doc,
+    "illness": _illness_doc,
+    "reactions": _reactions_doc,
+    "photolysis": _photolysis_doc,
+    "nuclides": _nuclides_doc,
+}
 
 # ---------------------------------------------------------------------------
 # Backend-scoped dataset access: data.pd.<name> and data.pl.<name>
@@ -1451,3 +1551,33 @@ class _BackendNamespace:
 
 pd = _BackendNamespace(_read_csv_pandas)
 pl = _BackendNamespace(_read_csv_polars)
+
+
+# Internal lookup tables, which can be loaded lazily but aren't listed as datasets
+_INTERNAL_DATASETS: dict[str, tuple[Any, dict[str, str] | None]] = {
+    "__x_locales": (_x_locales_fname, _x_locales_dtype),
+}
+
+
+def __getattr__(name: str) -> Any:
+    # each dataset is read on first access, and then stored on the module so that later
+    # lookups don't come back through here
+    if name in _DATASETS:
+        fname, dtype = _DATASETS[name]
+    elif name in _INTERNAL_DATASETS:
+        fname, dtype = _INTERNAL_DATASETS[name]
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    df = _read_csv(fname, dtype=dtype)
+
+    if name in _DATASET_DOCS:
+        df.__doc__ = _DATASET_DOCS[name]
+
+    globals()[name] = df
+
+    return df
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_DATASETS})
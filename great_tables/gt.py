@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
 
 from typing_extensions import Self
 
@@ -66,8 +67,11 @@ from ._options import (
     tab_options,
 )
 from ._pipe import pipe
+from ._profile import profiling, span, timed_iter
+from ._spec import freeze
 from ._render import infer_render_env_defaults
 from ._render_checks import _render_check
+from ._serialize import from_dict, to_dict
 from ._source_notes import tab_source_note
 from ._spanners import (
     cols_hide,
@@ -94,19 +98,13 @@ from ._tab_create_modify import (
     text_replace,
     text_transform,
 )
-from ._tbl_data import _get_cell, _set_cell, n_rows
+from ._tbl_data import ColumnValues, _set_cell, get_column_names, n_rows
 from ._utils import _migrate_unformatted_to_output
-from ._utils_render_html import (
-    _get_table_defs,
-    create_body_component_h,
-    create_columns_component_h,
-    create_footer_component_h,
-    create_heading_component_h,
-)
 
 if TYPE_CHECKING:
     from ._gt_data import Body, Boxhead, Stub
     from ._helpers import BaseText
+    from ._utils_render_html import _StyleClasses
 
 __all__ = ["GT"]
 
@@ -114,24 +112,29 @@ __all__ = ["GT"]
 # =============================================================================
 # Helper for text transforms
 # =============================================================================
-def _apply_text_transforms(data: "GT", body: "Body") -> "Body":
+def _apply_text_transforms(data: "GT", body: "Body", source: ColumnValues | None = None) -> "Body":
     """Apply all registered text transforms to the body cells."""
     from ._tbl_data import is_na
 
     if not data._transforms:
         return body
 
+    if source is None:
+        source = ColumnValues(data._tbl_data)
+
     for transform in data._transforms:
         loc = transform.loc
         fn = transform.fn
 
         if isinstance(loc, LocBody):
             positions = resolve(loc, data)
+            # each cell is read once before it is written, so the body can be read ahead
+            formatted = ColumnValues(body.body)
             for pos in positions:
-                cell_value = _get_cell(body.body, pos.row, pos.colname)
+                cell_value = formatted.get(pos.row, pos.colname)
                 # If the cell is NA (unformatted), fall back to the raw data value
                 if is_na(body.body, cell_value):
-                    cell_value = _get_cell(data._tbl_data, pos.row, pos.colname)
+                    cell_value = source.get(pos.row, pos.colname)
                     if is_na(data._tbl_data, cell_value):
                         continue
                 new_value = fn(str(cell_value))
@@ -142,7 +145,9 @@ def _apply_text_transforms(data: "GT", body: "Body") -> "Body":
     return body
 
 
-def _apply_text_transforms_stub(data: "GT", stub: "Stub", body: "Body") -> tuple["Stub", "Body"]:
+def _apply_text_transforms_stub(
+    data: "GT", stub: "Stub", body: "Body", source: ColumnValues | None = None
+) -> tuple["Stub", "Body"]:
     """Apply text transforms targeting loc.stub() and loc.row_groups()."""
 
     from ._gt_data import ColInfoTypeEnum, GroupRows, Stub
@@ -151,6 +156,9 @@ def _apply_text_transforms_stub(data: "GT", stub: "Stub", body: "Body") -> tuple
     if not data._transforms:
         return stub, body
 
+    if source is None:
+        source = ColumnValues(data._tbl_data)
+
     for transform in data._transforms:
         loc = transform.loc
         fn = transform.fn
@@ -164,10 +172,11 @@ def _apply_text_transforms_stub(data: "GT", stub: "Stub", body: "Body") -> tuple
                 continue
 
             resolved_rows: set[int] = resolve(loc, data)
+            formatted = ColumnValues(body.body)
             for row_idx in resolved_rows:
-                cell_value = _get_cell(body.body, row_idx, stub_col)
+                cell_value = formatted.get(row_idx, stub_col)
                 if is_na(body.body, cell_value):
-                    cell_value = _get_cell(data._tbl_data, row_idx, stub_col)
+                    cell_value = source.get(row_idx, stub_col)
                     if is_na(data._tbl_data, cell_value):
                         continue
                 new_value = fn(str(cell_value))
@@ -443,6 +452,9 @@ class GT(
     as_latex = as_latex
 
     pipe = pipe
+    freeze = freeze
+    to_dict = to_dict
+    from_dict = classmethod(from_dict)
 
     # -----
 
@@ -463,12 +475,25 @@ class GT(
 
         return rendered
 
-    def _render_formats(self, context: str) -> Self:
+    def _render_formats(self, context: str, source: ColumnValues | None = None) -> Self:
         new_body = self._body.copy()
 
-        # TODO: this body method performs a mutation. Should we make a copy of body?
-        new_body.render_formats(self._tbl_data, self._formats, context)
-        new_body.render_formats(self._tbl_data, self._substitutions, context)
+        # hidden columns that aren't merged into shown ones are never rendered
+        columns = set(self._get_used_columns())
+
+        n_cells = None
+        skipped_columns = None
+        if profiling():
+            n_cells = sum(
+                len(info.cells) - len(info.cells.without_cols(columns))
+                for info in [*self._formats, *self._substitutions]
+            )
+            skipped_columns = len(get_column_names(self._tbl_data)) - len(columns)
+
+        with span("render_formats", cells=n_cells, skipped_columns=skipped_columns):
+            # TODO: this body method performs a mutation. Should we make a copy of body?
+            new_body.render_formats(self._tbl_data, self._formats, context, columns, source)
+            new_body.render_formats(self._tbl_data, self._substitutions, context, columns, source)
 
         # Update group row labels with formatted values when a row_group column exists
         new_stub = self._stub.update_group_row_labels(new_body, self._tbl_data, self._boxhead)
@@ -476,19 +501,34 @@ class GT(
         return self._replace(_body=new_body, _stub=new_stub)
 
     def _build_data(self, context: str) -> Self:
+        with span("build_data", context=context):
+            return self._build_data_phases(context)
+
+    def _build_data_phases(self, context: str) -> Self:
+        # the cells of the original data, pulled into lists once and shared by the build steps
+        source = ColumnValues(self._tbl_data)
+
         # Build the body of the table by generating a dictionary
         # of lists with cells initially set to nan values
-        built = self._render_formats(context)
+        built = self._render_formats(context, source)
 
         if context == "latex":
-            built = _migrate_unformatted_to_output(
-                data=built, data_tbl=self._tbl_data, formats=self._formats, context=context
-            )
+            with span("migrate_unformatted"):
+                built = _migrate_unformatted_to_output(
+                    data=built,
+                    data_tbl=self._tbl_data,
+                    formats=self._formats,
+                    context=context,
+                    columns=self._get_used_columns(),
+                    source=source,
+                )
 
         # Perform column merging
-        built = perform_col_merge(built)
+        with span("col_merge", cells=sum(len(info.rows) for info in self._col_merge)):
+            built = perform_col_merge(built, source)
 
-        final_body = body_reassemble(built._body)
+        with span("body_reassemble"):
+            final_body = body_reassemble(built._body)
 
         # Reordering of the metadata elements of the table
 
@@ -497,9 +537,12 @@ class GT(
         # self = self.reorder_styles()
 
         # Transformations of individual cells at supported locations
-        final_body = _apply_text_transforms(built, final_body)
-        final_stub, final_body = _apply_text_transforms_stub(built, final_stub, final_body)
-        final_boxhead = _apply_text_transforms_boxhead(built)
+        with span("text_transforms", transforms=len(self._transforms)):
+            final_body = _apply_text_transforms(built, final_body, source)
+            final_stub, final_body = _apply_text_transforms_stub(
+                built, final_stub, final_body, source
+            )
+            final_boxhead = _apply_text_transforms_boxhead(built)
 
         # ...
 
@@ -522,43 +565,46 @@ class GT(
         self,
         make_page: bool = False,
         all_important: bool = False,
+        intern_styles: bool = False,
+        prune_css: bool = False,
     ) -> str:
-        # TODO: better to put these checks in a pre render hook?
-        _render_check(self)
-
-        heading_component = create_heading_component_h(data=self)
-        column_labels_component = create_columns_component_h(data=self)
-        body_component = create_body_component_h(data=self)
-        footer_component = create_footer_component_h(data=self)
-
-        # Get attributes for the table
-        table_defs = _get_table_defs(data=self)
-
-        # Determine whether Quarto processing of the table is enabled
-        quarto_disable_processing = str(self._options.quarto_disable_processing.value).lower()
-        quarto_use_bootstrap = str(self._options.quarto_use_bootstrap.value).lower()
-
-        # If table_defs["table_colgroups"] is None, then we set table_colgroups to an empty string;
-        # if present, wrap the value with newlines
-        if table_defs["table_colgroups"] is None:
-            table_colgroups = ""
-        else:
-            table_colgroups = f"\n{table_defs['table_colgroups']}\n"
+        return "".join(
+            self._iter_html_chunks(
+                make_page=make_page,
+                all_important=all_important,
+                intern_styles=intern_styles,
+                prune_css=prune_css,
+            )
+        )
 
-        if table_defs["table_style"] is None:
-            table_tag_open = f'<table class="gt_table" data-quarto-disable-processing="{quarto_disable_processing}" data-quarto-bootstrap="{quarto_use_bootstrap}">'
-        else:
-            table_tag_open = f'<table style="{table_defs["table_style"]}" class="gt_table" data-quarto-disable-processing="{quarto_disable_processing}" data-quarto-bootstrap="{quarto_use_bootstrap}">'
+    def _iter_html_chunks(
+        self,
+        make_page: bool = False,
+        all_important: bool = False,
+        intern_styles: bool = False,
+        prune_css: bool = False,
+        inline_css: bool = False,
+    ) -> Iterator[str]:
+        """Yield the rendered HTML in pieces, with the table body produced one row at a time.
+
+        The options `intern_styles=` and `prune_css=` both need to see the complete table before
+        the CSS can be written, so in those cases the table is fully rendered before anything is
+        yielded. With `inline_css=True`, the stylesheet rules are written to the style attributes
+        of the elements as they're rendered, and there is no `<style>` block.
+        """
+
+        # The HTML builders depend on htmltools, which is slow to import, so they are loaded on the
+        # first render rather than with the package
+        from ._utils_render_html import (
+            _collect_used_selectors,
+            _inline_styles,
+            _InlineStyles,
+            _StyleClasses,
+        )
 
-        html_table = f"""{table_tag_open}{table_colgroups}
-<thead>
-{heading_component}
-{column_labels_component}
-</thead>
-{body_component}
-{footer_component}
-</table>
-"""
+        # TODO: better to put these checks in a pre render hook?
+        with span("render_check"):
+            _render_check(self)
 
         # Obtain the `table_id` value from the Options (might be set, might be None)
         table_id = self._options.table_id.value
@@ -568,10 +614,54 @@ class GT(
         else:
             id = table_id
 
+        # Optionally replace repeated inline cell styles with generated classes, whose rules are
+        # added to the table's stylesheet
+        style_classes = _StyleClasses() if intern_styles and not inline_css else None
+
+        from ._scss import compile_rules, compile_scss
+
+        if inline_css:
+            with span("compile_rules"):
+                inline = _InlineStyles(compile_rules(self, id=id, all_important=all_important))
+
+            # The components look up the rules to inline while they're rendered, so the body is
+            # rendered here as well
+            inline_token = _inline_styles.set(inline)
+            try:
+                table_head, body_chunks, table_tail = self._render_table_parts(style_classes)
+                table_chunks: Iterable[str] = [table_head, *body_chunks, table_tail]
+            finally:
+                _inline_styles.reset(inline_token)
+
+            css = None
+
         # Compile the SCSS as CSS
-        from ._scss import compile_scss
+        elif intern_styles or prune_css:
+            table_head, body_chunks, table_tail = self._render_table_parts(style_classes)
+            html_table = "".join([table_head, *body_chunks, table_tail])
+
+            # When pruning, only keep the CSS rules that can match the tags and classes in the table
+            with span("collect_selectors"):
+                used = _collect_used_selectors(html_table) if prune_css else None
+
+            with span("compile_scss"):
+                css = compile_scss(data=self, id=id, all_important=all_important, used=used)
+
+            if style_classes is not None and style_classes.interned:
+                from ._scss import compile_interned_styles
+
+                with span("intern_styles"):
+                    css = f"{css}\n{compile_interned_styles(style_classes.interned, id=id)}"
+
+            table_chunks = [html_table]
+
+        else:
+            table_head, body_chunks, table_tail = self._render_table_parts(style_classes)
+
+            with span("compile_scss"):
+                css = compile_scss(data=self, id=id, all_important=all_important)
 
-        css = compile_scss(data=self, id=id, all_important=all_important)
+            table_chunks = chain([table_head], body_chunks, [table_tail])
 
         # Obtain options set for overflow and container dimensions
 
@@ -582,27 +672,106 @@ class GT(
         container_width = self._options.container_width.value
         container_height = self._options.container_height.value
 
-        finalized_table = f"""<div id="{id}" style="padding-left:{container_padding_x};padding-right:{container_padding_x};padding-top:{container_padding_y};padding-bottom:{container_padding_y};overflow-x:{container_overflow_x};overflow-y:{container_overflow_y};width:{container_width};height:{container_height};">
-<style>
-{css}
-</style>
-{html_table}
-</div>
-"""
-
         if make_page:
             # Create an HTML page and place the table within it
-            finalized_table = f"""<!DOCTYPE html>
+            yield """<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="utf-8"/>
 </head>
 <body>
-{finalized_table}
+"""
+
+        yield f"""<div id="{id}" style="padding-left:{container_padding_x};padding-right:{container_padding_x};padding-top:{container_padding_y};padding-bottom:{container_padding_y};overflow-x:{container_overflow_x};overflow-y:{container_overflow_y};width:{container_width};height:{container_height};">
+"""
+
+        if css is not None:
+            yield f"""<style>
+{css}
+</style>
+"""
+
+        yield from table_chunks
+
+        yield "\n</div>\n"
+
+        if make_page:
+            yield """
 </body>
 </html>
 """
-        return finalized_table
+
+    def _render_table_parts(
+        self, style_classes: _StyleClasses | None = None
+    ) -> tuple[str, Iterator[str], str]:
+        """Render the table element, as its opening up to the body, the body rows, and the rest.
+
+        The body rows are rendered as they're iterated over.
+        """
+
+        from ._utils_render_html import (
+            _TABLE,
+            _THEAD,
+            _get_table_defs,
+            _inline_tag_styles,
+            _style_attr,
+            create_columns_component_h,
+            create_footer_component_h,
+            create_heading_component_h,
+            iter_body_component_h,
+        )
+
+        with span("heading"):
+            heading_component = create_heading_component_h(data=self)
+
+        with span("column_labels"):
+            column_labels_component = create_columns_component_h(data=self)
+
+        n_body_cells = None
+        if profiling():
+            n_body_cells = n_rows(self._tbl_data) * len(self._boxhead.final_columns(self._options))
+
+        body_chunks = timed_iter(
+            "body",
+            iter_body_component_h(data=self, style_classes=style_classes),
+            cells=n_body_cells,
+        )
+
+        with span("footer", footnotes=len(self._footnotes)):
+            footer_component = create_footer_component_h(data=self)
+
+        # Get attributes for the table
+        with span("table_defs"):
+            table_defs = _get_table_defs(data=self)
+
+        # Determine whether Quarto processing of the table is enabled
+        quarto_disable_processing = str(self._options.quarto_disable_processing.value).lower()
+        quarto_use_bootstrap = str(self._options.quarto_use_bootstrap.value).lower()
+
+        # If table_defs["table_colgroups"] is None, then we set table_colgroups to an empty string;
+        # if present, wrap the value with newlines
+        if table_defs["table_colgroups"] is None:
+            table_colgroups = ""
+        else:
+            _inline_tag_styles(table_defs["table_colgroups"], (_TABLE,))
+            table_colgroups = f"\n{table_defs['table_colgroups']}\n"
+
+        table_style = _style_attr(*_TABLE, table_defs["table_style"])
+        table_tag_open = f'<table{table_style} class="gt_table" data-quarto-disable-processing="{quarto_disable_processing}" data-quarto-bootstrap="{quarto_use_bootstrap}">'
+
+        table_head = f"""{table_tag_open}{table_colgroups}
+<thead{_style_attr(*_THEAD, ancestors=(_TABLE,))}>
+{heading_component}
+{column_labels_component}
+</thead>
+"""
+
+        table_tail = f"""
+{footer_component}
+</table>
+"""
+
+        return table_head, body_chunks, table_tail
 
 
 # =============================================================================
@@ -623,12 +792,6 @@ def _get_column_labels(gt: GT, context: str) -> list[str | BaseText | None]:
 
 def _get_column_of_values(gt: GT, column_name: str, context: str) -> list[str]:
     gt_built = gt._build_data(context=context)
-    tbl_data = gt_built._body.body
-    cell_values: list[str] = []
-
-    for i in range(n_rows(tbl_data)):
-        cell_content: Any = _get_cell(tbl_data, i, column_name)
-        cell_str: str = str(cell_content)
-        cell_values.append(cell_str)
+    cell_contents = ColumnValues(gt_built._body.body)[column_name]
 
-    return cell_values
+    return [str(cell_content) for cell_content in cell_contents]
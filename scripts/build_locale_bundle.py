@@ -0,0 +1,42 @@
+"""
+Compile the locale reference tables into great_tables/data/x_bundle.pickle.
+
+The bundle holds the rows of x_locales.csv, x_default_locales.csv, x_currencies.csv, x_flags.csv
+and x_durations.csv (see `BUNDLE_SOURCES` in great_tables/_locale.py), so that they can be loaded
+at runtime without parsing CSV text. Re-run this script whenever one of those CSV files changes;
+the test suite checks that the bundle is up to date.
+
+Usage:
+    python scripts/build_locale_bundle.py
+"""
+
+from __future__ import annotations
+
+import pickle
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+sys.path.insert(0, str(ROOT))
+
+from great_tables._locale import BUNDLE_FNAME, _build_bundle  # noqa: E402
+
+
+def main():
+    data_dir = ROOT / "great_tables" / "data"
+    output_path = data_dir / BUNDLE_FNAME
+
+    bundle = _build_bundle(data_dir)
+
+    # protocol 4 is readable by every Python version we support
+    output_path.write_bytes(pickle.dumps(bundle, protocol=4))
+
+    for name, table in bundle["tables"].items():
+        print(f"{name}: {len(table):,} bytes")
+
+    print(f"Wrote {output_path} ({output_path.stat().st_size:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
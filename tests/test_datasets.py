@@ -80,3 +80,75 @@ def test_namespace_dir():
     assert pd_datasets == pl_datasets
     for name in _DATASET_NAMES:
         assert name in pd_datasets
+
+
+def test_datasets_loaded_lazily_and_cached(monkeypatch: pytest.MonkeyPatch):
+    calls: list[str] = []
+    read_csv = data._read_csv
+
+    def counting_read_csv(fname, dtype=None):
+        calls.append(str(fname))
+        return read_csv(fname, dtype=dtype)
+
+    monkeypatch.delitem(vars(data), "sza", raising=False)
+    monkeypatch.setattr(data, "_read_csv", counting_read_csv)
+
+    df1 = data.sza
+    df2 = data.sza
+
+    assert df1 is df2
+    assert len(calls) == 1
+    assert df1.__doc__.startswith("\nTwice hourly solar zenith angles")
+
+
+def test_datasets_module_dir():
+    assert set(_DATASET_NAMES) <= set(dir(data))
+
+
+def test_datasets_module_invalid_attribute():
+    with pytest.raises(AttributeError, match="has no attribute"):
+        data.nonexistent_dataset
+
+
+@pytest.mark.parametrize("reader", [data._read_csv_pandas, data._read_csv_polars])
+def test_datasets_arrow_cache(monkeypatch: pytest.MonkeyPatch, tmp_path, reader):
+    fname, dtype = data._DATASETS["exibble"]
+    expected = reader(fname, dtype=dtype)
+
+    monkeypatch.setenv(data.DATA_CACHE_ENV_VAR, str(tmp_path))
+
+    first = reader(fname, dtype=dtype)
+    cache_files = list(tmp_path.glob("06-exibble-*.arrow"))
+
+    assert len(cache_files) == 1
+
+    second = reader(fname, dtype=dtype)
+
+    if isinstance(expected, pd.DataFrame):
+        pd.testing.assert_frame_equal(first, expected)
+        pd.testing.assert_frame_equal(second, expected)
+    else:
+        assert first.equals(expected)
+        assert second.equals(expected)
+        assert second.schema == expected.schema
+
+
+def test_datasets_arrow_cache_key_uses_dtype(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    fname, dtype = data._DATASETS["exibble"]
+    monkeypatch.setenv(data.DATA_CACHE_ENV_VAR, str(tmp_path))
+
+    assert data._cache_path(fname, dtype, "pandas") != data._cache_path(fname, None, "pandas")
+    assert data._cache_path(fname, dtype, "pandas") != data._cache_path(fname, dtype, "polars")
+
+
+def test_datasets_arrow_cache_unwritable_falls_back(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    # a file where the cache directory should be, so the cache can't be created
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+
+    monkeypatch.setenv(data.DATA_CACHE_ENV_VAR, str(blocker / "cache"))
+
+    fname, dtype = data._DATASETS["exibble"]
+    df = data._read_csv_pandas(fname, dtype=dtype)
+
+    assert df.shape[0] == 8
@@ -1,13 +1,17 @@
+import gzip
+import io
+import re
 import tempfile
 import time
 from pathlib import Path
 
+import pandas as pd
 import pytest
 import requests
 from ipykernel.zmqshell import ZMQInteractiveShell
 from IPython.terminal.interactiveshell import InteractiveShell, TerminalInteractiveShell
 
-from great_tables import GT, exibble, md
+from great_tables import GT, exibble, loc, md, style
 from great_tables._export import _create_temp_file_server, _infer_render_target, as_raw_html
 from great_tables.data import gtcars
 
@@ -55,11 +59,123 @@ def test_html_string_generated_inline_css_make_page(gt_tbl_small: GT, snapshot:
     assert snapshot == gt_tbl_small.as_raw_html(inline_css=True, make_page=True)
 
 
+def _inline_styles_by_element(html_str: str) -> list[dict[str, str]]:
+    styles = []
+    for tag_attrs in re.findall(r"<(?:table|thead|tr|th|td|div|span|p)\b([^<>]*)>", html_str):
+        style_attr = re.search(r'style="([^"]*)"', tag_attrs)
+        declarations = style_attr.group(1).split(";") if style_attr else []
+        styles.append(
+            {k.strip(): v.strip() for k, _, v in (d.partition(":") for d in declarations if d)}
+        )
+
+    return styles
+
+
+def test_html_string_generated_inline_css_native(gt_tbl_small: GT, snapshot: str):
+    assert snapshot == gt_tbl_small.as_raw_html(inline_css="native")
+
+
+@pytest.mark.parametrize("all_important", [False, True])
+def test_html_string_generated_inline_css_native_matches_css_inline(
+    gt_tbl: GT, all_important: bool
+):
+    gt_styled = gt_tbl.tab_style(
+        style=style.fill(color="red"), locations=loc.body(columns="num")
+    ).tab_spanner(label="spanner", columns=["num", "char"])
+
+    html_native = gt_styled.as_raw_html(inline_css="native", all_important=all_important)
+    html_css_inline = gt_styled.as_raw_html(inline_css=True, all_important=all_important)
+
+    assert "<style>" not in html_native
+    assert _inline_styles_by_element(html_native) == _inline_styles_by_element(html_css_inline)
+
+
+def test_html_string_generated_inline_css_raises(gt_tbl_small: GT):
+    with pytest.raises(ValueError, match="must be a boolean or"):
+        gt_tbl_small.as_raw_html(inline_css="fast")
+
+
+def test_html_string_generated_prune_css(gt_tbl: GT, gt_tbl_small: GT):
+    html_small = gt_tbl_small.as_raw_html(prune_css=True)
+
+    assert len(html_small) < len(gt_tbl_small.as_raw_html()) / 2
+    assert "#test_table_small .gt_row {" in html_small
+    assert ".gt_group_heading" not in html_small
+    assert ".gt_sourcenote" not in html_small
+
+    html = gt_tbl.as_raw_html(prune_css=True)
+
+    assert "#test_table .gt_group_heading {" in html
+    assert "#test_table .gt_sourcenote {" in html
+    assert "#test_table .gt_stub {" in html
+    assert ".gt_row_group_first" not in html
+    assert ".gt_footnote {" not in html
+
+
+def test_html_string_generated_prune_css_inline_css_native(gt_tbl: GT):
+    html_pruned = gt_tbl.as_raw_html(inline_css="native", prune_css=True)
+
+    assert html_pruned == gt_tbl.as_raw_html(inline_css="native")
+
+
 def test_html_string_generated_all_important(gt_tbl_small: GT):
     assert "!important;" in gt_tbl_small.as_raw_html(inline_css=False, all_important=True)
     assert "!important;" in gt_tbl_small.as_raw_html(inline_css=True, all_important=True)
 
 
+def test_html_string_generated_intern_styles(gt_tbl_small: GT):
+    gt_styled = gt_tbl_small.tab_style(
+        style=style.fill(color="red"), locations=loc.body(columns="num")
+    ).tab_style(style=style.text(weight="bold"), locations=loc.body(columns="char"))
+
+    html_str = gt_styled.as_raw_html(intern_styles=True)
+
+    assert 'style="background-color: red;"' not in html_str
+    assert "#test_table_small .gt_s0 { background-color: red !important; }" in html_str
+    assert "#test_table_small .gt_s1 { font-weight: bold !important; }" in html_str
+    assert html_str.count('class="gt_row gt_right gt_s0"') == 2
+    assert html_str.count('class="gt_row gt_left gt_s1"') == 2
+    assert ".gt_s2" not in html_str
+
+
+def test_html_string_generated_intern_styles_skips_cell_content():
+    inner = '<table><tr><td style="color:red">in</td></tr></table>'
+    gt_styled = GT(pd.DataFrame({"x": [inner]}), id="t").tab_style(
+        style=style.fill(color="red"), locations=loc.body()
+    )
+
+    html_str = gt_styled.as_raw_html(intern_styles=True)
+
+    assert inner in html_str
+    assert ".gt_s1" not in html_str
+
+
+def test_html_string_generated_intern_styles_semicolon_in_value():
+    url = "url('data:image/png;base64,AAAA')"
+    gt_styled = GT(pd.DataFrame({"x": [1]}), id="t").tab_style(
+        style=style.css(f"background: {url}"), locations=loc.body()
+    )
+
+    html_str = gt_styled.as_raw_html(intern_styles=True)
+
+    assert f"#t .gt_s0 {{ background: {url} !important; }}" in html_str
+
+
+def test_html_string_generated_intern_styles_no_styles(gt_tbl_small: GT):
+    assert gt_tbl_small.as_raw_html(intern_styles=True) == gt_tbl_small.as_raw_html()
+
+
+def test_html_string_generated_intern_styles_ignored_with_inline_css(gt_tbl_small: GT):
+    gt_styled = gt_tbl_small.tab_style(
+        style=style.fill(color="red"), locations=loc.body(columns="num")
+    )
+
+    html_str = gt_styled.as_raw_html(inline_css=True, intern_styles=True)
+
+    assert "gt_s0" not in html_str
+    assert html_str == gt_styled.as_raw_html(inline_css=True)
+
+
 @pytest.mark.parametrize(
     "src, dst",
     [
@@ -110,6 +226,66 @@ def test_write_raw_html(gt_tbl):
         assert Path(s_file).exists()
 
 
+def test_as_raw_html_compression_gzip(gt_tbl: GT):
+    res = gt_tbl.as_raw_html(compression="gzip")
+
+    assert isinstance(res, bytes)
+    assert gzip.decompress(res).decode("utf-8") == gt_tbl.as_raw_html()
+
+
+def test_as_raw_html_compression_zstd(gt_tbl: GT):
+    zstandard = pytest.importorskip("zstandard")
+
+    res = gt_tbl.as_raw_html(compression="zstd")
+    decompressed = zstandard.ZstdDecompressor().decompressobj().decompress(res)
+
+    assert decompressed.decode("utf-8") == gt_tbl.as_raw_html()
+
+
+def test_as_raw_html_compression_br(gt_tbl: GT):
+    brotli = pytest.importorskip("brotli")
+
+    res = gt_tbl.as_raw_html(compression="br", make_page=True)
+
+    assert brotli.decompress(res).decode("utf-8") == gt_tbl.as_raw_html(make_page=True)
+
+
+def test_as_raw_html_compression_raises(gt_tbl: GT):
+    with pytest.raises(ValueError, match="must be one of"):
+        gt_tbl.as_raw_html(compression="lzma")
+
+
+def test_write_raw_html_compression(gt_tbl: GT):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        p_file = Path(tmp_dir, "table.html.gz")
+        gt_tbl.write_raw_html(p_file, compression="gzip", newline="\r\n", inline_css="native")
+
+        expected = gt_tbl.as_raw_html(inline_css="native").replace("\n", "\r\n")
+        assert gzip.decompress(p_file.read_bytes()).decode("utf-8") == expected
+
+
+def test_write_raw_html_compression_raises(gt_tbl: GT):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        p_file = Path(tmp_dir, "table.html.xz")
+
+        with pytest.raises(ValueError):
+            gt_tbl.write_raw_html(p_file, compression="xz")
+
+        assert not p_file.exists()
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_write_raw_html_buffer(gt_tbl: GT, compression: "str | None"):
+    buffer = io.BytesIO()
+    gt_tbl.write_raw_html(buffer, newline="\n", compression=compression)
+
+    res = buffer.getvalue()
+    if compression == "gzip":
+        res = gzip.decompress(res)
+
+    assert res.decode("utf-8") == gt_tbl.as_raw_html()
+
+
 def test_snap_as_latex(snapshot):
     gt_tbl = (
         GT(
@@ -0,0 +1,262 @@
+import base64
+import io
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from nokap import SelectorError
+
+from great_tables import GT, ExportSession, exibble, gtsave_many
+from great_tables._export_session import ExportResult, _BrowserWorker
+
+
+@pytest.fixture
+def gt_tbl():
+    return GT(exibble[["num", "char"]].head(3))
+
+
+@pytest.fixture
+def fake_capture(monkeypatch: pytest.MonkeyPatch):
+    """Replace browser captures with writing the HTML to the output file."""
+
+    calls = {"n_active": 0, "max_active": 0, "resets": 0}
+    lock = threading.Lock()
+
+    def capture(self, html, file, **kwargs):
+        with lock:
+            calls["n_active"] += 1
+            calls["max_active"] = max(calls["max_active"], calls["n_active"])
+
+        try:
+            time.sleep(0.01)
+            if "fail" in file.name:
+                raise RuntimeError("capture failed")
+            file.write_text(html)
+            return file
+        finally:
+            with lock:
+                calls["n_active"] -= 1
+
+    def reset(self):
+        with lock:
+            calls["resets"] += 1
+
+    monkeypatch.setattr(_BrowserWorker, "capture", capture)
+    monkeypatch.setattr(_BrowserWorker, "reset", reset)
+
+    return calls
+
+
+def test_export_session_gtsave(gt_tbl: GT, tmp_path: Path, fake_capture):
+    with ExportSession() as session:
+        res = session.gtsave(gt_tbl, tmp_path / "table")
+
+    assert res == tmp_path / "table.png"
+    assert res.read_text().startswith("<div id=")
+
+
+def test_export_session_gtsave_many_isolates_errors(gt_tbl: GT, tmp_path: Path, fake_capture):
+    files = [tmp_path / "a.png", tmp_path / "fail.png", tmp_path / "c.pdf"]
+
+    with ExportSession(workers=2) as session:
+        results = session.gtsave_many([gt_tbl] * 3, files)
+
+        # Only the worker with the failed capture gets a new tab
+        assert fake_capture["resets"] == 1
+
+    assert [result.file for result in results] == files
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, RuntimeError)
+    assert files[0].exists() and files[2].exists()
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_gtsave_many_bounds_concurrency(gt_tbl: GT, tmp_path: Path, fake_capture, workers: int):
+    files = [tmp_path / f"table_{i}.png" for i in range(8)]
+
+    results = gtsave_many([gt_tbl] * 8, files, workers=workers)
+
+    assert all(result.ok for result in results)
+    assert fake_capture["max_active"] <= workers
+
+
+def test_gtsave_many_raises_on_length_mismatch(gt_tbl: GT, tmp_path: Path):
+    with pytest.raises(ValueError, match="must match the number of tables"):
+        gtsave_many([gt_tbl, gt_tbl], [tmp_path / "a.png"])
+
+
+def test_gtsave_many_raises_on_bad_extension(gt_tbl: GT, tmp_path: Path):
+    with pytest.raises(ValueError, match="Unsupported file extension: '.bmp'"):
+        gtsave_many([gt_tbl], [tmp_path / "a.bmp"])
+
+
+def test_export_session_raises_when_closed(gt_tbl: GT, tmp_path: Path):
+    session = ExportSession()
+    session.close()
+
+    with pytest.raises(RuntimeError, match="has been closed"):
+        session.gtsave(gt_tbl, tmp_path / "a.png")
+
+
+def test_export_session_raises_on_workers():
+    with pytest.raises(ValueError, match="must be at least 1"):
+        ExportSession(workers=0)
+
+
+def test_export_result_ok():
+    assert ExportResult(file=Path("a.png")).ok
+    assert not ExportResult(file=Path("a.png"), error=ValueError()).ok
+
+
+class FakeSession:
+    """A stand-in for a browser tab, which 'lays out' each table as a 100x40 box."""
+
+    def __init__(self):
+        self.calls = []
+        self._width = 992
+        self._height = 744
+
+    def set_viewport(self, width, height, device_scale_factor=1.0):
+        self.calls.append("set_viewport")
+        self.zoom = device_scale_factor
+
+    def navigate(self, url):
+        self.calls.append("navigate")
+        self.page = Path(url.removeprefix("file://")).read_text()
+
+    def evaluate(self, js):
+        self.calls.append("evaluate")
+        n_items = self.page.count('class="gt_batch_item"')
+        rects = [{"x": 20, "y": 20 + 80 * i, "width": 100, "height": 40} for i in range(n_items)]
+        if "missing" in js:
+            rects[0] = None
+        return {"rects": rects, "width": 140, "height": 80 * n_items + 20}
+
+    def _send(self, method, params):
+        from PIL import Image
+
+        self.calls.append(method)
+        clip = params["clip"]
+        size = (round(clip["width"] * self.zoom), round(clip["height"] * self.zoom))
+        buffer = io.BytesIO()
+        Image.new("RGBA", size, "red").save(buffer, format="png")
+        return {"data": base64.b64encode(buffer.getvalue()).decode()}
+
+
+@pytest.fixture
+def fake_session(monkeypatch: pytest.MonkeyPatch):
+    pytest.importorskip("PIL")
+
+    session = FakeSession()
+    monkeypatch.setattr(_BrowserWorker, "_get_session", lambda self, vwidth, vheight: session)
+
+    return session
+
+
+def test_gtsave_many_single_page(gt_tbl: GT, tmp_path: Path, fake_session: FakeSession):
+    files = [tmp_path / "a.png", tmp_path / "b.jpg", tmp_path / "c.webp"]
+
+    results = gtsave_many([gt_tbl] * 3, files, single_page=True, zoom=2, expand=5, delay=0)
+
+    assert all(result.ok for result in results)
+
+    # A single page is measured and captured for all of the tables
+    assert fake_session.calls == [
+        "set_viewport",
+        "navigate",
+        "evaluate",
+        "Page.captureScreenshot",
+    ]
+
+    from PIL import Image
+
+    for file in files:
+        with Image.open(file) as image:
+            assert image.size == (220, 100)
+
+
+def test_gtsave_many_single_page_batches(gt_tbl: GT, tmp_path: Path, fake_session: FakeSession):
+    files = [tmp_path / f"table_{i}.png" for i in range(5)]
+
+    results = gtsave_many([gt_tbl] * 5, files, single_page=True, batch_size=2, delay=0)
+
+    assert all(result.ok for result in results)
+    assert fake_session.calls.count("Page.captureScreenshot") == 3
+
+
+def test_gtsave_many_single_page_isolates_errors(
+    gt_tbl: GT, tmp_path: Path, fake_session: FakeSession
+):
+    files = [tmp_path / "a.png", tmp_path / "b.png"]
+
+    results = gtsave_many([gt_tbl] * 2, files, selector=".missing", single_page=True, delay=0)
+
+    assert [result.ok for result in results] == [False, True]
+    assert isinstance(results[0].error, SelectorError)
+
+
+def test_gtsave_many_single_page_raises_on_pdf(gt_tbl: GT, tmp_path: Path):
+    with pytest.raises(ValueError, match="PDF files isn't supported"):
+        gtsave_many([gt_tbl], [tmp_path / "a.pdf"], single_page=True)
+
+
+def test_export_session_requires_nokap_internals(monkeypatch):
+    monkeypatch.setitem(sys.modules, "nokap._cdp", None)
+
+    with pytest.raises(ImportError, match=r"great_tables\[export\]"):
+        ExportSession()
+
+
+def test_nokap_private_apis():
+    # ExportSession relies on these private parts of nokap (pinned by the `export` extra), which
+    # its tests otherwise replace
+    import inspect
+
+    from nokap import Session
+    from nokap._cdp import SyncCDP
+    from nokap._pdf import capture_element_pdf, capture_pdf
+    from nokap._screenshot import capture_screenshot
+
+    def params(fn):
+        return set(inspect.signature(fn).parameters)
+
+    assert {"connect", "close"} <= set(dir(SyncCDP))
+    assert {"cdp", "width", "height"} <= params(Session)
+    assert {"navigate", "set_viewport", "evaluate", "close"} <= set(dir(Session))
+    assert "device_scale_factor" in params(Session.set_viewport)
+    assert {"session", "file", "selector", "cliprect", "expand", "zoom"} <= params(
+        capture_screenshot
+    )
+    assert {"session", "file", "selector", "expand", "print_background"} <= params(
+        capture_element_pdf
+    )
+    assert {"session", "file", "print_background"} <= params(capture_pdf)
+
+
+@pytest.mark.integration
+def test_export_session_gtsave_many_browser(gt_tbl: GT, tmp_path: Path):
+    files = [tmp_path / "a.png", tmp_path / "b.jpg", tmp_path / "c.pdf"]
+
+    with ExportSession(workers=2) as session:
+        results = session.gtsave_many([gt_tbl] * 3, files, zoom=1)
+        more_results = session.gtsave_many([gt_tbl], [tmp_path / "d.png"])
+
+    assert all(result.ok for result in [*results, *more_results])
+    assert all(file.stat().st_size > 0 for file in files)
+
+
+@pytest.mark.integration
+def test_gtsave_many_single_page_browser(gt_tbl: GT, tmp_path: Path):
+    files = [tmp_path / "a.png", tmp_path / "b.png"]
+
+    results = gtsave_many([gt_tbl, gt_tbl.tab_header(title="Title")], files, single_page=True)
+
+    assert all(result.ok for result in results)
+
+    from PIL import Image
+
+    with Image.open(files[0]) as image_a, Image.open(files[1]) as image_b:
+        assert image_a.width == image_b.width
+        assert image_a.height < image_b.height
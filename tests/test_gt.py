@@ -1,6 +1,7 @@
 import pandas as pd
 import pytest
 from great_tables import GT
+from great_tables._utils import PersistentList
 
 
 # Generate a gt Table object for assertion testing
@@ -36,8 +37,8 @@ def test_gt_object_prerender(gt_tbl: GT):
     assert type(gt_tbl._spanners).__name__ == "Spanners"
     assert type(gt_tbl._heading).__name__ == "Heading"
     assert isinstance(gt_tbl._source_notes, list)
-    assert isinstance(gt_tbl._footnotes, list)
-    assert isinstance(gt_tbl._styles, list)
+    assert isinstance(gt_tbl._footnotes, PersistentList)
+    assert isinstance(gt_tbl._styles, PersistentList)
     assert type(gt_tbl._locale).__name__ == "Locale"
 
 
@@ -64,3 +65,14 @@ def test_gt_table_render(gt_tbl: GT):
         ).__name__
         == "str"
     )
+
+
+def test_gt_chaining_shares_entries(gt_tbl: GT):
+    from great_tables import loc, style
+
+    new_gt = gt_tbl.tab_style(style.fill("red"), loc.body(columns="a", rows=[0]))
+    newer_gt = new_gt.tab_style(style.fill("blue"), loc.body(columns="a", rows=[1])).fmt_number("a")
+
+    assert newer_gt._styles._parent is new_gt._styles
+    assert list(newer_gt._styles[:1]) == list(new_gt._styles)
+    assert len(gt_tbl._styles) == 0 and len(gt_tbl._formats) == 0
@@ -1,6 +1,17 @@
 import pandas as pd
 from great_tables import GT
-from great_tables._gt_data import Boxhead, ColInfo, RowInfo, Stub
+from great_tables._gt_data import (
+    Boxhead,
+    CellMask,
+    CellRectangle,
+    ColInfo,
+    GroupRowInfo,
+    GroupRows,
+    RowInfo,
+    Stub,
+    StubRows,
+    _nonzero,
+)
 
 
 def test_stub_construct_df():
@@ -48,3 +59,94 @@ def test_google_font_imports_is_set():
     from great_tables._helpers import GoogleFontImports
 
     assert isinstance(gt_table._google_font_imports, GoogleFontImports)
+
+
+def test_cell_rectangle():
+    cells = CellRectangle(["x", "y"], range(3))
+
+    assert len(cells) == 6
+    assert cells.contains("y", 2)
+    assert not cells.contains("z", 0)
+    assert not cells.contains("x", 3)
+    assert cells.without_cols(["x"]).resolve() == [("y", 0), ("y", 1), ("y", 2)]
+    assert len(cells.without_cols(["x", "y"])) == 0
+
+
+def test_cell_mask():
+    cells = CellMask({"x": bytes([1, 0, 1]), "y": bytes([0, 1, 0])})
+
+    assert len(cells) == 3
+    assert cells.contains("x", 2)
+    assert not cells.contains("y", 2)
+    assert cells.resolve() == [("x", 0), ("y", 1), ("x", 2)]
+    assert cells.without_cols(["y"]).cols == ["x"]
+
+
+def test_stub_rows():
+    rows = StubRows(range(3), ["a", None, "a"], ["x", "y", "z"])
+
+    assert rows[2] == RowInfo(2, "a", "z")
+    assert rows.group_id == ["a", None, "a"]
+    assert rows.take([2, 0]) == [RowInfo(2, "a", "z"), RowInfo(0, "a", "x")]
+    assert rows[1:] == [RowInfo(1, None, "y"), RowInfo(2, "a", "z")]
+    assert StubRows.from_rows(list(rows)) == rows
+
+
+def test_stub_rows_without_groups_or_rownames():
+    rows = StubRows(range(2))
+
+    assert list(rows) == [RowInfo(0), RowInfo(1)]
+    assert not rows.has_group_ids()
+    assert not rows.has_rownames()
+
+
+def test_stub_reorder_rows_keeps_row_info():
+    stub = Stub.from_data(pd.DataFrame({"g": ["b", "a"], "x": [1, 2]}), groupname_col="g")
+
+    assert list(stub.reorder_rows([1, 0])) == [RowInfo(1, "a"), RowInfo(0, "b")]
+
+
+def test_group_rows_indices_map():
+    group_rows = GroupRows([GroupRowInfo("b", indices=[1]), GroupRowInfo("a", indices=[0, 2])])
+
+    assert [(ii, info.group_id) for ii, info in group_rows.indices_map(3)] == [
+        (1, "b"),
+        (0, "a"),
+        (2, "a"),
+    ]
+    assert GroupRows([]).indices_map(2) == [(0, None), (1, None)]
+
+
+def test_cell_mask_row_indices():
+    cells = CellMask({"x": bytes([1, 0, 0, 1]), "y": bytes([0, 0, 1, 1])})
+
+    assert cells.row_indices() == [0, 2, 3]
+    assert CellMask({}).row_indices() == []
+
+
+def test_nonzero():
+    assert _nonzero(bytes([0, 1, 0, 1])) == [1, 3]
+    assert _nonzero(bytes([1, 1])) == [0, 1]
+    assert _nonzero(b"") == []
+
+
+def test_get_used_columns():
+    df = pd.DataFrame({"row": ["r"], "a": [1], "b": [2], "c": [3], "d": [4]})
+    gt = GT(df, rowname_col="row").cols_merge(["a", "b"]).cols_hide(["b", "c"])
+
+    assert gt._get_used_columns() == ["row", "a", "b", "d"]
+    assert gt.cols_hide("a")._get_used_columns() == ["row", "d"]
+
+
+def test_render_formats_skips_hidden_columns():
+    df = pd.DataFrame({"a": [1.0], "b": [2.0], "c": [3.0]})
+    calls = []
+
+    def fmt(x):
+        calls.append(x)
+        return str(x)
+
+    gt = GT(df).fmt(fmt).cols_merge(["a", "b"]).cols_hide(["b", "c"])
+    gt._build_data("html")
+
+    assert sorted(calls) == [1.0, 2.0]
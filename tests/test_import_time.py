@@ -0,0 +1,77 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import great_tables
+
+# Run subprocesses against this checkout of great_tables, rather than any installed copy
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(great_tables.__file__))
+
+# Modules that are only needed for particular features, and should not be loaded by a bare import
+DEFERRED_MODULES = [
+    "babel",
+    "faicons",
+    "htmltools",
+    "http.server",
+    "importlib_metadata",
+    "multimark",
+    "webbrowser",
+    "great_tables._export_session",
+    "great_tables._utils_render_html",
+    "great_tables._utils_render_latex",
+]
+
+
+def _run_python(code: str, *args: str) -> subprocess.CompletedProcess[str]:
+    env = {**os.environ, "PYTHONPATH": PACKAGE_ROOT}
+    return subprocess.run(
+        [sys.executable, *args, "-c", code], capture_output=True, text=True, check=True, env=env
+    )
+
+
+def _import_time_us(stderr: str, module: str) -> int:
+    # lines look like: "import time:       self [us] |  cumulative | imported package"
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative)
+
+    raise ValueError(f"Module {module} not found in -X importtime output.")
+
+
+def test_import_does_not_load_deferred_modules():
+    res = _run_python(
+        "import sys, great_tables; print('\\n'.join(sorted(sys.modules)))",
+    )
+    loaded = set(res.stdout.splitlines())
+
+    assert "great_tables.gt" in loaded
+    assert [mod for mod in DEFERRED_MODULES if mod in loaded] == []
+
+
+def test_version_resolved_lazily():
+    from importlib_metadata import version
+
+    assert great_tables.__version__ == version("great_tables")
+    assert "__version__" in vars(great_tables)
+
+
+@pytest.mark.parametrize("name", ["ExportSession", "gtsave_many"])
+def test_lazy_export_session_attributes(name: str):
+    from great_tables import _export_session
+
+    assert getattr(great_tables, name) is getattr(_export_session, name)
+
+
+def test_render_after_lazy_import():
+    res = _run_python(
+        "import great_tables as gt, polars as pl; "
+        "print(gt.GT(pl.DataFrame({'x': [1]})).fmt_number('x').as_raw_html()[:4])"
+    )
+
+    assert res.stdout.strip() == "<div"
@@ -0,0 +1,68 @@
+import pickle
+
+import pytest
+
+from great_tables import _locale
+from great_tables._locale import (
+    BUNDLE_FNAME,
+    BUNDLE_SOURCES,
+    BUNDLE_VERSION,
+    DATA_MOD,
+    _build_bundle,
+    _get_currencies_data,
+    _get_locales_data,
+    read_csv,
+)
+
+
+def test_bundle_up_to_date():
+    # if this fails, regenerate the bundle with `python scripts/build_locale_bundle.py`
+    bundle = pickle.loads((DATA_MOD / BUNDLE_FNAME).read_bytes())
+    expected = _build_bundle()
+
+    assert bundle["version"] == BUNDLE_VERSION
+    assert bundle["tables"].keys() == expected["tables"].keys()
+
+    for name, table in expected["tables"].items():
+        assert pickle.loads(bundle["tables"][name]) == pickle.loads(table), name
+
+
+@pytest.mark.parametrize("name", list(BUNDLE_SOURCES))
+def test_bundle_matches_csv(name: str):
+    fname, omit = BUNDLE_SOURCES[name]
+    csv_rows = read_csv(DATA_MOD / fname)
+
+    expected = [{k: v for k, v in row.items() if k not in omit} for row in csv_rows]
+
+    assert _locale._load_table(name) == expected
+
+
+def test_bundle_omits_widget_text():
+    row = _get_locales_data()[0]
+
+    assert "locale" in row
+    assert "group" in row
+    assert "page_next_text" not in row
+    assert "no_table_data_text" not in row
+
+
+def test_bundle_tables_loaded_once():
+    assert _get_currencies_data() is _get_currencies_data()
+
+
+def test_bundle_tables_loaded_lazily(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(_locale, "_BUNDLE_CACHE", None)
+    monkeypatch.setattr(_locale, "_TABLE_CACHE", {})
+
+    _get_currencies_data()
+
+    assert list(_locale._TABLE_CACHE) == ["currencies"]
+
+
+def test_bundle_version_mismatch_raises(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(_locale, "_BUNDLE_CACHE", None)
+    monkeypatch.setattr(_locale, "_TABLE_CACHE", {})
+    monkeypatch.setattr(_locale, "BUNDLE_VERSION", BUNDLE_VERSION + 1)
+
+    with pytest.raises(RuntimeError, match="out of date"):
+        _get_locales_data()
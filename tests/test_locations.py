@@ -15,13 +15,14 @@ from great_tables._locations import (
     LocTitle,
     LocGrandSummaryStub,
     LocGrandSummary,
+    _selector_key,
     resolve,
     resolve_cols_i,
     resolve_rows_i,
     resolve_vector_i,
     set_style,
 )
-from great_tables._styles import CellStyleText, FromColumn
+from great_tables._styles import CellStyleFromData, CellStyleText, FromColumn
 
 
 def test_resolve_vector_i():
@@ -93,6 +94,47 @@ def test_resolve_rows_i_polars_expr():
     assert resolve_rows_i(gt, pl.col("x").is_in(["a", "b"])) == [("a", 0), ("b", 1)]
 
 
+def test_resolve_rows_i_polars_expr_is_cached():
+    gt = GT(pl.DataFrame({"x": ["a", "b", "c"]}), rowname_col="x")
+
+    res = resolve_rows_i(gt, pl.col("x").is_in(["a", "b"]))
+
+    assert resolve_rows_i(gt, pl.col("x").is_in(["a", "b"])) == res
+    assert len(gt._selections._results) == 1
+
+    # the stub is part of the key, since it holds the row names
+    unnamed = gt.tab_stub(rowname_col=None)
+    assert resolve_rows_i(unnamed, pl.col("x").is_in(["a", "b"])) == [(None, 0), (None, 1)]
+
+
+def test_selection_cache_reset_with_new_data():
+    gt = GT(pl.DataFrame({"x": [1, 2, 3]}))
+    resolve_cols_i(gt, cs.numeric())
+
+    new_gt = gt._replace(_tbl_data=pl.DataFrame({"y": [1, 2, 3]}))
+
+    assert gt.tab_header("title")._selections is gt._selections
+    assert resolve_cols_i(new_gt, cs.numeric()) == [("y", 0)]
+
+
+@pytest.mark.parametrize(
+    "expr, key_is_none",
+    [
+        (["a", 1], False),
+        (pl.col("x") > 1, False),
+        (lambda D: D["x"] > 1, True),
+        (pl.col("x").map_batches(lambda s: s > 1), True),
+    ],
+)
+def test_selector_key(expr, key_is_none: bool):
+    assert (_selector_key(expr) is None) == key_is_none
+
+
+def test_selector_key_distinguishes_types():
+    assert _selector_key([1]) != _selector_key([True])
+    assert _selector_key(pl.col("x") > 1) == _selector_key(pl.col("x") > 1)
+
+
 def test_resolve_rows_i_func_expr():
     gt = GT(pd.DataFrame({"x": ["a", "b", "c"]}), rowname_col="x")
     assert resolve_rows_i(gt, lambda D: D["x"].isin(["a", "b"])) == [("a", 0), ("b", 1)]
@@ -281,10 +323,10 @@ def test_set_style_loc_body_from_column(expr):
     assert len(new_gt._styles) == 1
     cell_info = new_gt._styles[0]
 
-    # style info has single cell style, with new color
+    # style info has single cell style, with the css for the selected row
     assert len(cell_info.styles) == 1
-    assert isinstance(cell_info.styles[0], CellStyleText)
-    assert cell_info.styles[0].color == "blue"
+    assert isinstance(cell_info.styles[0], CellStyleFromData)
+    assert cell_info.styles[0].css == [None, "color: blue;"]
 
 
 def test_set_style_loc_title_from_column_error(snapshot):
@@ -58,8 +58,8 @@ def test_with_groupname_col_undo_spanner_style():
     )
 
     assert gt._spanners[0].vars == SPAN_COLS
-    assert len(gt._styles) == 2
-    assert {style.colname for style in gt._styles} == set(STYLE_COLS)
+    assert len(gt._styles) == 1
+    assert gt._styles[0].cells.cols == STYLE_COLS
 
     new_gt = gt.tab_stub(groupname_col="g")
 
@@ -69,7 +69,7 @@ def test_with_groupname_col_undo_spanner_style():
 
     # grouping col dropped from body styles
     assert len(new_gt._styles) == 1
-    assert new_gt._styles[0].colname == "y"
+    assert new_gt._styles[0].cells.cols == ["y"]
 
 
 def test_with_groupname_col_unset():
@@ -113,8 +113,8 @@ def test_with_rowname_col_undo_spanner_style():
     )
 
     assert gt._spanners[0].vars == SPAN_COLS
-    assert len(gt._styles) == 2
-    assert {style.colname for style in gt._styles} == set(STYLE_COLS)
+    assert len(gt._styles) == 1
+    assert gt._styles[0].cells.cols == STYLE_COLS
 
     new_gt = gt.tab_stub(rowname_col="g")
 
@@ -123,7 +123,8 @@ def test_with_rowname_col_undo_spanner_style():
     assert new_gt._spanners[0].vars == ["x"]
 
     # rowname col *kept* in body styles
-    assert len(new_gt._styles) == 2
+    assert len(new_gt._styles) == 1
+    assert new_gt._styles[0].cells.cols == STYLE_COLS
 
 
 def test_with_rowname_col_unset():
@@ -0,0 +1,162 @@
+import json
+
+import pytest
+
+from great_tables import GT, exibble, profile_memory, profile_render
+from great_tables._profile import ProfileSpan, profiling, span
+
+
+def _gt() -> GT:
+    return (
+        GT(exibble, rowname_col="row")
+        .fmt_number(columns="num")
+        .fmt_currency(columns="currency", rows=[0, 1])
+        .cols_merge(["char", "fctr"])
+    )
+
+
+def test_profile_render_records_phases():
+    with profile_render() as profile:
+        _gt().as_raw_html()
+
+    phases = {phase.path: phase for phase in profile.phases()}
+
+    for path in [
+        "build_data",
+        "build_data/render_formats",
+        "build_data/render_formats/format",
+        "build_data/col_merge",
+        "heading",
+        "column_labels",
+        "body",
+        "footer",
+        "compile_scss",
+    ]:
+        assert path in phases
+
+    assert phases["build_data/render_formats"].cells == len(exibble) + 2
+    assert phases["build_data/col_merge"].cells == len(exibble)
+    assert phases["build_data/render_formats/format"].calls == 2
+    assert phases["body"].cells == len(exibble) * 8
+
+
+def test_profile_render_formats():
+    with profile_render() as profile:
+        _gt().as_raw_html()
+
+    formats = profile.formats()
+
+    assert [(span.attributes["method"], span.cells) for span in formats] == [
+        ("fmt_number", len(exibble)),
+        ("fmt_currency", 2),
+    ]
+
+
+def test_profile_render_latex():
+    with profile_render() as profile:
+        _gt().as_latex()
+
+    paths = [phase.path for phase in profile.phases()]
+
+    assert "build_data/migrate_unformatted" in paths
+    assert "render_latex" in paths
+
+
+def test_profile_render_hooks():
+    spans: list[ProfileSpan] = []
+
+    with profile_render(hooks=[spans.append]) as profile:
+        _gt().as_raw_html()
+
+    assert spans == profile.spans
+    assert all(span.duration_ns >= 0 for span in spans)
+
+
+def test_profile_render_to_dict_is_json_compatible():
+    with profile_render() as profile:
+        _gt().as_raw_html()
+
+    res = json.loads(json.dumps(profile.to_dict()))
+
+    assert res["formats"][0]["method"] == "fmt_number"
+    assert res["phases"][0]["path"] == "build_data"
+
+
+def test_profile_render_inactive_outside_context():
+    with profile_render() as profile:
+        assert profiling()
+
+    assert not profiling()
+
+    _gt().as_raw_html()
+    assert len(profile.spans) == 0
+
+
+def test_span_nesting():
+    with profile_render() as profile:
+        with span("outer"):
+            with span("inner", cells=3, note="x"):
+                pass
+
+    inner, outer = profile.spans
+
+    assert (inner.path, inner.cells, inner.attributes) == ("outer/inner", 3, {"note": "x"})
+    assert outer.path == "outer"
+
+
+def test_profile_render_memory():
+    with profile_render(memory=True) as profile:
+        _gt().as_raw_html()
+
+    phases = {phase.path: phase for phase in profile.phases()}
+
+    assert profile.memory
+    assert phases["body"].peak_bytes > 0
+    assert all(span.peak_bytes is not None for span in profile.spans)
+    assert profile.peak_bytes >= max(phase.peak_bytes for phase in phases.values())
+    assert "peak MiB" in repr(profile)
+
+
+def test_profile_render_memory_stops_tracing():
+    import tracemalloc
+
+    with profile_render(memory=True):
+        assert tracemalloc.is_tracing()
+
+    assert not tracemalloc.is_tracing()
+
+
+def test_profile_render_without_memory():
+    with profile_render() as profile:
+        _gt().as_raw_html()
+
+    assert profile.peak_bytes is None
+    assert all(span.peak_bytes is None for span in profile.spans)
+    assert "peak_bytes" not in profile.to_dict()
+
+
+def test_profile_memory():
+    profile = profile_memory(_gt(), output="latex")
+    res = profile.to_dict()
+
+    # the rendered output is still allocated when profiling ends
+    assert profile.retained_bytes >= len(_gt().as_latex())
+    assert res["peak_bytes"] == profile.peak_bytes
+    assert res["formats"][0]["peak_bytes"] is not None
+
+
+def test_profile_memory_invalid_output():
+    with pytest.raises(ValueError, match="output"):
+        profile_memory(_gt(), output="rtf")
+
+
+def test_profile_render_formats_skips_hidden_columns():
+    gt = _gt().fmt_number(columns="num").cols_hide(["num", "date"])
+
+    with profile_render() as profile:
+        gt.as_raw_html()
+
+    [render_formats] = [span for span in profile.spans if span.name == "render_formats"]
+
+    assert render_formats.cells == 2
+    assert render_formats.attributes["skipped_columns"] == 2
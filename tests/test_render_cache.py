@@ -0,0 +1,193 @@
+import gzip
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pandas as pd
+import polars as pl
+import pytest
+
+from great_tables import GT, RenderCache, exibble
+from great_tables._tbl_data import frame_digest
+
+
+def add_brackets(x) -> str:
+    return f"[{x}]"
+
+
+@pytest.fixture
+def gt() -> GT:
+    return GT(exibble, id="test").fmt_number(columns="num", decimals=1)
+
+
+def test_render_cache_hit_returns_stored_html(tmp_path, gt: GT):
+    events = []
+    cache = RenderCache(tmp_path, on_event=lambda event, key: events.append(event))
+
+    first = gt.as_raw_html(cache=cache)
+    second = gt.as_raw_html(cache=cache)
+
+    assert first == second == gt.as_raw_html()
+    assert events == ["miss", "store", "hit"]
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.stores) == (1, 1, 1)
+    assert len(list(tmp_path.glob("*.html"))) == 1
+
+
+def test_render_cache_persists_across_instances(tmp_path, gt: GT):
+    gt.as_raw_html(cache=RenderCache(tmp_path))
+
+    cache = RenderCache(tmp_path)
+    gt.as_raw_html(cache=cache)
+
+    assert cache.stats.hits == 1
+
+
+def test_render_cache_key_changes(tmp_path, gt: GT):
+    cache = RenderCache(tmp_path)
+    key = cache.key(gt, "html")
+
+    assert cache.key(gt, "html") == key
+    assert cache.key(gt.fmt_number(columns="num", decimals=2), "html") != key
+    assert cache.key(gt, "html", make_page=True) != key
+    assert cache.key(gt, "latex") != key
+
+    data = exibble.copy()
+    data.loc[0, "num"] = 42
+    assert cache.key(GT(data, id="test").fmt_number(columns="num", decimals=1), "html") != key
+
+
+def test_render_cache_with_compression(tmp_path, gt: GT):
+    cache = RenderCache(tmp_path)
+    gt.as_raw_html(cache=cache)
+
+    res = gt.as_raw_html(cache=cache, compression="gzip")
+
+    assert gzip.decompress(res).decode("utf-8") == gt.as_raw_html()
+    assert cache.stats.hits == 1
+
+
+def test_render_cache_latex(tmp_path):
+    gt = GT(exibble[["num", "char"]]).fmt_number(columns="num")
+    cache = RenderCache(tmp_path)
+
+    assert gt.as_latex(cache=cache) == gt.as_latex(cache=cache) == gt.as_latex()
+    assert cache.stats.hits == 1
+    assert len(list(tmp_path.glob("*.tex"))) == 1
+
+
+def test_render_cache_callables(tmp_path):
+    by_name = RenderCache(tmp_path / "by_name")
+    bypass = RenderCache(tmp_path / "bypass", callables="bypass")
+
+    named = GT(exibble).fmt(add_brackets, columns="char")
+    unnamed = GT(exibble).fmt(lambda x: f"[{x}]", columns="char")
+
+    assert by_name.key(named, "html") is not None
+    assert by_name.key(unnamed, "html") is None
+    assert bypass.key(named, "html") is None
+
+    unnamed.as_raw_html(cache=by_name)
+    assert by_name.stats.bypasses == 1
+    assert list((tmp_path / "by_name").iterdir()) == []
+
+
+def test_render_cache_evicts_least_recently_used(tmp_path):
+    cache = RenderCache(tmp_path, max_size=1000)
+
+    cache.put("a", "html", "x" * 400)
+    cache.put("b", "html", "x" * 400)
+    cache.get("a", "html")
+    cache.put("c", "html", "x" * 400)
+
+    assert sorted(p.stem for p in tmp_path.iterdir()) == ["a", "c"]
+    assert cache.stats.evictions == 1
+    assert cache.size() == 800
+
+
+def test_render_cache_skips_entries_over_max_size(tmp_path):
+    cache = RenderCache(tmp_path, max_size=10)
+    cache.put("a", "html", "x" * 11)
+
+    assert cache.get("a", "html") is None
+
+
+def test_render_cache_put_removes_temporary_file_on_failure(tmp_path, monkeypatch):
+    cache = RenderCache(tmp_path)
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("great_tables._render_cache.os.replace", fail_replace)
+
+    with pytest.raises(OSError):
+        cache.put("a", "html", "x")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_render_cache_put_from_threads(tmp_path):
+    cache = RenderCache(tmp_path)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda i: cache.put("a", "html", f"x{i % 2}"), range(20)))
+
+    assert cache.get("a", "html") in ("x0", "x1")
+    assert [p.name for p in tmp_path.iterdir()] == ["a.html"]
+
+
+def test_render_cache_clear(tmp_path, gt: GT):
+    cache = RenderCache(tmp_path)
+    gt.as_raw_html(cache=cache)
+
+    cache.clear()
+
+    assert cache.size() == 0
+
+
+def test_render_cache_invalid_callables(tmp_path):
+    with pytest.raises(ValueError, match="callables"):
+        RenderCache(tmp_path, callables="ignore")
+
+
+@pytest.mark.parametrize(
+    "make_frame", [lambda d: d, pl.from_pandas, lambda d: pl.from_pandas(d).to_arrow()]
+)
+def test_frame_digest(make_frame):
+    df = pd.DataFrame({"x": [1, 2], "y": ["a", None]})
+    other = pd.DataFrame({"x": [1, 3], "y": ["a", None]})
+
+    assert frame_digest(make_frame(df)) == frame_digest(make_frame(df.copy()))
+    assert frame_digest(make_frame(df)) != frame_digest(make_frame(other))
+    assert frame_digest(make_frame(df)) != frame_digest(make_frame(df.rename(columns={"x": "z"})))
+
+
+@pytest.mark.parametrize(
+    "values, other",
+    [
+        ([1.5, 2], ["1.5", "2"]),
+        ([1, 2], ["1", "2"]),
+        ([date(2020, 1, 1)], ["2020-01-01"]),
+    ],
+)
+def test_frame_digest_pandas_object_value_types(values, other):
+    df = pd.DataFrame({"x": pd.Series(values, dtype=object)})
+    df_other = pd.DataFrame({"x": pd.Series(other, dtype=object)})
+
+    assert frame_digest(df) != frame_digest(df_other)
+
+
+def test_render_cache_pandas_object_value_types(tmp_path):
+    cache = RenderCache(tmp_path)
+    df_float = pd.DataFrame({"x": pd.Series([1.5, 2], dtype=object)})
+    df_str = pd.DataFrame({"x": pd.Series(["1.5", "2"], dtype=object)})
+
+    GT(df_float, id="t").fmt_number("x", decimals=2).as_raw_html(cache=cache)
+
+    with pytest.raises(TypeError):
+        GT(df_str, id="t").fmt_number("x", decimals=2).as_raw_html(cache=cache)
+
+
+def test_render_cache_bypasses_unpicklable_data(tmp_path):
+    cache = RenderCache(tmp_path)
+    df = pd.DataFrame({"x": pd.Series([lambda: 1], dtype=object)})
+
+    assert cache.key(GT(df), "html") is None
@@ -1,8 +1,18 @@
+import re
+
 import pytest
 import pandas as pd
 
 from great_tables import GT
-from great_tables._scss import font_color, css_add, compile_scss
+from great_tables._scss import (
+    CssCompound,
+    font_color,
+    css_add,
+    compile_rules,
+    compile_scss,
+    _parse_selector,
+    _selector_is_used,
+)
 
 
 @pytest.mark.parametrize(
@@ -53,3 +63,96 @@ def test_scss_default_generated(snapshot):
     gt = GT(pd.DataFrame({"x": [1, 2, 3]}))
 
     assert snapshot == compile_scss(gt, id="abc", compress=False)
+
+
+@pytest.mark.parametrize(
+    "selector,res",
+    [
+        (".gt_row", True),
+        (".gt_stub", False),
+        (".gt_row_group_first td", False),
+        (".gt_column_spanner_outer:first-child", False),
+        (".gt_from_md> :first-child", True),
+        ("tr", True),
+        ("tfoot", False),
+    ],
+)
+def test_selector_is_used(selector: str, res: bool):
+    assert _selector_is_used(selector, {"td", "tr", ".gt_row", ".gt_from_md"}) is res
+
+
+def test_scss_pruned_keeps_only_used_rules():
+    gt = GT(pd.DataFrame({"x": [1, 2, 3]})).tab_options(table_additional_css=[".extra { x: y; }"])
+
+    css = compile_scss(gt, id="abc", compress=False, used={"table", "tr", "td", ".gt_row"})
+
+    assert "#abc table {" in css
+    assert "#abc thead,\ntbody,\ntfoot,\ntr,\ntd,\nth {" in css
+    assert "#abc .gt_row {" in css
+    assert ".extra { x: y; }" in css
+    assert ".gt_stub" not in css
+    assert ".gt_footnote" not in css
+    assert "#abc p {" not in css
+
+
+def test_scss_pruned_with_all_used_is_unchanged():
+    gt = GT(pd.DataFrame({"x": [1, 2, 3]}))
+
+    css = compile_scss(gt, id="abc")
+    used = set(re.findall(r"\.gt_\w+", css)) | {
+        "table",
+        "thead",
+        "tbody",
+        "tfoot",
+        "tr",
+        "td",
+        "th",
+        "p",
+    }
+
+    assert compile_scss(gt, id="abc", used=used) == css
+
+
+@pytest.mark.parametrize(
+    "selector,res",
+    [
+        (".gt_row", ((CssCompound(None, frozenset({"gt_row"})),), ())),
+        (
+            "#abc tr > td.gt_row:first-child",
+            (
+                (
+                    CssCompound("td", frozenset({"gt_row"}), "first-child"),
+                    CssCompound("tr", frozenset()),
+                    CssCompound(None, frozenset(), is_container=True),
+                ),
+                (">", " "),
+            ),
+        ),
+        ("#other .gt_row", None),
+        ("td #abc", None),
+        ("#abc", None),
+        ("a:hover", None),
+        ("td[colspan]", None),
+        ("td + td", None),
+    ],
+)
+def test_parse_selector(selector: str, res):
+    assert _parse_selector(selector, id="abc") == res
+
+
+def test_compile_rules():
+    gt = GT(pd.DataFrame({"x": [1]})).tab_options(
+        table_additional_css=[
+            "@import url('x.css');",
+            "@media print { .gt_row { color: red; } }",
+            ".gt_row, td:last-child { color: blue !important; }",
+        ]
+    )
+
+    rules = compile_rules(gt, id="abc")
+    extra = [rule for rule in rules if ("color", "blue", True) in rule.declarations]
+
+    assert [rule.specificity for rule in extra] == [(0, 1, 0), (0, 1, 1)]
+    assert extra[0].order < extra[1].order
+    assert not any(("color", "red", False) in rule.declarations for rule in rules)
+    assert all(not rule.compounds[0].is_container for rule in rules)
@@ -0,0 +1,151 @@
+import json
+
+import pandas as pd
+import polars as pl
+import pytest
+
+from great_tables import GT, exibble, google_font, loc, md, style
+from great_tables._formats import FORMATTER_METHODS
+from great_tables._gt_data import FormatterCall
+
+
+def _roundtrip(gt: GT, data=None) -> GT:
+    spec = json.loads(json.dumps(gt.to_dict()))
+    return GT.from_dict(spec, gt._tbl_data if data is None else data)
+
+
+def _assert_same_html(gt: GT, data=None):
+    new_gt = _roundtrip(gt, data)
+    assert new_gt.with_id("test").as_raw_html() == gt.with_id("test").as_raw_html()
+
+
+def add_brackets(x) -> str:
+    return f"[{x}]"
+
+
+def test_roundtrip_full_table():
+    gt = (
+        GT(exibble, rowname_col="row", groupname_col="group")
+        .fmt_number(columns="num", decimals=1)
+        .fmt_currency(columns="currency", rows=[0, 2], currency="EUR")
+        .fmt_date(columns="date", date_style="wday_month_day_year")
+        .fmt_units(columns="char")
+        .sub_missing(missing_text="--")
+        .data_color(columns="num", palette=["white", "green"])
+        .tab_style(style.text(weight="bold"), loc.column_labels())
+        .tab_footnote(md("**note**"), loc.stub())
+        .tab_spanner("Numbers", columns=["num", "currency"])
+        .tab_header(title="Title", subtitle=md("*sub*"))
+        .tab_stubhead("Row")
+        .tab_source_note("Source")
+        .cols_move_to_start("currency")
+        .cols_hide("fctr")
+        .cols_merge(["time", "datetime"])
+        .cols_label(num="Number")
+        .row_group_order(["grp_b", "grp_a"])
+        .opt_table_font(font=google_font("Roboto"))
+        .tab_options(table_width="600px")
+        .opt_row_striping()
+    )
+
+    _assert_same_html(gt)
+
+
+def test_roundtrip_polars_expressions_and_summary_rows():
+    df = pl.from_pandas(exibble)
+    gt = (
+        GT(df, groupname_col="group")
+        .fmt_number(columns="num", rows=pl.col("num") > 1)
+        .tab_style(style.fill("red"), loc.body(columns="char", rows=pl.col("num") > 1))
+        .grand_summary_rows(fns={"Min": pl.min("num")})
+    )
+
+    new_gt = _roundtrip(gt)
+
+    assert new_gt._formats[0].rows_expr.meta.eq(pl.col("num") > 1)
+    _assert_same_html(gt)
+
+
+def test_roundtrip_nanoplot():
+    gt = GT(pl.DataFrame({"x": ["1 2 3", "4 5"]})).fmt_nanoplot(columns="x")
+
+    _assert_same_html(gt)
+
+
+def test_roundtrip_named_function():
+    gt = GT(exibble).fmt(add_brackets, columns="char")
+
+    spec = gt.to_dict()
+
+    assert spec["formats"][0]["args"]["fns"] == {
+        "__type__": "callable",
+        "ref": "tests.test_serialize:add_brackets",
+    }
+    _assert_same_html(gt)
+
+
+def test_roundtrip_keeps_styles_shared_for_freeze():
+    gt = GT(exibble).tab_style(style.fill("red"), loc.body(columns="num"))
+
+    spec = _roundtrip(gt).freeze()
+    (info,) = spec.with_data(exibble.head(2))._styles
+
+    assert info.cells.resolve() == [("num", 0), ("num", 1)]
+
+
+def test_to_dict_is_json_compatible():
+    gt = GT(exibble).fmt_number(columns="num").tab_style(style.fill("red"), loc.body())
+    spec = gt.to_dict()
+
+    assert json.loads(json.dumps(spec)) == spec
+
+
+def test_to_dict_stores_body_styles_compactly():
+    gt = GT(exibble).tab_style(style.fill("red"), loc.body(columns=["num", "char"]))
+
+    (entry,) = gt.to_dict()["styles"]
+
+    assert entry["cell_set"] == {"columns": ["num", "char"], "rows": None}
+
+
+def test_roundtrip_body_style_mask():
+    gt = GT(pl.from_pandas(exibble)).tab_style(
+        style.fill("red"), loc.body(mask=pl.selectors.numeric().gt(1))
+    )
+
+    (entry,) = gt.to_dict()["styles"]
+
+    assert entry["cell_set"]["masks"]["num"] == [1, 2, 3, 4, 6, 7]
+    _assert_same_html(gt)
+
+
+def test_to_dict_lambda_raises():
+    gt = GT(exibble).fmt(lambda x: x, columns="num")
+
+    with pytest.raises(TypeError, match="can't be serialized"):
+        gt.to_dict()
+
+
+def test_from_dict_mismatched_data_raises():
+    spec = GT(exibble).to_dict()
+
+    with pytest.raises(ValueError, match="don't match the columns"):
+        GT.from_dict(spec, exibble.drop(columns="num"))
+
+    with pytest.raises(ValueError, match="rows"):
+        GT.from_dict(spec, exibble.head(2))
+
+
+def test_from_dict_unknown_version_raises():
+    spec = {**GT(exibble).to_dict(), "spec_version": 0}
+
+    with pytest.raises(ValueError, match="Unsupported table spec version"):
+        GT.from_dict(spec, exibble)
+
+
+def test_formatter_methods_record_calls():
+    gt = GT(pd.DataFrame({"x": [1.0]})).fmt_number("x", decimals=3).sub_zero()
+
+    assert gt._formats[0].call == FormatterCall("fmt_number", {"columns": "x", "decimals": 3})
+    assert gt._substitutions[0].call == FormatterCall("sub_zero", {})
+    assert "fmt_nanoplot" in FORMATTER_METHODS
@@ -0,0 +1,122 @@
+import pandas as pd
+import polars as pl
+import pytest
+
+from great_tables import GT, GTSpec, exibble, from_column, loc, style
+from great_tables._locations import LocBody
+
+
+def _build(data):
+    return (
+        GT(data, rowname_col="row", groupname_col="group", id="test")
+        .fmt_number(columns="num", decimals=1)
+        .fmt_currency(columns="currency", rows=[0, 2])
+        .tab_style(style.fill("red"), loc.body(columns=["num", "char"]))
+        .tab_style(style.text(weight="bold"), loc.column_labels())
+        .tab_footnote("A note", loc.stub())
+        .tab_header(title="Title")
+        .cols_label(num="Number")
+    )
+
+
+@pytest.mark.parametrize("frame", [pd.DataFrame, pl.DataFrame])
+def test_with_data_matches_direct_build(frame):
+    df = exibble if frame is pd.DataFrame else pl.from_pandas(exibble)
+    new = df[::-1] if frame is pl.DataFrame else df.iloc[::-1].reset_index(drop=True)
+
+    spec = _build(df).freeze()
+
+    assert isinstance(spec, GTSpec)
+    assert spec.with_data(new).as_raw_html() == _build(new).as_raw_html()
+
+
+def test_with_data_expands_row_entries_to_new_length():
+    gt = _build(exibble).freeze().with_data(exibble.head(3))
+
+    body_styles = [info for info in gt._styles if isinstance(info.locname, LocBody)]
+    stub_notes = [info for info in gt._footnotes if info.rownum is not None]
+
+    (body_style,) = body_styles
+    assert body_style.cells.resolve() == [
+        ("num", 0),
+        ("num", 1),
+        ("num", 2),
+        ("char", 0),
+        ("char", 1),
+        ("char", 2),
+    ]
+    assert len(stub_notes) == 3
+
+
+def test_with_data_resolves_format_rows_again():
+    df = pl.DataFrame({"x": [1.0, 20.0, 3.0], "y": [1.0, 2.0, 3.0]})
+    spec = GT(df).fmt_number(columns="y", rows=pl.col("x") > 10).fmt_integer(columns="x").freeze()
+
+    gt = spec.with_data(pl.DataFrame({"x": [50.0, 2.0, 60.0, 1.0], "y": [1.0, 2.0, 3.0, 4.0]}))
+
+    assert gt._formats[0].cells.rows == [0, 2]
+    assert gt._formats[1].cells.rows == [0, 1, 2, 3]
+
+
+def test_with_data_keeps_reordered_groups():
+    df = pl.DataFrame({"g": ["a", "b", "c"], "x": [1, 2, 3]})
+    spec = GT(df, groupname_col="g").row_group_order(["c", "a", "b"]).freeze()
+
+    gt = spec.with_data(pl.DataFrame({"g": ["b", "a", "d"], "x": [1, 2, 3]}))
+
+    assert gt._stub.group_ids == ["a", "b", "d"]
+
+
+def test_with_data_groups_follow_new_data_by_default():
+    df = pl.DataFrame({"g": ["a", "b"], "x": [1, 2]})
+    spec = GT(df, groupname_col="g").freeze()
+
+    gt = spec.with_data(pl.DataFrame({"g": ["b", "a"], "x": [1, 2]}))
+
+    assert gt._stub.group_ids == ["b", "a"]
+
+
+def test_with_data_schema_mismatch_raises():
+    spec = GT(pl.DataFrame({"x": [1], "y": ["a"]})).freeze()
+
+    with pytest.raises(ValueError) as exc_info:
+        spec.with_data(pl.DataFrame({"x": ["1"], "z": ["a"]}))
+
+    msg = str(exc_info.value)
+    assert "Missing columns: ['y']" in msg
+    assert "Unexpected columns: ['z']" in msg
+    assert "x (Int64 -> String)" in msg
+
+
+def test_with_data_frame_type_mismatch_raises():
+    spec = GT(pl.DataFrame({"x": [1]})).freeze()
+
+    with pytest.raises(TypeError, match="created from a DataFrame"):
+        spec.with_data(pd.DataFrame({"x": [1]}))
+
+
+@pytest.mark.parametrize(
+    "gt, problem",
+    [
+        (GT(exibble).data_color(columns="num"), "select rows"),
+        (
+            GT(exibble).tab_style(style.fill(from_column("char")), loc.body(columns="num")),
+            "styles computed from the data",
+        ),
+        (GT(exibble).tab_style(style.fill("red"), loc.body(rows=[1])), "select rows"),
+        (GT(exibble).tab_footnote("note", loc.body(columns="num", rows=[0])), "select rows"),
+        (
+            GT(pl.DataFrame({"x": [1, 2]})).grand_summary_rows(fns={"Min": pl.min("x")}),
+            "summary rows",
+        ),
+        (
+            GT(pl.DataFrame({"x": ["1 2 3"]})).fmt_nanoplot(columns="x", autoscale=True),
+            "fmt_nanoplot()",
+        ),
+    ],
+)
+def test_freeze_data_dependent_raises(gt: GT, problem: str):
+    with pytest.raises(ValueError, match="can't be frozen") as exc_info:
+        gt.freeze()
+
+    assert problem in str(exc_info.value)
@@ -1,6 +1,14 @@
 import pandas as pd
 import polars as pl
-from great_tables._styles import CellStyleText, CellStyleBorders, FromColumn
+from great_tables import GT, loc
+from great_tables._styles import (
+    CellStyleBorders,
+    CellStyleFill,
+    CellStyleFromData,
+    CellStyleText,
+    FromColumn,
+    _styles_to_css,
+)
 from great_tables._helpers import GoogleFont
 
 
@@ -45,6 +53,38 @@ def test_cell_value_from_polars_expr():
     assert new_style.color == "RED"
 
 
+def test_css_by_row():
+    df = pd.DataFrame({"x": [1, 2, 3], "color": ["red", "blue", "red"]})
+
+    style = CellStyleText(color=FromColumn("color"), size=FromColumn("x", fn=lambda x: f"{x}px"))
+
+    assert style._css_by_row(df, [0, 2]) == [
+        "color: red;font-size: 1px;",
+        None,
+        "color: red;font-size: 3px;",
+    ]
+
+
+def test_css_by_row_renders_each_distinct_value_once(monkeypatch):
+    df = pd.DataFrame({"color": ["red", "blue", "red", "red"]})
+    rendered = []
+
+    to_html_style = CellStyleFill._to_html_style
+    monkeypatch.setattr(
+        CellStyleFill, "_to_html_style", lambda self: rendered.append(self) or to_html_style(self)
+    )
+
+    style = CellStyleFill(color=FromColumn("color"))
+
+    assert style._css_by_row(df, range(4)) == [
+        "background-color: red;",
+        "background-color: blue;",
+        "background-color: red;",
+        "background-color: red;",
+    ]
+    assert len(rendered) == 2
+
+
 def test_cell_style_borders_all():
     res = CellStyleBorders(sides=["all"], color="blue")._to_html_style()
     assert res.split(";") == [
@@ -98,3 +138,37 @@ def test_cell_style_text_multiple_properties_with_google_font():
     assert "font-size: 16px;" in res
     assert "font-weight: bold;" in res
     assert "text-align: center;" in res
+
+
+def test_cell_style_changes_are_rendered():
+    style = CellStyleFill(color="red")
+    gt = GT(pd.DataFrame({"x": [1]})).tab_style(style, loc.body())
+
+    assert "background-color: red;" in gt.as_raw_html()
+
+    style.color = "blue"
+
+    assert "background-color: blue;" in gt.as_raw_html()
+
+
+def test_styles_to_css():
+    fill = CellStyleFill(color="red")
+    from_data = CellStyleFromData(css=["color: blue;", None])
+
+    assert _styles_to_css([fill, from_data], 0) == "background-color: red; color: blue;"
+    assert _styles_to_css([fill, from_data], 1) == "background-color: red;"
+    assert _styles_to_css([]) == ""
+
+
+def test_styles_to_css_cache():
+    fill = CellStyleFill(color="red")
+    from_data = CellStyleFromData(css=["color: blue;", None])
+    cache: dict[tuple[int, ...], str] = {}
+
+    assert _styles_to_css([fill], cache=cache) == "background-color: red;"
+    assert cache == {(id(fill),): "background-color: red;"}
+
+    # combinations with styles that vary by row aren't stored
+    assert _styles_to_css([fill, from_data], 0, cache) == "background-color: red; color: blue;"
+    assert _styles_to_css([fill, from_data], 1, cache) == "background-color: red;"
+    assert len(cache) == 1
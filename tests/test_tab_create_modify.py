@@ -33,7 +33,8 @@ def test_tab_style_multiple_columns(gt: GT):
     style = CellStyleFill(color="blue")
     new_gt = tab_style(gt, style, LocBody(["x", "y"], [0]))
 
-    assert len(new_gt._styles) == 2
+    assert len(new_gt._styles) == 1
+    assert new_gt._styles[0].cells.resolve() == [("x", 0), ("y", 0)]
 
     assert len(new_gt._styles[0].styles) == 1
     assert new_gt._styles[0].styles[0] is style
@@ -84,22 +85,12 @@ def test_tab_style_loc_body_mask(gt2: GT):
     new_gt = tab_style(gt2, style, LocBody(mask=cs.numeric().gt(1.5)))
 
     assert len(gt2._styles) == 0
-    assert len(new_gt._styles) == 3
-
-    xy_0y, xy_1x, xy_1y = new_gt._styles
-
-    assert xy_0y.styles[0] is style
-    assert xy_1x.styles[0] is style
-    assert xy_1y.styles[0] is style
-
-    assert xy_0y.rownum == 0
-    assert xy_0y.colname == "y"
+    assert len(new_gt._styles) == 1
 
-    assert xy_1x.rownum == 1
-    assert xy_1x.colname == "x"
+    (info,) = new_gt._styles
 
-    assert xy_1y.rownum == 1
-    assert xy_1y.colname == "y"
+    assert info.styles[0] is style
+    assert sorted(info.cells.resolve(), key=lambda x: x[1]) == [("y", 0), ("x", 1), ("y", 1)]
 
 
 def test_tab_style_loc_body_raises(gt2: GT):
@@ -117,6 +108,15 @@ def test_tab_style_loc_body_raises(gt2: GT):
     assert err_msg in exc_info.value.args[0]
 
 
+def test_tab_style_loc_body_mask_with_nulls():
+    gt = GT(pl.DataFrame({"x": [1.0, None, 3.0], "y": ["a", "b", "c"]}))
+    new_gt = tab_style(gt, CellStyleFill(color="blue"), LocBody(mask=pl.col("x").gt(1.5)))
+
+    (info,) = new_gt._styles
+
+    assert info.cells.masks == {"x": bytes([0, 0, 1])}
+
+
 def test_tab_style_loc_body_mask_not_polars_expression_raises(gt2: GT):
     style = CellStyleFill(color="blue")
     mask = "fake expression"
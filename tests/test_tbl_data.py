@@ -8,12 +8,15 @@ import pytest
 
 from great_tables import GT
 from great_tables._tbl_data import (
+    ColumnValues,
     DataFrameLike,
     SeriesLike,
+    StringCells,
     _get_cell,
     _get_column_dtype,
     _set_cell,
     _validate_selector_list,
+    cast_column_to_string,
     cast_frame_to_string,
     copy_frame,
     create_empty_frame,
@@ -347,6 +350,75 @@ def test_cast_frame_to_string_polars_list_col():
     assert new_df["z"].dtype.is_(pl.String)
 
 
+@pytest.mark.parametrize(
+    "values, dtype",
+    [
+        ([[1, None], [], None], pl.List(pl.Int64)),
+        ([[True, None], [False], None], pl.List(pl.Boolean)),
+        ([["a", None], ["b"], None], pl.List(pl.String)),
+        ([[1, 2], [3, 4]], pl.Array(pl.Int32, 2)),
+        ([[0.1, 1e-7], [2.0, 3.0]], pl.Array(pl.Float64, 2)),
+    ],
+)
+def test_cast_frame_to_string_polars_lists(values, dtype):
+    ser = pl.Series("x", values, dtype=dtype)
+    expected = [None if x is None else str(x.to_list()) for x in ser]
+
+    assert cast_frame_to_string(ser.to_frame())["x"].to_list() == expected
+
+
+@pytest.mark.parametrize("unit", ["ns", "us", "ms"])
+def test_cast_frame_to_string_polars_durations(unit):
+    from datetime import timedelta
+
+    values = [
+        timedelta(0),
+        timedelta(days=1, hours=2, minutes=3, seconds=4, microseconds=5),
+        timedelta(days=2, milliseconds=1),
+        timedelta(days=-1, seconds=5),
+        timedelta(microseconds=-1000),
+        None,
+    ]
+    ser = pl.Series("x", values, dtype=pl.Duration(unit))
+
+    assert cast_frame_to_string(ser.to_frame())["x"].to_list() == [
+        None if x is None else str(x) for x in ser
+    ]
+
+
+def test_cast_column_to_string(df: DataFrameLike):
+    assert cast_column_to_string(df, "col1") == ["1", "2", "3"]
+    assert cast_column_to_string(df, "col2", [2, 0]) == ["c", "a"]
+
+
+def test_column_values(df: DataFrameLike):
+    values = ColumnValues(df)
+
+    assert values["col2"] == ["a", "b", "c"]
+    assert values.get(2, "col1") == _get_cell(df, 2, "col1")
+    assert values["col2"] is values["col2"]
+
+
+def test_column_values_pandas_scalars():
+    import numpy as np
+
+    df = pd.DataFrame({"x": np.array([0.1, 2.0], dtype="float32"), "y": pd.array([1, None])})
+    values = ColumnValues(df)
+
+    for col in ["x", "y"]:
+        assert [repr(x) for x in values[col]] == [repr(_get_cell(df, ii, col)) for ii in range(2)]
+
+
+def test_string_cells(df: DataFrameLike):
+    body = create_empty_frame(df)
+    body = _set_cell(body, 1, "col1", "x") or body
+    cells = StringCells(body, df)
+
+    assert [cells.get(ii, "col1") for ii in range(3)] == ["1", "x", "3"]
+    assert cells.get(2, "col2") == "c"
+    assert list(cells._columns) == ["col1", "col2"]
+
+
 def test_frame_rendering(df: DataFrameLike, snapshot):
     gt = GT(df).fmt_number(columns="col3", decimals=0).fmt_currency(columns="col1")
     assert create_body_component_h(gt._build_data("html")) == snapshot
@@ -15,6 +15,7 @@ from great_tables._utils import (
     _match_arg,
     _migrate_unformatted_to_output,
     OrderedSet,
+    PersistentList,
     _str_detect,
     _str_scalar_to_list,
     is_valid_http_schema,
@@ -127,6 +128,33 @@ def test_orderedSet():
     assert repr(o) == "OrderedSet([1, 2, 'x', 'y'])"
 
 
+def test_persistent_list():
+    a = PersistentList([1, 2])
+    b = a + [3]
+    c = a + (4, 5)
+
+    assert list(a) == [1, 2]
+    assert list(b) == [1, 2, 3]
+    assert list(c) == [1, 2, 4, 5]
+    assert b._parent is a
+    assert (len(c), c[-1], c[0], c[1:]) == (4, 5, 1, PersistentList([2, 4, 5]))
+    assert b == [1, 2, 3] and b == PersistentList([1, 2, 3]) and b != [1, 2]
+    assert [0] + b == PersistentList([0, 1, 2, 3])
+    assert b + [] is b
+    assert repr(b) == "PersistentList([1, 2, 3])"
+
+
+def test_persistent_list_long_chain():
+    import pickle
+
+    res = PersistentList()
+    for ii in range(10_000):
+        res = res + [ii]
+
+    assert list(res) == list(range(10_000))
+    assert list(pickle.loads(pickle.dumps(res))) == list(range(10_000))
+
+
 @pytest.mark.parametrize(
     "iterable, ordered_list",
     [
@@ -1,11 +1,21 @@
 import pandas as pd
 import polars as pl
 from great_tables import GT, exibble, html, loc, md, style
+from great_tables._scss import compile_rules
 from great_tables._utils_render_html import (
+    _TABLE,
+    _TBODY,
+    _cell_style_attr,
+    _collect_used_selectors,
+    _inline_styles,
+    _InlineStyles,
+    _style_attr,
+    _StyleClasses,
     create_body_component_h,
     create_columns_component_h,
     create_heading_component_h,
     create_source_notes_component_h,
+    iter_body_component_h,
 )
 
 small_exibble = exibble[["num", "char"]].head(3)
@@ -281,3 +291,80 @@ def test_table_id_used_in_headers(snapshot):
     ).with_id("test_id")
 
     assert_rendered_columns(snapshot, new_gt)
+
+
+def test_style_classes():
+    style_classes = _StyleClasses()
+
+    assert style_classes.get("color: red;") == "gt_s0"
+    assert style_classes.get("color: blue;") == "gt_s1"
+    assert style_classes.get("color: red;") == "gt_s0"
+    assert style_classes.interned == {"color: red;": "gt_s0", "color: blue;": "gt_s1"}
+
+
+def test_cell_style_attr():
+    classes = ["gt_row"]
+
+    assert _cell_style_attr("color: red;", classes, None) == ' style="color: red;"'
+    assert _cell_style_attr(None, classes, _StyleClasses()) == ""
+    assert classes == ["gt_row"]
+
+    assert _cell_style_attr("color: red;", classes, _StyleClasses()) == ""
+    assert classes == ["gt_row", "gt_s0"]
+
+
+def test_inline_styles_resolve():
+    gt = GT(pd.DataFrame({"x": [1]}), id="abc").tab_options(
+        table_additional_css=[
+            "#abc .gt_row { color: blue; }",
+            "#abc tr.a > td.gt_row:first-child { color: green; }",
+            "#abc tr.a td { padding: 1px !important; }",
+        ]
+    )
+    inline = _InlineStyles(compile_rules(gt, id="abc"))
+    row = (("tr", "a"), _TBODY, _TABLE)
+
+    def resolve(*args, **kwargs) -> dict[str, str]:
+        res = inline.resolve(*args, **kwargs)
+        return dict(decl.split(": ", 1) for decl in res.split(";") if decl)
+
+    assert resolve("td", "gt_row", ancestors=row)["color"] == "blue"
+    assert resolve("td", "gt_row", ancestors=row, first=True)["color"] == "green"
+    assert "padding" not in resolve("td", "gt_row", ancestors=(("tr", "b"), *row[1:]))
+
+    # The element's own declarations override the rules, unless a rule is important
+    styles = resolve("td", "gt_row", "color: red; padding: 0;", ancestors=row)
+    assert styles["color"] == "red"
+    assert styles["padding"] == "1px !important"
+
+
+def test_style_attr_inline_styles():
+    assert _style_attr("td", "gt_row", "color: red;") == ' style="color: red;"'
+    assert _style_attr("td", "gt_row") == ""
+
+    gt = GT(pd.DataFrame({"x": [1]}), id="abc").tab_options(
+        table_additional_css=["#abc .gt_row { font-family: 'A \"B\"'; }"]
+    )
+    token = _inline_styles.set(_InlineStyles(compile_rules(gt, id="abc")))
+    try:
+        attr = _style_attr("td", "gt_row", "color: red;", (("tr", ""), _TBODY, _TABLE))
+    finally:
+        _inline_styles.reset(token)
+
+    assert "color: red;" in attr
+    assert "&quot;B&quot;" in attr
+
+
+def test_collect_used_selectors():
+    html_str = '<table class="gt_table"><tr class="a  b"><td class=\'c\'>x > y</td></tr></table>'
+
+    assert _collect_used_selectors(html_str) == {"table", "tr", "td", ".gt_table", ".a", ".b", ".c"}
+
+
+def test_iter_body_component_h():
+    gt = GT(exibble, rowname_col="row", groupname_col="group").grand_summary_rows(
+        fns={"Max": lambda df: df.max(numeric_only=True)}
+    )
+    built = gt._build_data("html")
+
+    assert "".join(iter_body_component_h(built)) == create_body_component_h(built)